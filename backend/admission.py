@@ -0,0 +1,205 @@
+"""
+입장 제어 (동시 실행 수와 비용 예산)
+python-pptx 덱 생성은 덱 전체 객체 그래프를 메모리에 들고 있으므로, 큰 덱 여러 개를 동시에 만들면
+작은 인스턴스(512MB)가 메모리 부족으로 죽을 수 있음
+→ 덱 생성은 동시 실행 수와 추정 비용 합계에 상한을 두고, 넘으면 대기열에서 기다리거나 바로 거절
+
+- 비용: 슬라이드 수 × RENDER_SLIDE_COST + 글자 수 (객체 그래프 크기는 도형 수와 텍스트 양에 비례)
+- 대기열이 차면 429, 대기 시간이 지나면 503 (Retry-After 포함), 요청 하나의 비용이 상한을 넘으면 413
+- 조회 API(본문/찬송가/검색 등)는 별도의 더 큰 한도를 사용하므로 덱 생성이 몰려도 막히지 않음
+"""
+import os
+import time
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional, Tuple
+
+from .instrumentation import get_logger
+
+logger = get_logger("Admission")
+
+# 덱 생성 동시 실행 수, 대기열 길이, 최대 대기 시간 (초)
+RENDER_CONCURRENCY = int(os.getenv("RENDER_CONCURRENCY", "2"))
+RENDER_QUEUE = int(os.getenv("RENDER_QUEUE", "8"))
+RENDER_QUEUE_TIMEOUT = float(os.getenv("RENDER_QUEUE_TIMEOUT", "20"))
+# 동시에 생성 중인 덱의 추정 비용 합계 상한 (글자 단위)
+RENDER_COST_BUDGET = int(os.getenv("RENDER_COST_BUDGET", "1500000"))
+# 요청 하나의 추정 비용 상한 (기본: 전체 예산)
+RENDER_MAX_REQUEST_COST = int(os.getenv("RENDER_MAX_REQUEST_COST", str(RENDER_COST_BUDGET)))
+# 슬라이드 하나의 고정 비용 (글자 수로 환산)
+RENDER_SLIDE_COST = int(os.getenv("RENDER_SLIDE_COST", "1000"))
+
+# 조회 API 동시 실행 수, 대기열 길이, 최대 대기 시간 (초)
+LOOKUP_CONCURRENCY = int(os.getenv("LOOKUP_CONCURRENCY", "32"))
+LOOKUP_QUEUE = int(os.getenv("LOOKUP_QUEUE", "64"))
+LOOKUP_QUEUE_TIMEOUT = float(os.getenv("LOOKUP_QUEUE_TIMEOUT", "5"))
+
+
+class AdmissionRejected(Exception):
+    """입장 거절 (HTTP 상태 코드와 Retry-After 초)"""
+
+    def __init__(self, status_code: int, detail: str, retry_after: Optional[int] = None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Retry-After": str(self.retry_after)} if self.retry_after is not None else {}
+
+
+def estimate_render_cost(slides: int, characters: int) -> int:
+    """덱 생성 추정 비용 (글자 단위)"""
+    return slides * RENDER_SLIDE_COST + characters
+
+
+class AdmissionLimiter:
+    """
+    동시 실행 수 + 비용 예산 + 선입선출 대기열 (이벤트 루프 안에서만 사용)
+    대기열 맨 앞 요청이 들어갈 수 있을 때만 다음 요청을 들이므로 큰 요청도 밀려나지 않음
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_waiting: int, wait_timeout: float,
+                 cost_budget: Optional[int] = None, max_request_cost: Optional[int] = None):
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_waiting = max_waiting
+        self.wait_timeout = wait_timeout
+        self.cost_budget = cost_budget
+        self.max_request_cost = max_request_cost
+        self.running = 0
+        self.running_cost = 0
+        self._waiters: Deque[Tuple[int, asyncio.Future]] = deque()
+        # 실행 시간 이동 평균 (Retry-After 추정)
+        self._average_seconds = 1.0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def _fits(self, cost: int) -> bool:
+        if self.running >= self.max_concurrent:
+            return False
+        # 실행 중인 것이 없으면 예산과 관계없이 하나는 들임
+        return self.cost_budget is None or self.running == 0 or self.running_cost + cost <= self.cost_budget
+
+    def _admit(self, cost: int):
+        self.running += 1
+        self.running_cost += cost
+        self.admitted += 1
+
+    def retry_after(self) -> int:
+        """다시 시도할 때까지 기다릴 초 (앞에 있는 요청 수 × 평균 실행 시간 / 동시 실행 수)"""
+        ahead = len(self._waiters) + 1
+        return max(1, round(ahead * self._average_seconds / self.max_concurrent))
+
+    async def acquire(self, cost: int = 1, block: bool = False):
+        """
+        실행 자리 얻기 (들어갈 수 없으면 대기열에서 기다림)
+
+        Args:
+            block: True면 대기열 길이와 대기 시간 제한 없이 기다림 (백그라운드 작업용)
+
+        Raises:
+            AdmissionRejected: 비용 상한 초과(413), 대기열 가득(429), 대기 시간 초과(503)
+        """
+        if self.max_request_cost is not None and cost > self.max_request_cost:
+            self.rejected += 1
+            raise AdmissionRejected(413, f"Request is too large (estimated cost {cost} > {self.max_request_cost})")
+        if not self._waiters and self._fits(cost):
+            self._admit(cost)
+            return
+        if not block and len(self._waiters) >= self.max_waiting:
+            self.rejected += 1
+            raise AdmissionRejected(429, f"Too many {self.name} requests, try again later", self.retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (cost, future)
+        self._waiters.append(entry)
+        self.queued += 1
+        try:
+            await asyncio.wait_for(future, None if block else self.wait_timeout)
+        except asyncio.TimeoutError:
+            self._remove(entry)
+            self.timed_out += 1
+            raise AdmissionRejected(503, f"{self.name} is busy, try again later", self.retry_after())
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # 자리를 얻은 직후 취소됨
+                self.release(cost)
+            else:
+                self._remove(entry)
+            raise
+
+    def release(self, cost: int = 1, seconds: Optional[float] = None):
+        """실행 자리 반납 (seconds: 실행 시간, Retry-After 추정에 반영)"""
+        self.running -= 1
+        self.running_cost -= cost
+        if seconds is not None:
+            self._average_seconds = 0.8 * self._average_seconds + 0.2 * seconds
+        self._wake()
+
+    def _remove(self, entry):
+        try:
+            self._waiters.remove(entry)
+        except ValueError:
+            pass
+        self._wake()
+
+    def _wake(self):
+        """대기열 앞에서부터 들어갈 수 있는 요청 들이기"""
+        while self._waiters:
+            cost, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if not self._fits(cost):
+                break
+            self._waiters.popleft()
+            self._admit(cost)
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, cost: int = 1, block: bool = False):
+        """async with limiter.slot(cost): ... (acquire/release)"""
+        await self.acquire(cost, block)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(cost, time.perf_counter() - started)
+
+    def stats(self) -> Dict:
+        return {
+            "running": self.running,
+            "max_concurrent": self.max_concurrent,
+            "running_cost": self.running_cost,
+            "cost_budget": self.cost_budget,
+            "waiting": len(self._waiters),
+            "max_waiting": self.max_waiting,
+            "average_seconds": round(self._average_seconds, 3),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+        }
+
+
+# 전역 인스턴스 (이벤트 루프 안에서만 사용하므로 락 없음)
+_render_limiter = AdmissionLimiter(
+    "render", RENDER_CONCURRENCY, RENDER_QUEUE, RENDER_QUEUE_TIMEOUT,
+    cost_budget=RENDER_COST_BUDGET, max_request_cost=RENDER_MAX_REQUEST_COST
+)
+_lookup_limiter = AdmissionLimiter("lookup", LOOKUP_CONCURRENCY, LOOKUP_QUEUE, LOOKUP_QUEUE_TIMEOUT)
+
+
+def get_render_limiter() -> AdmissionLimiter:
+    """덱 생성 입장 제어"""
+    return _render_limiter
+
+
+def get_lookup_limiter() -> AdmissionLimiter:
+    """조회 API 입장 제어"""
+    return _lookup_limiter
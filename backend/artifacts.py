@@ -0,0 +1,206 @@
+"""
+덱 출력 버퍼와 디스크 산출물 정리
+- 덱은 메모리 버퍼에 쓰다가 크기가 DECK_SPOOL_BYTES를 넘는 순간 산출물 파일로 옮겨 이어 씀
+  (큰 덱도 메모리에는 DECK_SPOOL_BYTES까지만)
+- 파일은 응답 후 바로 삭제하고, 남은 파일(연결 끊김, 서버 재시작 등)은 정리기가 TTL과 용량 상한으로 정리
+"""
+import io
+import os
+import time
+import shutil
+import asyncio
+import tempfile
+from typing import BinaryIO, Callable, Dict, NamedTuple, Optional
+
+from .instrumentation import get_logger
+from .executors import run_io
+
+logger = get_logger("Artifacts")
+
+# 이 크기 이하의 덱은 파일 없이 메모리에서 바로 응답 (바이트)
+DECK_SPOOL_BYTES = int(os.getenv("DECK_SPOOL_BYTES", str(16 * 1024 * 1024)))
+# 디스크 산출물 폴더
+ARTIFACT_DIR = os.getenv("DECK_ARTIFACT_DIR", os.path.join(tempfile.gettempdir(), "sermon-slides"))
+# 산출물 보관 시간 (초)
+ARTIFACT_TTL_SECONDS = int(os.getenv("ARTIFACT_TTL_SECONDS", "3600"))
+# 산출물 폴더 용량 상한 (바이트, 넘으면 오래된 파일부터 삭제)
+ARTIFACT_MAX_BYTES = int(os.getenv("ARTIFACT_MAX_BYTES", str(512 * 1024 * 1024)))
+# 정리 주기 (초)
+ARTIFACT_SWEEP_SECONDS = int(os.getenv("ARTIFACT_SWEEP_SECONDS", "300"))
+
+
+class DeckOutput(NamedTuple):
+    """저장된 덱 (작으면 data, 크면 산출물 파일 path, temporary면 응답 후 파일 삭제)"""
+    data: Optional[bytes]
+    path: Optional[str]
+    size: int
+    temporary: bool = False
+
+
+class SpoolWriter(io.RawIOBase):
+    """
+    메모리에 쓰다가 max_size를 넘으면 산출물 파일로 옮겨 이어 쓰는 쓰기 스트림 (seek 가능)
+    tempfile.SpooledTemporaryFile과 같지만 옮긴 파일에 경로가 있음 (응답/다른 프로세스에 경로로 넘김)
+    """
+
+    def __init__(self, max_size: int, suffix: str = ".pptx", directory: str = ARTIFACT_DIR):
+        self.max_size = max_size
+        self.suffix = suffix
+        self.directory = directory
+        self.path: Optional[str] = None
+        self._file = io.BytesIO()
+
+    @property
+    def rolled(self) -> bool:
+        return self.path is not None
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        written = self._file.write(data)
+        if not self.rolled and self._file.tell() > self.max_size:
+            self._rollover()
+        return written
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def flush(self):
+        self._file.flush()
+
+    def _rollover(self):
+        """지금까지 쓴 내용을 산출물 파일로 옮기고 이후 쓰기는 파일로"""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, path = tempfile.mkstemp(suffix=self.suffix, dir=self.directory)
+        try:
+            file = os.fdopen(fd, "w+b")
+            position = self._file.tell()
+            with self._file.getbuffer() as view:
+                file.write(view)
+            file.seek(position)
+        except BaseException:
+            remove_artifact(path)
+            raise
+        self._file.close()
+        self._file = file
+        self.path = path
+
+    def output(self) -> DeckOutput:
+        """쓰기를 끝내고 결과 반환 (옮기지 않았으면 bytes, 옮겼으면 산출물 파일 경로)"""
+        size = self._file.seek(0, io.SEEK_END)
+        if not self.rolled:
+            return DeckOutput(self._file.getvalue(), None, size)
+        self._file.close()
+        return DeckOutput(None, self.path, size, temporary=True)
+
+    def discard(self):
+        """쓰기 실패 시 정리 (옮긴 파일 삭제)"""
+        self._file.close()
+        if self.rolled:
+            remove_artifact(self.path)
+
+
+def spool_output(write: Callable[[BinaryIO], None], suffix: str = ".pptx") -> DeckOutput:
+    """
+    write(stream)으로 저장 (DECK_SPOOL_BYTES까지는 메모리, 넘으면 그 순간부터 산출물 파일)
+    (덱 생성 프로세스에서 실행해도 되도록 결과는 bytes 또는 파일 경로)
+    """
+    stream = SpoolWriter(DECK_SPOOL_BYTES, suffix)
+    try:
+        write(stream)
+    except BaseException:
+        stream.discard()
+        raise
+    return stream.output()
+
+
+def own_output(output: DeckOutput, suffix: str = ".pptx") -> DeckOutput:
+    """
+    덱을 호출한 쪽만 쓰는 임시 산출물 파일로 (오래 보관하는 결과를 메모리에 두지 않고,
+    캐시 파일이 정리되거나 다른 응답이 파일을 지워도 영향받지 않도록)
+    - bytes는 새 파일에 쓰고, 공유 파일(디스크 캐시, 여러 응답이 함께 쓰는 산출물)은 하드 링크(안 되면 복사)
+    - 이미 혼자 쓰는 임시 파일이면 그대로
+    """
+    if output.data is None and output.temporary:
+        return output
+
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=ARTIFACT_DIR)
+    try:
+        if output.data is not None:
+            with os.fdopen(fd, "wb") as f:
+                f.write(output.data)
+        else:
+            os.close(fd)
+            try:
+                os.remove(path)
+                os.link(output.path, path)
+            except OSError:
+                # 다른 파일 시스템이거나 하드 링크를 지원하지 않음
+                shutil.copyfile(output.path, path)
+    except BaseException:
+        remove_artifact(path)
+        raise
+    return DeckOutput(None, path, output.size, temporary=True)
+
+
+def remove_artifact(path: str):
+    """산출물 파일 삭제 (이미 없으면 무시)"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("⚠️ 산출물 삭제 실패: %s (%s)", path, e)
+
+
+def sweep_artifacts(now: float = None) -> Dict:
+    """
+    산출물 폴더 정리: TTL이 지난 파일을 지우고, 남은 용량이 상한을 넘으면 오래된 파일부터 삭제
+
+    Returns:
+        {"removed": 삭제한 파일 수, "freed_bytes": 확보한 바이트, "remaining_bytes": 남은 바이트}
+    """
+    now = time.time() if now is None else now
+    files = []
+    try:
+        with os.scandir(ARTIFACT_DIR) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+    except FileNotFoundError:
+        return {"removed": 0, "freed_bytes": 0, "remaining_bytes": 0}
+
+    files.sort()
+    removed = 0
+    freed = 0
+    remaining = sum(size for _, size, _ in files)
+    for mtime, size, path in files:
+        if now - mtime <= ARTIFACT_TTL_SECONDS and remaining <= ARTIFACT_MAX_BYTES:
+            break
+        remove_artifact(path)
+        removed += 1
+        freed += size
+        remaining -= size
+
+    if removed:
+        logger.info("🧹 산출물 %d개 삭제 (%d 바이트)", removed, freed)
+    return {"removed": removed, "freed_bytes": freed, "remaining_bytes": remaining}
+
+
+async def run_janitor(interval: int = ARTIFACT_SWEEP_SECONDS):
+    """주기적으로 산출물 폴더 정리 (서버 시작 시 백그라운드 작업으로 실행, 취소되면 종료)"""
+    while True:
+        try:
+            await run_io(sweep_artifacts)
+        except Exception as e:
+            logger.warning("⚠️ 산출물 정리 실패: %s", e)
+        await asyncio.sleep(interval)
@@ -0,0 +1,92 @@
+"""
+덱 생성 벤치마크: 직접 그리기(DirectRenderer) vs 원형 복제(PrototypeRenderer)
+두 방식의 슬라이드 XML이 같은지 확인한 뒤 덱 하나당 생성 시간을 비교
+
+실행: python -m backend.bench_render [--rounds 20] [--hymns 3]
+"""
+import time
+import argparse
+import statistics
+from lxml import etree
+
+from .main import (
+    PresentationRequest, WorshipOrder, ScriptureVerse, HymnRequest,
+    build_presentation
+)
+from .slide_renderer import DirectRenderer, PrototypeRenderer, get_prototype_cache
+
+SAMPLE_TEXT = (
+    "1 태초에 하나님이 천지를 창조하시니라 2 땅이 혼돈하고 공허하며 흑암이 깊음 위에 있고 "
+    "하나님의 영은 수면 위에 운행하시니라 3 하나님이 이르시되 빛이 있으라 하시니 빛이 있었고 "
+    "4 빛이 하나님이 보시기에 좋았더라 하나님이 빛과 어둠을 나누사 "
+    "5 하나님이 빛을 낮이라 부르시고 어둠을 밤이라 부르시니라 저녁이 되고 아침이 되니 이는 첫째 날이니라 "
+)
+
+
+def sample_request(hymns: int = 3) -> PresentationRequest:
+    """60장 안팎의 예배 덱 요청 (본문은 요청에 포함, 찬송가는 Reference 데이터가 있으면 가사 사용)"""
+    return PresentationRequest(
+        title="주일 예배",
+        date="2024년 1월 7일",
+        worship_orders=[
+            WorshipOrder(title=title, detail=detail)
+            for title, detail in [
+                ("묵도", None), ("찬송", "다 함께"), ("기도", "맡은 이"), ("성경봉독", None),
+                ("설교", "담임목사"), ("헌금", None), ("광고", None), ("축도", "담임목사")
+            ]
+        ],
+        scriptures=[
+            ScriptureVerse(reference="창1:1-5", text=SAMPLE_TEXT * 6, reference_position=position)
+            for position in ("top-left", "top-right", "bottom-left", "bottom-right")
+        ],
+        hymns=[HymnRequest(hymn_number=number) for number in (1, 8, 305, 405, 550)[:hymns]]
+    )
+
+
+def slide_xml(prs) -> list:
+    """슬라이드별 XML (비교용)"""
+    return [etree.tostring(slide._element) for slide in prs.slides]
+
+
+def measure(request: PresentationRequest, renderer_factory, rounds: int) -> list:
+    """덱 생성 시간 목록 (초)"""
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        build_presentation(request, renderer_factory)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="슬라이드 렌더러 벤치마크")
+    parser.add_argument("--rounds", type=int, default=20, help="방식별 반복 횟수")
+    parser.add_argument("--hymns", type=int, default=3, help="포함할 찬송가 수 (최대 5)")
+    args = parser.parse_args()
+
+    request = sample_request(args.hymns)
+
+    direct = build_presentation(request, DirectRenderer)
+    prototype = build_presentation(request, PrototypeRenderer)
+    if slide_xml(direct) != slide_xml(prototype):
+        raise SystemExit("❌ 두 렌더러의 슬라이드 XML이 다릅니다")
+    print(f"✅ 슬라이드 XML 일치 ({len(direct.slides)}장)")
+
+    get_prototype_cache().clear()
+    cold = measure(request, PrototypeRenderer, 1)[0]
+
+    results = {
+        "direct": measure(request, DirectRenderer, args.rounds),
+        "prototype": measure(request, PrototypeRenderer, args.rounds),
+    }
+    for name, timings in results.items():
+        print(f"{name:>10}: 중앙값 {statistics.median(timings) * 1000:7.1f}ms, "
+              f"최소 {min(timings) * 1000:7.1f}ms ({args.rounds}회)")
+    print(f"{'prototype':>10}: 원형 캐시가 빈 상태 {cold * 1000:7.1f}ms")
+
+    speedup = statistics.median(results["direct"]) / statistics.median(results["prototype"])
+    print(f"원형 복제가 {speedup:.2f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,426 @@
+"""
+성경 책 이름 통합 해석기
+모든 지원 언어(한국어, 영어, 독일어)의 책 이름/약어를 정규 책 번호(1-66)로 변환
+
+- 언어는 입력 문자(한글/라틴 문자, 독일어 움라우트)로 자동 감지하고, 언어 힌트가 있으면 우선 사용
+- 해석 결과는 메모이즈 (같은 이름은 한 번만 해석)
+- 오타("요한북음", "Jhn", "Johanes")는 미리 만든 트라이(접두어)와 삭제 이웃 색인(편집 거리)으로 교정,
+  한글은 자모 단위로 분해해서 비교 (북↔복은 한 글자가 아니라 모음 하나 차이)
+- 로더와 인덱스는 책 이름 문자열 대신 책 번호를 키로 사용
+"""
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+KOREAN = "korean"
+ENGLISH = "english"
+GERMAN = "german"
+LANGUAGES = (KOREAN, ENGLISH, GERMAN)
+
+# 오타 교정 결과를 받아들이는 최소 신뢰도 (0-1)
+FUZZY_MIN_CONFIDENCE = float(os.getenv("FUZZY_MIN_CONFIDENCE", "0.6"))
+# 접두어로 찾을 때 필요한 최소 길이 (자모/글자 수)
+FUZZY_MIN_PREFIX = 4
+# 편집 거리 1, 2를 허용하는 최소 길이 (한글은 음절 수, 그 밖은 글자 수)
+FUZZY_HANGUL_LENGTHS = (2, 4)
+FUZZY_LATIN_LENGTHS = (5, 8)
+
+# 언어 힌트 표기 → 언어
+LANGUAGE_ALIASES = {
+    "korean": KOREAN, "ko": KOREAN, "kr": KOREAN, "한국어": KOREAN,
+    "english": ENGLISH, "en": ENGLISH, "영어": ENGLISH,
+    "german": GERMAN, "de": GERMAN, "deutsch": GERMAN, "독일어": GERMAN,
+}
+
+
+class Book(NamedTuple):
+    """책 하나의 언어별 이름과 별칭 (이름 자체도 별칭으로 등록됨)"""
+    number: int
+    korean: str
+    korean_abbrev: str
+    english: str
+    german: str
+    korean_aliases: Tuple[str, ...] = ()
+    english_aliases: Tuple[str, ...] = ()
+    german_aliases: Tuple[str, ...] = ()
+
+
+BOOKS: Tuple[Book, ...] = (
+    # 구약
+    Book(1, "창세기", "창", "Genesis", "1. Mose", (), ("gen", "gn"), ("1mo", "gen", "genesis")),
+    Book(2, "출애굽기", "출", "Exodus", "2. Mose", (), ("ex", "exod"), ("2mo", "ex", "exodus")),
+    Book(3, "레위기", "레", "Leviticus", "3. Mose", (), ("lev",), ("3mo", "lev", "levitikus")),
+    Book(4, "민수기", "민", "Numbers", "4. Mose", (), ("num",), ("4mo", "num", "numeri")),
+    Book(5, "신명기", "신", "Deuteronomy", "5. Mose", (), ("deut", "dt"), ("5mo", "dtn", "deuteronomium")),
+    Book(6, "여호수아", "수", "Joshua", "Josua", (), ("josh",), ("jos",)),
+    Book(7, "사사기", "삿", "Judges", "Richter", (), ("judg",), ("ri",)),
+    Book(8, "룻기", "룻", "Ruth", "Rut", (), ("ru",), ("ruth",)),
+    Book(9, "사무엘상", "삼상", "1 Samuel", "1. Samuel", (), ("1sam",), ("1sam",)),
+    Book(10, "사무엘하", "삼하", "2 Samuel", "2. Samuel", (), ("2sam",), ("2sam",)),
+    Book(11, "열왕기상", "왕상", "1 Kings", "1. Könige", (), ("1kgs", "1ki"), ("1kön", "1koen")),
+    Book(12, "열왕기하", "왕하", "2 Kings", "2. Könige", (), ("2kgs", "2ki"), ("2kön", "2koen")),
+    Book(13, "역대상", "대상", "1 Chronicles", "1. Chronik", ("역대기상",), ("1chr",), ("1chr",)),
+    Book(14, "역대하", "대하", "2 Chronicles", "2. Chronik", ("역대기하",), ("2chr",), ("2chr",)),
+    Book(15, "에스라", "스", "Ezra", "Esra", (), ("ezr",), ()),
+    Book(16, "느헤미야", "느", "Nehemiah", "Nehemia", (), ("neh",), ("neh",)),
+    Book(17, "에스더", "에", "Esther", "Ester", (), ("esth",), ("est", "esther")),
+    Book(18, "욥기", "욥", "Job", "Hiob", (), (), ("ijob",)),
+    Book(19, "시편", "시", "Psalms", "Psalm", (), ("ps", "psa", "psalm"), ("ps", "psalmen")),
+    Book(20, "잠언", "잠", "Proverbs", "Sprüche", (), ("prov",), ("spr",)),
+    Book(21, "전도서", "전", "Ecclesiastes", "Prediger", (), ("eccl",), ("pred", "koh", "kohelet")),
+    Book(22, "아가", "아", "Song of Solomon", "Hohelied", (), ("song", "sos", "song of songs"), ("hld",)),
+    Book(23, "이사야", "사", "Isaiah", "Jesaja", (), ("isa",), ("jes",)),
+    Book(24, "예레미야", "렘", "Jeremiah", "Jeremia", (), ("jer",), ("jer",)),
+    Book(25, "예레미야애가", "애", "Lamentations", "Klagelieder", ("애가",), ("lam",), ("klgl",)),
+    Book(26, "에스겔", "겔", "Ezekiel", "Hesekiel", (), ("ezek",), ("hes", "ez", "ezechiel")),
+    Book(27, "다니엘", "단", "Daniel", "Daniel", (), ("dan",), ("dan",)),
+    Book(28, "호세아", "호", "Hosea", "Hosea", (), ("hos",), ("hos",)),
+    Book(29, "요엘", "욜", "Joel", "Joel", (), (), ()),
+    Book(30, "아모스", "암", "Amos", "Amos", (), (), ("am",)),
+    Book(31, "오바댜", "옵", "Obadiah", "Obadja", (), ("obad",), ("obd",)),
+    Book(32, "요나", "욘", "Jonah", "Jona", (), (), ()),
+    Book(33, "미가", "미", "Micah", "Micha", (), ("mic",), ("mi",)),
+    Book(34, "나훔", "나", "Nahum", "Nahum", (), ("nah",), ("nah",)),
+    Book(35, "하박국", "합", "Habakkuk", "Habakuk", (), ("hab",), ("hab",)),
+    Book(36, "스바냐", "습", "Zephaniah", "Zefanja", (), ("zeph",), ("zef",)),
+    Book(37, "학개", "학", "Haggai", "Haggai", (), ("hag",), ("hag",)),
+    Book(38, "스가랴", "슥", "Zechariah", "Sacharja", (), ("zech",), ("sach",)),
+    Book(39, "말라기", "말", "Malachi", "Maleachi", (), ("mal",), ("mal",)),
+
+    # 신약
+    Book(40, "마태복음", "마", "Matthew", "Matthäus", ("마태",), ("matt", "mt"), ("mt", "matt")),
+    Book(41, "마가복음", "막", "Mark", "Markus", ("마가",), ("mk",), ("mk",)),
+    Book(42, "누가복음", "눅", "Luke", "Lukas", ("누가",), ("lk",), ("lk",)),
+    Book(43, "요한복음", "요", "John", "Johannes", ("요한",), ("jn", "joh"), ("joh",)),
+    Book(44, "사도행전", "행", "Acts", "Apostelgeschichte", (), (), ("apg",)),
+    Book(45, "로마서", "롬", "Romans", "Römer", (), ("rom",), ("röm",)),
+    Book(46, "고린도전서", "고전", "1 Corinthians", "1. Korinther", (), ("1cor",), ("1kor",)),
+    Book(47, "고린도후서", "고후", "2 Corinthians", "2. Korinther", (), ("2cor",), ("2kor",)),
+    Book(48, "갈라디아서", "갈", "Galatians", "Galater", (), ("gal",), ("gal",)),
+    Book(49, "에베소서", "엡", "Ephesians", "Epheser", (), ("eph",), ("eph",)),
+    Book(50, "빌립보서", "빌", "Philippians", "Philipper", (), ("phil",), ("phil",)),
+    Book(51, "골로새서", "골", "Colossians", "Kolosser", (), ("col",), ("kol",)),
+    Book(52, "데살로니가전서", "살전", "1 Thessalonians", "1. Thessalonicher", (), ("1thess",), ("1thess",)),
+    Book(53, "데살로니가후서", "살후", "2 Thessalonians", "2. Thessalonicher", (), ("2thess",), ("2thess",)),
+    Book(54, "디모데전서", "딤전", "1 Timothy", "1. Timotheus", (), ("1tim",), ("1tim",)),
+    Book(55, "디모데후서", "딤후", "2 Timothy", "2. Timotheus", (), ("2tim",), ("2tim",)),
+    Book(56, "디도서", "딛", "Titus", "Titus", (), ("tit",), ("tit",)),
+    Book(57, "빌레몬서", "몬", "Philemon", "Philemon", (), ("philem", "phlm"), ("phlm",)),
+    Book(58, "히브리서", "히", "Hebrews", "Hebräer", (), ("heb",), ("hebr",)),
+    Book(59, "야고보서", "약", "James", "Jakobus", (), ("jas",), ("jak",)),
+    Book(60, "베드로전서", "벧전", "1 Peter", "1. Petrus", (), ("1pet",), ("1petr",)),
+    Book(61, "베드로후서", "벧후", "2 Peter", "2. Petrus", (), ("2pet",), ("2petr",)),
+    Book(62, "요한일서", "요일", "1 John", "1. Johannes", ("요한1서",), ("1john", "1jn"), ("1joh",)),
+    Book(63, "요한이서", "요이", "2 John", "2. Johannes", ("요한2서",), ("2john", "2jn"), ("2joh",)),
+    Book(64, "요한삼서", "요삼", "3 John", "3. Johannes", ("요한3서",), ("3john", "3jn"), ("3joh",)),
+    Book(65, "유다서", "유", "Jude", "Judas", (), (), ("jud",)),
+    Book(66, "요한계시록", "계", "Revelation", "Offenbarung", ("계시록",), ("rev",), ("offb",)),
+)
+
+BOOKS_BY_NUMBER: Dict[int, Book] = {book.number: book for book in BOOKS}
+
+# 별칭 정규화: 공백과 마침표 제거, 소문자, 유니코드 NFC (조합형 한글/움라우트 통일)
+_ALIAS_STRIP = re.compile(r'[\s.]+')
+_HANGUL = re.compile(r'[가-힣ᄀ-ᇿ㄰-㆏]')
+_GERMAN_LETTERS = re.compile(r'[äöüßÄÖÜ]')
+
+
+def normalize_alias(name: str) -> str:
+    """별칭 비교용 정규화 (예: "1. Mose" → "1mose", "Song of Songs" → "songofsongs")"""
+    return _ALIAS_STRIP.sub('', unicodedata.normalize("NFC", name)).lower()
+
+
+def iter_aliases() -> Iterator[Tuple[str, str, int]]:
+    """모든 책 이름과 별칭: (표기 그대로의 별칭, 언어, 책 번호)"""
+    for book in BOOKS:
+        names = {
+            KOREAN: (book.korean, book.korean_abbrev) + book.korean_aliases,
+            ENGLISH: (book.english,) + book.english_aliases,
+            GERMAN: (book.german,) + book.german_aliases,
+        }
+        for language, aliases in names.items():
+            for alias in aliases:
+                yield alias, language, book.number
+
+
+def _build_alias_index() -> Dict[str, Dict[str, int]]:
+    """정규화된 별칭 → {언어: 책 번호}"""
+    index: Dict[str, Dict[str, int]] = {}
+    for alias, language, number in iter_aliases():
+        index.setdefault(normalize_alias(alias), {})[language] = number
+    return index
+
+
+_ALIAS_INDEX = _build_alias_index()
+
+
+class BookMatch(NamedTuple):
+    """책 이름 해석 결과"""
+    number: int
+    language: str
+
+
+def normalize_language(language: Optional[str]) -> Optional[str]:
+    """언어 힌트 정규화 (모르는 표기면 None → 자동 감지)"""
+    if not language:
+        return None
+    return LANGUAGE_ALIASES.get(language.strip().lower())
+
+
+def detect_language(text: str) -> str:
+    """
+    입력 문자로 언어 감지
+    한글이 있으면 한국어, 움라우트/ß가 있으면 독일어, 그 외 라틴 문자는 영어
+    """
+    if _HANGUL.search(text):
+        return KOREAN
+    if _GERMAN_LETTERS.search(text):
+        return GERMAN
+    return ENGLISH
+
+
+@lru_cache(maxsize=4096)
+def resolve_book(name: str, language: Optional[str] = None) -> Optional[BookMatch]:
+    """
+    책 이름/약어 → 책 번호와 언어
+
+    같은 별칭이 여러 언어에 있으면 언어 힌트, 감지한 언어, 영어, 독일어 순으로 선택
+    (예: "Joh"는 영어 힌트면 John, 독일어 힌트면 Johannes이며 둘 다 43)
+
+    Args:
+        name: 책 이름 또는 약어 (예: "요", "요한복음", "John", "1. Mose")
+        language: 언어 힌트 (korean/english/german, ko/en/de 등), 없으면 자동 감지
+
+    Returns:
+        BookMatch(책 번호, 언어), 모르는 이름이면 None
+    """
+    candidates = _ALIAS_INDEX.get(normalize_alias(name))
+    if not candidates:
+        return None
+    return _pick_language(candidates, name, language)
+
+
+def _pick_language(candidates: Dict[str, int], name: str, language: Optional[str]) -> Optional[BookMatch]:
+    """같은 별칭의 언어별 후보 중 선택 (언어 힌트 → 감지한 언어 → 영어 → 독일어 → 한국어)"""
+    for preferred in (normalize_language(language), detect_language(name), ENGLISH, GERMAN, KOREAN):
+        if preferred in candidates:
+            return BookMatch(candidates[preferred], preferred)
+    return None
+
+
+def book_name(number: int, language: str = KOREAN) -> Optional[str]:
+    """책 번호 → 언어별 이름 (예: 43 → "요한복음", "John", "Johannes")"""
+    book = BOOKS_BY_NUMBER.get(number)
+    if book is None:
+        return None
+    language = normalize_language(language) or KOREAN
+    return getattr(book, language)
+
+
+def book_abbrev(number: int) -> Optional[str]:
+    """책 번호 → 한국어 약어 (예: 43 → "요")"""
+    book = BOOKS_BY_NUMBER.get(number)
+    return book.korean_abbrev if book is not None else None
+
+
+# ---------------------------------------------------------------------------
+# 오타 허용 검색
+# ---------------------------------------------------------------------------
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 분해 (예: "복" → "ㅂㅗㄱ", 한글이 아니면 그대로)"""
+    letters = []
+    for char in text:
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            letters.append(chr(0x1100 + code // 588))
+            letters.append(chr(0x1161 + code % 588 // 28))
+            if code % 28:
+                letters.append(chr(0x11A7 + code % 28))
+        else:
+            letters.append(char)
+    return ''.join(letters)
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """
+    레벤슈타인 편집 거리
+    limit을 주면 대각선 띠(|i-j| <= limit)만 계산하고, limit을 넘으면 limit + 1을 반환
+    """
+    if limit is None:
+        limit = max(len(a), len(b))
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    over = limit + 1
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i, char_a in enumerate(a, 1):
+        low = max(1, i - limit)
+        high = min(len(b), i + limit)
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        for j in range(low, high + 1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != b[j - 1]),
+                over
+            )
+        if min(current[max(0, low - 1):high + 1]) > limit:
+            return over
+        previous = current
+    return previous[-1]
+
+
+def deletions(word: str, depth: int) -> set:
+    """word에서 글자를 depth개 이하로 지운 문자열 전체 (word 포함)"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+class _TrieNode:
+    __slots__ = ("children", "books", "shortest")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        # 이 접두어로 시작하는 별칭들의 책 번호
+        self.books = set()
+        # 이 접두어로 시작하는 가장 짧은 별칭 (분해된 키)
+        self.shortest: Optional[str] = None
+
+
+class FuzzyMatch(NamedTuple):
+    """오타 허용 검색 결과 (confidence: 1.0이면 정확히 일치)"""
+    number: int
+    language: str
+    alias: str
+    confidence: float
+
+
+class FuzzyBookIndex:
+    """
+    모든 언어 별칭의 트라이 + 삭제 이웃 색인 (키는 정규화 후 한글 자모 분해)
+
+    삭제 이웃 색인: 별칭마다 글자를 최대 MAX_DISTANCE개 지운 문자열을 미리 색인해 두면,
+    편집 거리 d 이내의 두 문자열은 각각 d개 이하를 지워 같은 문자열이 되므로
+    입력의 삭제 이웃만 조회해서 후보를 찾고 후보에 대해서만 편집 거리를 계산 (전체 별칭 순회 없음)
+    """
+
+    MAX_DISTANCE = 2
+
+    def __init__(self, alias_index: Dict[str, Dict[str, int]]):
+        # 분해된 키 → 정규화된 별칭
+        self._aliases: Dict[str, str] = {}
+        self._trie = _TrieNode()
+        # 삭제 이웃 → 분해된 키 목록
+        self._deletions: Dict[str, List[str]] = {}
+        for alias, candidates in alias_index.items():
+            key = decompose_hangul(alias)
+            self._aliases[key] = alias
+            for variant in deletions(key, self.MAX_DISTANCE):
+                self._deletions.setdefault(variant, []).append(key)
+
+            node = self._trie
+            for char in key:
+                node = node.children.setdefault(char, _TrieNode())
+                node.books.update(candidates.values())
+                if node.shortest is None or len(key) < len(node.shortest):
+                    node.shortest = key
+
+    def _nearest(self, key: str, max_distance: int) -> List[Tuple[int, str]]:
+        """편집 거리가 max_distance 이하인 키 [(거리, 키)] (거리 순)"""
+        if max_distance == 0:
+            return []
+        candidates = set()
+        for variant in deletions(key, max_distance):
+            candidates.update(self._deletions.get(variant, ()))
+
+        results = []
+        for candidate in candidates:
+            distance = edit_distance(key, candidate, max_distance)
+            if distance <= max_distance:
+                results.append((distance, candidate))
+        results.sort()
+        return results
+
+    @classmethod
+    def max_distance(cls, normalized: str) -> int:
+        """
+        허용 편집 거리 (짧은 약어는 오타 교정 안 함)
+        길이는 자모가 아닌 음절/글자 수로 셈 (한 음절은 자모 3개라 "곡"이 "골"로 교정되는 것 방지)
+        """
+        syllables = len(_HANGUL.findall(normalized))
+        length, (one, two) = (syllables, FUZZY_HANGUL_LENGTHS) if syllables else (len(normalized), FUZZY_LATIN_LENGTHS)
+        if length < one:
+            return 0
+        return 1 if length < two else cls.MAX_DISTANCE
+
+    def search(self, name: str, language: Optional[str] = None) -> Optional[FuzzyMatch]:
+        """
+        가장 가까운 별칭 찾기: 정확히 일치 → 한 책으로만 이어지는 접두어 → 편집 거리
+        여러 책 별칭의 접두어(예: "열왕기" → 열왕기상/하)는 어느 책인지 알 수 없으므로 None
+        편집 거리가 같은 후보가 여러 책이면 신뢰도를 후보 책 수로 나눔
+
+        Returns:
+            FuzzyMatch, 후보가 없거나 모호하면 None
+        """
+        normalized = normalize_alias(name)
+        key = decompose_hangul(normalized)
+
+        if key in self._aliases:
+            match = _pick_language(_ALIAS_INDEX[normalized], name, language)
+            return FuzzyMatch(match.number, match.language, normalized, 1.0)
+
+        # 접두어: 이 접두어로 시작하는 별칭이 모두 같은 책일 때만
+        node = self._trie
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                break
+        if node is not None:
+            if len(node.books) > 1:
+                # 여러 책의 접두어 (편집 거리로 한 책을 고르면 엉뚱한 책이 됨)
+                return None
+            if len(key) >= FUZZY_MIN_PREFIX:
+                alias = self._aliases[node.shortest]
+                match = _pick_language(_ALIAS_INDEX[alias], name, language)
+                return FuzzyMatch(match.number, match.language, alias,
+                                  round(0.5 + 0.5 * len(key) / len(node.shortest), 3))
+
+        results = self._nearest(key, self.max_distance(normalized))
+        if not results:
+            return None
+        best_distance = results[0][0]
+        best = [word for distance, word in results if distance == best_distance]
+        # 같은 거리면 길이가 비슷한 별칭 우선
+        best.sort(key=lambda word: (abs(len(word) - len(key)), word))
+
+        matches = [_pick_language(_ALIAS_INDEX[self._aliases[word]], name, language) for word in best]
+        books = {match.number for match in matches}
+        confidence = (1 - best_distance / max(len(key), len(best[0]))) / len(books)
+        return FuzzyMatch(matches[0].number, matches[0].language, self._aliases[best[0]], round(confidence, 3))
+
+
+_fuzzy_index: Optional[FuzzyBookIndex] = None
+
+
+@lru_cache(maxsize=4096)
+def fuzzy_resolve_book(name: str, language: Optional[str] = None) -> Optional[FuzzyMatch]:
+    """
+    오타를 허용하는 책 이름 해석 (예: "요한북음", "Johanes" → 43)
+    색인은 처음 사용할 때 한 번 생성
+
+    Returns:
+        가장 가까운 FuzzyMatch (신뢰도 포함), 후보가 없으면 None
+    """
+    global _fuzzy_index
+    if _fuzzy_index is None:
+        _fuzzy_index = FuzzyBookIndex(_ALIAS_INDEX)
+    return _fuzzy_index.search(name, language)
@@ -4,57 +4,81 @@ Reference.zip의 성경 데이터를 로드하고 파싱
 """
 import os
 import re
-from typing import Optional, Dict
-from .bible_parser import parse_bible_reference
-
-# 성경 책 번호 매핑 (약어 -> 디렉토리명)
-BOOK_DIR_MAP = {
-    # 구약
-    "창": "01_창세기", "출": "02_출애굽기", "레": "03_레위기", "민": "04_민수기", "신": "05_신명기",
-    "수": "06_여호수아", "삿": "07_사사기", "룻": "08_룻기",
-    "삼상": "09_사무엘상", "삼하": "10_사무엘하", "왕상": "11_열왕기상", "왕하": "12_열왕기하",
-    "대상": "13_역대기상", "대하": "14_역대기하", "스": "15_에스라", "느": "16_느헤미야", "에": "17_에스더",
-    "욥": "18_욥기", "시": "19_시편", "잠": "20_잠언", "전": "21_전도서", "아": "22_아가",
-    "사": "23_이사야", "렘": "24_예레미야", "애": "25_예레미야애가", "겔": "26_에스겔", "단": "27_다니엘",
-    "호": "28_호세아", "욜": "29_요엘", "암": "30_아모스", "옵": "31_오바댜", "욘": "32_요나",
-    "미": "33_미가", "나": "34_나훔", "합": "35_하박국", "습": "36_스바냐", "학": "37_학개",
-    "슥": "38_스가랴", "말": "39_말라기",
-
-    # 신약
-    "마": "40_마태복음", "막": "41_마가복음", "눅": "42_누가복음", "요": "43_요한복음",
-    "행": "44_사도행전", "롬": "45_로마서",
-    "고전": "46_고린도전서", "고후": "47_고린도후서",
-    "갈": "48_갈라디아서", "엡": "49_에베소서", "빌": "50_빌립보서", "골": "51_골로새서",
-    "살전": "52_데살로니가전서", "살후": "53_데살로니가후서",
-    "딤전": "54_디모데전서", "딤후": "55_디모데후서", "딛": "56_디도서", "몬": "57_빌레몬서",
-    "히": "58_히브리서", "약": "59_야고보서",
-    "벧전": "60_베드로전서", "벧후": "61_베드로후서",
-    "요일": "62_요한1서", "요이": "63_요한2서", "요삼": "64_요한3서",
-    "유": "65_유다서", "계": "66_요한계시록"
-}
-
-# 책 약어 (파일명용)
-BOOK_ABBREV_FILE_MAP = {
-    "창": "창", "출": "출", "레": "레", "민": "민", "신": "신",
-    "수": "수", "삿": "삿", "룻": "룻",
-    "삼상": "삼상", "삼하": "삼하", "왕상": "왕상", "왕하": "왕하",
-    "대상": "대상", "대하": "대하", "스": "스", "느": "느", "에": "에",
-    "욥": "욥", "시": "시", "잠": "잠", "전": "전", "아": "아",
-    "사": "사", "렘": "렘", "애": "애", "겔": "겔", "단": "단",
-    "호": "호", "욜": "욜", "암": "암", "옵": "옵", "욘": "욘",
-    "미": "미", "나": "나", "합": "합", "습": "습", "학": "학",
-    "슥": "슥", "말": "말",
-    "마": "마", "막": "막", "눅": "눅", "요": "요",
-    "행": "행", "롬": "롬",
-    "고전": "고전", "고후": "고후",
-    "갈": "갈", "엡": "엡", "빌": "빌", "골": "골",
-    "살전": "살전", "살후": "살후",
-    "딤전": "딤전", "딤후": "딤후", "딛": "딛", "몬": "몬",
-    "히": "히", "약": "약",
-    "벧전": "벧전", "벧후": "벧후",
-    "요일": "요일", "요이": "요이", "요삼": "요삼",
-    "유": "유", "계": "계"
-}
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple, Iterable, Iterator, NamedTuple, Union
+from .bible_parser import parse_bible_references
+from .bible_books import resolve_book
+from .verse_index import VerseIndex
+from .reference_pack import get_reference_pack
+from .cache import LRUCache
+from .instrumentation import get_logger, stage, in_current_context
+from .singleflight import SingleFlight
+
+logger = get_logger("BibleLoader")
+
+# 여러 장을 동시에 읽을 때 사용하는 스레드 풀
+_read_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bible-read")
+
+# 같은 장 구절 범위의 동시 읽기 합치기 (load_passages, load_many, iter_verses가 모두 거치는 읽기 경로)
+_chapter_flight = SingleFlight("chapter")
+
+# 구절 캐시 메모리 예산 (바이트)
+PASSAGE_CACHE_BYTES = int(os.getenv("PASSAGE_CACHE_BYTES", str(8 * 1024 * 1024)))
+
+
+def extract_verse_texts(content: str) -> List[Tuple[int, str]]:
+    """
+    마크다운 content를 절 단위로 분리
+
+    Returns:
+        [(절 번호, 본문), ...] - 네비게이션 링크, 빈 줄, <소제목> 표기는 제거
+    """
+    verses = []
+    current_verse = None
+    current_lines = []
+
+    for line in content.split('\n'):
+        # 구절 번호 체크
+        verse_match = re.match(r'^######\s+(\d+)', line)
+        if verse_match:
+            if current_verse is not None:
+                verses.append((current_verse, ' '.join(current_lines)))
+            current_verse = int(verse_match.group(1))
+            current_lines = []
+        elif current_verse is not None:
+            # 네비게이션 링크 제거
+            if line.strip().startswith('[['):
+                continue
+
+            # 빈 줄 스킵
+            if not line.strip():
+                continue
+
+            # 소제목 처리: <제목> 형식 제거
+            cleaned_line = re.sub(r'<([^>]+)>', '', line).strip()
+            if cleaned_line:
+                current_lines.append(cleaned_line)
+
+    if current_verse is not None:
+        verses.append((current_verse, ' '.join(current_lines)))
+
+    # 여러 공백을 하나로
+    return [(verse, re.sub(r'\s+', ' ', text).strip()) for verse, text in verses]
+
+
+def format_verses(verses: Iterable[Tuple[int, str]]) -> str:
+    """[(절 번호, 본문), ...]을 "1 본문 2 본문..." 형식의 한 줄 텍스트로 합침"""
+    text = ' '.join(f"{verse} {text}" for verse, text in verses)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+class VerseRecord(NamedTuple):
+    """구절 하나 (iter_verses 결과)"""
+    book_number: int
+    chapter: int
+    verse: int
+    text: str
 
 
 class BibleLoader:
@@ -82,7 +106,7 @@ class BibleLoader:
                     if '개역개정' in item or '성경' in item:
                         bible_data_path = item_path
                         found = True
-                        print(f"[BibleLoader] 성경 폴더 발견 (이름): {item}")
+                        logger.info("성경 폴더 발견 (이름): %s", item)
                         break
 
                 # 방법 2: 내부 구조로 검색 (01_창세기 폴더가 있는지)
@@ -100,7 +124,7 @@ class BibleLoader:
                                 if subfolder.startswith('01_') or '창세기' in subfolder:
                                     bible_data_path = item_path
                                     found = True
-                                    print(f"[BibleLoader] 성경 폴더 발견 (구조): {item}")
+                                    logger.info("성경 폴더 발견 (구조): %s", item)
                                     break
                             if found:
                                 break
@@ -115,134 +139,325 @@ class BibleLoader:
                             if item.startswith('01_') or '창세기' in item:
                                 bible_data_path = reference_path
                                 found = True
-                                print(f"[BibleLoader] 성경 데이터가 Reference 루트에 있음")
+                                logger.info("성경 데이터가 Reference 루트에 있음")
                                 break
                     except:
                         pass
 
                 if not found:
                     bible_data_path = reference_path
-                    print(f"[BibleLoader] ⚠️ 성경 폴더를 찾을 수 없어 Reference를 기본 경로로 사용")
+                    logger.warning("⚠️ 성경 폴더를 찾을 수 없어 Reference를 기본 경로로 사용")
 
         self.bible_path = bible_data_path
+        self._index = None
+        self._index_lock = threading.Lock()
+        self.cache = LRUCache("passages", PASSAGE_CACHE_BYTES)
+
+    def _get_index(self) -> Optional[VerseIndex]:
+        """구절 오프셋 인덱스 (최초 사용 시 한 번만 로드/생성)"""
+        if self._index is None:
+            with self._index_lock:
+                if self._index is None:
+                    index = VerseIndex(self.bible_path) if self.bible_path else None
+                    if index is None or not index.load():
+                        return None
+                    self._index = index
+        return self._index
+
+    def data_signature(self) -> Optional[str]:
+        """
+        성경 데이터 서명 (팩 체크섬 또는 구절 오프셋 인덱스 서명)
+        파생 인덱스가 원본 변경을 감지하는 데 사용. 데이터가 없으면 None
+        """
+        pack = get_reference_pack()
+        if pack is not None:
+            return f"pack:{pack.checksum}"
+        index = self._get_index()
+        if index is not None:
+            return f"tree:{index.signature}"
+        return None
 
     def load_scripture(self, reference: str) -> Optional[str]:
         """
         성경 구절 로드
 
         Args:
-            reference: 성경 참조 (예: "출24:12-18", "고전2:1-5")
+            reference: 성경 참조 (예: "출24:12-18", "고전2:1-5", "요3:16,18; 롬8:28-30")
 
         Returns:
-            성경 본문 텍스트, 실패시 None
+            성경 본문 텍스트 (여러 구간이면 이어붙임), 실패시 None
         """
         try:
-            print(f"      [BibleLoader] 레퍼런스 파싱: {reference}")
+            logger.debug("레퍼런스 파싱: %s", reference)
 
-            # 레퍼런스 파싱
-            parsed = parse_bible_reference(reference, "korean")
-            book_abbrev = parsed.get("book_abbrev")
-            chapter = parsed.get("chapter")
-            verses = parsed.get("verses")
+            passages = self.load_passages(reference)
+            missing = [p["formatted"] for p in passages if p["text"] is None]
+            if missing:
+                logger.debug("❌ 구절을 찾을 수 없음: %s", missing)
+                return None
 
-            print(f"      [BibleLoader] 파싱 결과: book={book_abbrev}, chapter={chapter}, verses={verses}")
+            verses_text = ' '.join(p["text"] for p in passages)
+            logger.debug("✅ 구절 추출 완료 (%d 글자)", len(verses_text))
+            return verses_text
 
-            if not book_abbrev or not chapter:
-                print(f"      [BibleLoader] ❌ 파싱 실패: book_abbrev 또는 chapter가 없음")
-                return None
+        except Exception as e:
+            logger.exception("❌ 오류: %s", e)
+            return None
 
-            # 구절 범위 파싱
-            verse_start, verse_end = self._parse_verse_range(verses)
-            print(f"      [BibleLoader] 구절 범위: {verse_start}-{verse_end}")
+    def load_passages(self, reference: str) -> List[Dict]:
+        """
+        여러 구간으로 된 성경 참조 로드
+        같은 장에 속한 구간들은 장 파일(또는 팩 블록)을 한 번만 읽음
 
-            # 파일 경로 생성 (번호 기반)
-            book_dir = BOOK_DIR_MAP.get(book_abbrev)
-            if not book_dir:
-                print(f"      [BibleLoader] ❌ book_dir을 찾을 수 없음: {book_abbrev}")
-                return None
+        Args:
+            reference: 성경 참조 (예: "요3:16,18; 롬8:28-30; 롬8:35-39")
 
-            # 책 번호 추출 (예: "01_창세기" → "01")
-            book_number = book_dir.split('_')[0]
-            print(f"      [BibleLoader] 찾을 책 번호: {book_number}")
-
-            # Bible path 내용 확인
-            if self.bible_path and os.path.exists(self.bible_path):
-                contents = os.listdir(self.bible_path)
-                print(f"      [BibleLoader] Bible path 내용 (처음 10개): {contents[:10]}")
-
-                # 번호로 폴더 찾기
-                target_folder = None
-                for folder in contents:
-                    if folder.startswith(f"{book_number}_"):
-                        target_folder = folder
-                        print(f"      [BibleLoader] ✅ 폴더 발견 (번호): {folder}")
-                        break
+        Returns:
+            parse_bible_references의 구간 dict에 "text"(없으면 None)를 더한 목록 (입력 순서)
 
-                if not target_folder:
-                    print(f"      [BibleLoader] ❌ {book_number}_ 로 시작하는 폴더를 찾을 수 없음")
-                    return None
-
-                # 폴더 안에서 파일 찾기
-                folder_path = os.path.join(self.bible_path, target_folder)
-                if not os.path.exists(folder_path):
-                    print(f"      [BibleLoader] ❌ 폴더가 존재하지 않음: {folder_path}")
-                    return None
-
-                folder_files = os.listdir(folder_path)
-                print(f"      [BibleLoader] 폴더 내용 (처음 10개): {folder_files[:10]}")
-
-                # 장 번호로 파일 찾기 (예: " 1.md", "_1.md", "1.md" 등)
-                target_file = None
-                for file in folder_files:
-                    if file.endswith(f" {chapter}.md") or file.endswith(f"_{chapter}.md") or file == f"{chapter}.md":
-                        target_file = file
-                        print(f"      [BibleLoader] ✅ 파일 발견 (번호): {file}")
-                        break
+        Raises:
+            ValueError: 레퍼런스 형식이 잘못된 경우
+        """
+        with stage("parse"):
+            passages = [dict(segment, text=None) for segment in parse_bible_references(reference)]
+        with stage("resolve"):
+            self._resolve_passages(passages)
+        return passages
 
-                if not target_file:
-                    print(f"      [BibleLoader] ❌ 장 {chapter}에 해당하는 파일을 찾을 수 없음")
-                    print(f"      [BibleLoader] 찾은 파일들: {[f for f in folder_files if f.endswith('.md')][:10]}")
-                    return None
+    def load_many(self, references: List[str]) -> List[Union[List[Dict], ValueError]]:
+        """
+        여러 레퍼런스를 한 번에 로드
+        모든 레퍼런스의 구간을 장 단위로 묶어, 여러 레퍼런스가 공유하는 장도 한 번만 읽음
 
-                file_path = os.path.join(folder_path, target_file)
+        Returns:
+            입력 순서대로 load_passages 결과, 형식이 잘못된 레퍼런스는 ValueError
+        """
+        results = []
+        all_passages = []
+        for reference in references:
+            try:
+                with stage("parse"):
+                    passages = [dict(segment, text=None) for segment in parse_bible_references(reference)]
+            except ValueError as e:
+                results.append(e)
+                continue
+            results.append(passages)
+            all_passages.extend(passages)
+
+        with stage("resolve"):
+            self._resolve_passages(all_passages)
+        return results
+
+    def _resolve_passages(self, passages: List[Dict]):
+        """
+        구간 목록의 "text"를 채움
+        캐시에 없는 구간은 장 단위로 묶어 장마다 한 번만 읽고, 여러 장은 동시에 읽음
+        """
+        # 캐시에 없는 구간을 장 단위로 묶기
+        groups: Dict[Tuple[int, int], List[Dict]] = {}
+        versions = {}
+        for passage in passages:
+            book_number = passage["book_id"]
+            if book_number is None:
+                logger.debug("❌ 책을 찾을 수 없음: %s", passage["book_abbrev"])
+                continue
+
+            # 장을 넘는 구간은 장 단위로 스트리밍해서 합침
+            if passage["chapter_end"] != passage["chapter"]:
+                end = None if passage["chapter_end"] is None else (passage["chapter_end"], passage["verse_end"])
+                text = format_verses(
+                    (record.verse, record.text)
+                    for record in self.iter_verses(book_number, (passage["chapter"], passage["verse_start"] or 1), end)
+                )
+                passage["text"] = text or None
+                continue
+
+            chapter_key = (book_number, passage["chapter"])
+            if chapter_key not in versions:
+                versions[chapter_key] = self._source_version(*chapter_key)
+
+            cached = self.cache.get(self._cache_key(book_number, passage), versions[chapter_key])
+            if cached is not None:
+                passage["text"] = cached
             else:
-                print(f"      [BibleLoader] ❌ Bible path가 존재하지 않음")
-                return None
+                groups.setdefault(chapter_key, []).append(passage)
+
+        if len(groups) == 1:
+            for (book_number, chapter), chapter_passages in groups.items():
+                self._resolve_chapter(book_number, chapter, chapter_passages, versions[(book_number, chapter)])
+            return
+
+        # 여러 장은 동시에 읽기 (요청 타이밍이 읽기 스레드에도 기록되도록 컨텍스트 전달)
+        futures = [
+            _read_executor.submit(in_current_context(self._resolve_chapter, book_number, chapter, chapter_passages,
+                                                     versions[(book_number, chapter)]))
+            for (book_number, chapter), chapter_passages in groups.items()
+        ]
+        for future in futures:
+            future.result()
+
+    def _resolve_chapter(self, book_number: int, chapter: int, chapter_passages: List[Dict], version):
+        """장을 한 번 읽어서 그 장에 속한 구간들의 본문 추출"""
+        starts = [p["verse_start"] or 1 for p in chapter_passages]
+        ends = [p["verse_end"] for p in chapter_passages]
+        span_end = None if None in ends else max(ends)
+
+        verses = self._read_verses(book_number, chapter, min(starts), span_end)
+        if verses is None:
+            return
+
+        for passage in chapter_passages:
+            start = passage["verse_start"] or 1
+            end = passage["verse_end"]
+            text = format_verses(
+                (verse, text) for verse, text in verses
+                if verse >= start and (end is None or verse <= end)
+            )
+            if not text:
+                continue
+            passage["text"] = text
+            self.cache.put(self._cache_key(book_number, passage), text, version)
+
+    def iter_verses(self, book: Union[str, int], start: Tuple[int, int] = (1, 1),
+                    end: Optional[Tuple[int, Optional[int]]] = None) -> Iterator[VerseRecord]:
+        """
+        장 경계를 넘어 구절을 하나씩 생성 (한 번에 한 장만 메모리에 올림)
 
-            print(f"      [BibleLoader] ✅ 최종 파일 경로: {file_path}")
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        Args:
+            book: 책 이름/약어 (예: "창", "Genesis") 또는 책 번호 (1-66)
+            start: (시작 장, 시작 절)
+            end: (끝 장, 끝 절) - 끝 절이 None이면 그 장 끝까지, end가 None이면 책 끝까지
 
-            # 구절 추출
-            verses_text = self._extract_verses(content, verse_start, verse_end)
-            print(f"      [BibleLoader] ✅ 구절 추출 완료 ({len(verses_text) if verses_text else 0} 글자)")
-            return verses_text
+        Yields:
+            VerseRecord(book_number, chapter, verse, text)
 
-        except Exception as e:
-            print(f"      [BibleLoader] ❌ 오류: {e}")
-            import traceback
-            traceback.print_exc()
-            return None
+        예시:
+            loader.iter_verses("창", (1, 26), (2, 3))  # 창1:26-2:3
+        """
+        if isinstance(book, int):
+            book_number = book
+        else:
+            match = resolve_book(book)
+            if match is None:
+                return
+            book_number = match.number
+
+        start_chapter, start_verse = start
+        end_chapter, end_verse = end if end is not None else (None, None)
+
+        for chapter in self._chapter_numbers(book_number):
+            if chapter < start_chapter:
+                continue
+            if end_chapter is not None and chapter > end_chapter:
+                break
+
+            verse_start = start_verse if chapter == start_chapter else 1
+            verse_end = end_verse if chapter == end_chapter else None
+            for verse, text in self._read_verses(book_number, chapter, verse_start, verse_end) or ():
+                yield VerseRecord(book_number, chapter, verse, text)
+
+    def iter_passage_verses(self, reference: str) -> Iterator[VerseRecord]:
+        """
+        레퍼런스의 모든 구간을 구절 단위로 스트리밍 (예: "시1-150", "창1:26-2:3; 요3:16")
 
-    def _parse_verse_range(self, verses_str: Optional[str]) -> tuple:
+        Raises:
+            ValueError: 레퍼런스 형식이 잘못된 경우
+        """
+        with stage("parse"):
+            segments = parse_bible_references(reference)
+        for segment in segments:
+            end = None
+            if segment["chapter_end"] is not None:
+                end = (segment["chapter_end"], segment["verse_end"])
+            if segment["book_id"] is not None:
+                yield from self.iter_verses(segment["book_id"], (segment["chapter"], segment["verse_start"] or 1), end)
+
+    def reference_version(self, reference: str) -> str:
         """
-        구절 범위 파싱
+        레퍼런스 본문의 버전 (본문을 읽지 않고 덱 캐시 키를 만들 때 사용)
+        구간에 들어가는 장마다 원본 버전(팩 체크섬 또는 장 파일 수정 시각)을 이어 붙임
 
-        Args:
-            verses_str: "1", "1-5", "12-18" 등
+        Raises:
+            ValueError: 레퍼런스 형식이 잘못된 경우
+        """
+        parts = []
+        for segment in parse_bible_references(reference):
+            book_number = segment["book_id"]
+            if book_number is None:
+                parts.append("?")
+                continue
+            last = segment["chapter_end"]
+            for chapter in self._chapter_numbers(book_number):
+                if chapter >= segment["chapter"] and (last is None or chapter <= last):
+                    parts.append(f"{book_number}:{chapter}:{self._source_version(book_number, chapter)}")
+        return "|".join(parts)
+
+    def _chapter_numbers(self, book_number: int) -> List[int]:
+        """책의 장 번호 목록 (팩 우선, 없으면 오프셋 인덱스)"""
+        pack = get_reference_pack()
+        if pack is not None:
+            chapters = pack.chapter_numbers(book_number)
+            if chapters:
+                return chapters
+
+        index = self._get_index()
+        return index.chapter_numbers(book_number) if index else []
+
+    def _cache_key(self, book_number: int, passage: Dict) -> tuple:
+        """정규화된 캐시 키 (책 번호, 장, 시작 절, 끝 절)"""
+        return (book_number, passage["chapter"], passage["verse_start"], passage["verse_end"])
+
+    def _read_verses(self, book_number: int, chapter: int, verse_start: int,
+                     verse_end: Optional[int]) -> Optional[List[Tuple[int, str]]]:
+        """
+        팩 또는 오프셋 인덱스에서 장의 구절 범위 읽기 (verse_end가 None이면 장 끝까지)
+        같은 범위를 동시에 읽으면 한 번만 읽고 결과를 함께 받음 (결과 목록은 수정하지 않고 읽기만 할 것)
 
         Returns:
-            (start_verse, end_verse)
+            [(절 번호, 본문), ...], 해당 구절이 없으면 None
         """
-        if not verses_str:
-            return (1, 999)  # 전체 장
+        return _chapter_flight.do((self.bible_path, book_number, chapter, verse_start, verse_end),
+                                  self._read_span, book_number, chapter, verse_start, verse_end)
+
+    def _read_span(self, book_number: int, chapter: int, verse_start: int,
+                   verse_end: Optional[int]) -> Optional[List[Tuple[int, str]]]:
+        """_read_verses 본체"""
+        # Reference 팩이 있으면 mmap에서 바로 조회
+        pack = get_reference_pack()
+        if pack is not None and pack.has_chapter(book_number, chapter):
+            with stage("read"):
+                return pack.verses(book_number, chapter, verse_start, verse_end) or None
+
+        # 오프셋 인덱스로 해당 구절 범위만 seek 해서 읽기
+        index = self._get_index()
+        if index is None:
+            logger.warning("❌ Bible path가 존재하지 않음")
+            return None
 
-        if '-' in verses_str:
-            parts = verses_str.split('-')
-            return (int(parts[0]), int(parts[1]))
-        else:
-            verse_num = int(verses_str)
-            return (verse_num, verse_num)
+        with stage("read"):
+            content = index.read_span(book_number, chapter, verse_start, verse_end)
+        if content is None:
+            return None
+        with stage("extract"):
+            return extract_verse_texts(content) or None
+
+    def _source_version(self, book_number: int, chapter: int):
+        """
+        캐시 무효화용 원본 버전
+        팩이면 팩 체크섬, 마크다운이면 장 파일의 수정 시각
+        """
+        pack = get_reference_pack()
+        if pack is not None and pack.has_chapter(book_number, chapter):
+            return pack.checksum
+
+        index = self._get_index()
+        entry = index.chapter(book_number, chapter) if index else None
+        if entry is None:
+            return None
+        try:
+            return os.stat(entry.path).st_mtime_ns
+        except OSError:
+            return None
 
     def _extract_verses(self, content: str, start: int, end: int) -> str:
         """
@@ -254,53 +469,21 @@ class BibleLoader:
         ###### 2
         본문...
         """
-        lines = content.split('\n')
-        result = []
-        current_verse = 0
-        capturing = False
-
-        for line in lines:
-            # 구절 번호 체크
-            verse_match = re.match(r'^######\s+(\d+)', line)
-            if verse_match:
-                current_verse = int(verse_match.group(1))
-
-                if start <= current_verse <= end:
-                    capturing = True
-                    # 구절 번호는 포함하되 마크다운 제거
-                    result.append(f"{current_verse} ")
-                elif current_verse > end:
-                    break
-                else:
-                    capturing = False
-            elif capturing:
-                # 네비게이션 링크 제거
-                if line.strip().startswith('[[') or line.strip().startswith('[[@'):
-                    continue
-
-                # 빈 줄 스킵
-                if not line.strip():
-                    continue
-
-                # 소제목 처리: <제목> 형식 제거하거나 유지
-                cleaned_line = re.sub(r'<([^>]+)>', '', line)
-
-                # 본문 추가 (줄바꿈 없이 이어붙이기)
-                result.append(cleaned_line.strip() + ' ')
-
-        # 결과 정리
-        text = ''.join(result).strip()
-        # 여러 공백을 하나로
-        text = re.sub(r'\s+', ' ', text)
-        return text
+        return format_verses(
+            (verse, text) for verse, text in extract_verse_texts(content)
+            if start <= verse <= end
+        )
 
 
 # 전역 인스턴스
 _bible_loader = None
+_bible_loader_lock = threading.Lock()
 
 def get_bible_loader() -> BibleLoader:
-    """성경 로더 싱글톤"""
+    """성경 로더 싱글톤 (여러 스레드에서 동시에 호출해도 한 번만 생성)"""
     global _bible_loader
     if _bible_loader is None:
-        _bible_loader = BibleLoader()
+        with _bible_loader_lock:
+            if _bible_loader is None:
+                _bible_loader = BibleLoader()
     return _bible_loader
@@ -2,259 +2,62 @@
 성경 약어 파싱 및 전체 이름 변환
 """
 
-# 성경 약어 매핑 (한국어)
-BIBLE_ABBREVIATIONS_KR = {
-    # 구약
-    "창": "창세기", "창세기": "창세기",
-    "출": "출애굽기", "출애굽기": "출애굽기",
-    "레": "레위기", "레위기": "레위기",
-    "민": "민수기", "민수기": "민수기",
-    "신": "신명기", "신명기": "신명기",
-    "수": "여호수아", "여호수아": "여호수아",
-    "삿": "사사기", "사사기": "사사기",
-    "룻": "룻기", "룻기": "룻기",
-    "삼상": "사무엘상", "사무엘상": "사무엘상",
-    "삼하": "사무엘하", "사무엘하": "사무엘하",
-    "왕상": "열왕기상", "열왕기상": "열왕기상",
-    "왕하": "열왕기하", "열왕기하": "열왕기하",
-    "대상": "역대상", "역대상": "역대상",
-    "대하": "역대하", "역대하": "역대하",
-    "스": "에스라", "에스라": "에스라",
-    "느": "느헤미야", "느헤미야": "느헤미야",
-    "에": "에스더", "에스더": "에스더",
-    "욥": "욥기", "욥기": "욥기",
-    "시": "시편", "시편": "시편",
-    "잠": "잠언", "잠언": "잠언",
-    "전": "전도서", "전도서": "전도서",
-    "아": "아가", "아가": "아가",
-    "사": "이사야", "이사야": "이사야",
-    "렘": "예레미야", "예레미야": "예레미야",
-    "애": "예레미야애가", "애가": "예레미야애가",
-    "겔": "에스겔", "에스겔": "에스겔",
-    "단": "다니엘", "다니엘": "다니엘",
-    "호": "호세아", "호세아": "호세아",
-    "욜": "요엘", "요엘": "요엘",
-    "암": "아모스", "아모스": "아모스",
-    "옵": "오바댜", "오바댜": "오바댜",
-    "욘": "요나", "요나": "요나",
-    "미": "미가", "미가": "미가",
-    "나": "나훔", "나훔": "나훔",
-    "합": "하박국", "하박국": "하박국",
-    "습": "스바냐", "스바냐": "스바냐",
-    "학": "학개", "학개": "학개",
-    "슥": "스가랴", "스가랴": "스가랴",
-    "말": "말라기", "말라기": "말라기",
-
-    # 신약
-    "마": "마태복음", "마태": "마태복음", "마태복음": "마태복음",
-    "막": "마가복음", "마가": "마가복음", "마가복음": "마가복음",
-    "눅": "누가복음", "누가": "누가복음", "누가복음": "누가복음",
-    "요": "요한복음", "요한": "요한복음", "요한복음": "요한복음",
-    "행": "사도행전", "사도행전": "사도행전",
-    "롬": "로마서", "로마서": "로마서",
-    "고전": "고린도전서", "고린도전서": "고린도전서",
-    "고후": "고린도후서", "고린도후서": "고린도후서",
-    "갈": "갈라디아서", "갈라디아서": "갈라디아서",
-    "엡": "에베소서", "에베소서": "에베소서",
-    "빌": "빌립보서", "빌립보서": "빌립보서",
-    "골": "골로새서", "골로새서": "골로새서",
-    "살전": "데살로니가전서", "데살로니가전서": "데살로니가전서",
-    "살후": "데살로니가후서", "데살로니가후서": "데살로니가후서",
-    "딤전": "디모데전서", "디모데전서": "디모데전서",
-    "딤후": "디모데후서", "디모데후서": "디모데후서",
-    "딛": "디도서", "디도서": "디도서",
-    "몬": "빌레몬서", "빌레몬서": "빌레몬서",
-    "히": "히브리서", "히브리서": "히브리서",
-    "약": "야고보서", "야고보서": "야고보서",
-    "벧전": "베드로전서", "베드로전서": "베드로전서",
-    "벧후": "베드로후서", "베드로후서": "베드로후서",
-    "요일": "요한일서", "요한일서": "요한일서",
-    "요이": "요한이서", "요한이서": "요한이서",
-    "요삼": "요한삼서", "요한삼서": "요한삼서",
-    "유": "유다서", "유다서": "유다서",
-    "계": "요한계시록", "계시록": "요한계시록", "요한계시록": "요한계시록",
-}
-
-# 영어 약어 매핑
-BIBLE_ABBREVIATIONS_EN = {
-    # Old Testament
-    "gen": "Genesis", "genesis": "Genesis",
-    "ex": "Exodus", "exod": "Exodus", "exodus": "Exodus",
-    "lev": "Leviticus", "leviticus": "Leviticus",
-    "num": "Numbers", "numbers": "Numbers",
-    "deut": "Deuteronomy", "dt": "Deuteronomy", "deuteronomy": "Deuteronomy",
-    "josh": "Joshua", "joshua": "Joshua",
-    "judg": "Judges", "judges": "Judges",
-    "ruth": "Ruth",
-    "1sam": "1 Samuel", "1 samuel": "1 Samuel",
-    "2sam": "2 Samuel", "2 samuel": "2 Samuel",
-    "1kgs": "1 Kings", "1 kings": "1 Kings",
-    "2kgs": "2 Kings", "2 kings": "2 Kings",
-    "1chr": "1 Chronicles", "1 chronicles": "1 Chronicles",
-    "2chr": "2 Chronicles", "2 chronicles": "2 Chronicles",
-    "ezra": "Ezra",
-    "neh": "Nehemiah", "nehemiah": "Nehemiah",
-    "esth": "Esther", "esther": "Esther",
-    "job": "Job",
-    "ps": "Psalms", "psa": "Psalms", "psalms": "Psalms",
-    "prov": "Proverbs", "proverbs": "Proverbs",
-    "eccl": "Ecclesiastes", "ecclesiastes": "Ecclesiastes",
-    "song": "Song of Solomon", "sos": "Song of Solomon",
-    "isa": "Isaiah", "isaiah": "Isaiah",
-    "jer": "Jeremiah", "jeremiah": "Jeremiah",
-    "lam": "Lamentations", "lamentations": "Lamentations",
-    "ezek": "Ezekiel", "ezekiel": "Ezekiel",
-    "dan": "Daniel", "daniel": "Daniel",
-    "hos": "Hosea", "hosea": "Hosea",
-    "joel": "Joel",
-    "amos": "Amos",
-    "obad": "Obadiah", "obadiah": "Obadiah",
-    "jonah": "Jonah",
-    "mic": "Micah", "micah": "Micah",
-    "nah": "Nahum", "nahum": "Nahum",
-    "hab": "Habakkuk", "habakkuk": "Habakkuk",
-    "zeph": "Zephaniah", "zephaniah": "Zephaniah",
-    "hag": "Haggai", "haggai": "Haggai",
-    "zech": "Zechariah", "zechariah": "Zechariah",
-    "mal": "Malachi", "malachi": "Malachi",
-
-    # New Testament
-    "matt": "Matthew", "mt": "Matthew", "matthew": "Matthew",
-    "mark": "Mark", "mk": "Mark",
-    "luke": "Luke", "lk": "Luke",
-    "john": "John", "jn": "John", "joh": "John",
-    "acts": "Acts",
-    "rom": "Romans", "romans": "Romans",
-    "1cor": "1 Corinthians", "1 corinthians": "1 Corinthians",
-    "2cor": "2 Corinthians", "2 corinthians": "2 Corinthians",
-    "gal": "Galatians", "galatians": "Galatians",
-    "eph": "Ephesians", "ephesians": "Ephesians",
-    "phil": "Philippians", "philippians": "Philippians",
-    "col": "Colossians", "colossians": "Colossians",
-    "1thess": "1 Thessalonians", "1 thessalonians": "1 Thessalonians",
-    "2thess": "2 Thessalonians", "2 thessalonians": "2 Thessalonians",
-    "1tim": "1 Timothy", "1 timothy": "1 Timothy",
-    "2tim": "2 Timothy", "2 timothy": "2 Timothy",
-    "titus": "Titus", "tit": "Titus",
-    "philem": "Philemon", "phlm": "Philemon", "philemon": "Philemon",
-    "heb": "Hebrews", "hebrews": "Hebrews",
-    "jas": "James", "james": "James",
-    "1pet": "1 Peter", "1 peter": "1 Peter",
-    "2pet": "2 Peter", "2 peter": "2 Peter",
-    "1john": "1 John", "1 john": "1 John",
-    "2john": "2 John", "2 john": "2 John",
-    "3john": "3 John", "3 john": "3 John",
-    "jude": "Jude",
-    "rev": "Revelation", "revelation": "Revelation",
-}
-
-# 독일어 약어 매핑
-BIBLE_ABBREVIATIONS_DE = {
-    # Altes Testament
-    "1mo": "1. Mose", "gen": "1. Mose", "genesis": "1. Mose",
-    "2mo": "Exodus", "ex": "Exodus", "exodus": "Exodus",
-    "3mo": "Levitikus", "lev": "Levitikus",
-    "4mo": "Numeri", "num": "Numeri",
-    "5mo": "Deuteronomium", "dtn": "Deuteronomium",
-    "jos": "Josua", "josua": "Josua",
-    "ri": "Richter", "richter": "Richter",
-    "rut": "Rut", "ruth": "Rut",
-    "1sam": "1. Samuel",
-    "2sam": "2. Samuel",
-    "1kön": "1. Könige", "1kön": "1. Könige",
-    "2kön": "2. Könige", "2kön": "2. Könige",
-    "1chr": "1. Chronik",
-    "2chr": "2. Chronik",
-    "esra": "Esra",
-    "neh": "Nehemia", "nehemia": "Nehemia",
-    "est": "Ester", "esther": "Ester",
-    "hiob": "Hiob", "ijob": "Hiob",
-    "ps": "Psalm", "psalm": "Psalm", "psalmen": "Psalm",
-    "spr": "Sprüche", "sprüche": "Sprüche",
-    "pred": "Prediger", "koh": "Kohelet",
-    "hld": "Hohelied",
-    "jes": "Jesaja", "jesaja": "Jesaja",
-    "jer": "Jeremia", "jeremia": "Jeremia",
-    "klgl": "Klagelieder",
-    "hes": "Hesekiel", "ez": "Ezechiel",
-    "dan": "Daniel", "daniel": "Daniel",
-    "hos": "Hosea", "hosea": "Hosea",
-    "joel": "Joel",
-    "am": "Amos", "amos": "Amos",
-    "obd": "Obadja",
-    "jona": "Jona",
-    "mi": "Micha", "micha": "Micha",
-    "nah": "Nahum", "nahum": "Nahum",
-    "hab": "Habakuk", "habakuk": "Habakuk",
-    "zef": "Zefanja", "zefanja": "Zefanja",
-    "hag": "Haggai", "haggai": "Haggai",
-    "sach": "Sacharja", "sacharja": "Sacharja",
-    "mal": "Maleachi", "maleachi": "Maleachi",
-
-    # Neues Testament
-    "mt": "Matthäus", "matt": "Matthäus", "matthäus": "Matthäus",
-    "mk": "Markus", "markus": "Markus",
-    "lk": "Lukas", "lukas": "Lukas",
-    "joh": "Johannes", "johannes": "Johannes",
-    "apg": "Apostelgeschichte",
-    "röm": "Römer", "römer": "Römer",
-    "1kor": "1. Korinther",
-    "2kor": "2. Korinther",
-    "gal": "Galater", "galater": "Galater",
-    "eph": "Epheser", "epheser": "Epheser",
-    "phil": "Philipper", "philipper": "Philipper",
-    "kol": "Kolosser", "kolosser": "Kolosser",
-    "1thess": "1. Thessalonicher",
-    "2thess": "2. Thessalonicher",
-    "1tim": "1. Timotheus",
-    "2tim": "2. Timotheus",
-    "tit": "Titus", "titus": "Titus",
-    "phlm": "Philemon", "philemon": "Philemon",
-    "hebr": "Hebräer", "hebräer": "Hebräer",
-    "jak": "Jakobus", "jakobus": "Jakobus",
-    "1petr": "1. Petrus",
-    "2petr": "2. Petrus",
-    "1joh": "1. Johannes",
-    "2joh": "2. Johannes",
-    "3joh": "3. Johannes",
-    "jud": "Judas", "judas": "Judas",
-    "offb": "Offenbarung", "offenbarung": "Offenbarung",
-}
-
 import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from .bible_books import (
+    FUZZY_MIN_CONFIDENCE, resolve_book, fuzzy_resolve_book, book_name, detect_language, normalize_language
+)
+
+# 책 이름: 한글/라틴 문자, 숫자로 시작하는 책(1 Samuel, 1. Mose, 1Kor), "요한1서", 여러 단어 책(Song of Solomon)
+BOOK_PATTERN = r'(?:[1-3]\.?\s*)?(?:[가-힣]+[1-3]서|[가-힣A-Za-zÄÖÜäöüß]+(?:\s+[A-Za-zÄÖÜäöüß]+)*)'
+REFERENCE_PATTERN = re.compile(rf'^({BOOK_PATTERN})\s*(\d+)(?::(\d+(?:-\d+)?))?$')
+GROUP_PATTERN = re.compile(rf'^({BOOK_PATTERN})?\s*(\d.*)?$')
+ITEM_PATTERN = re.compile(r'^(?:(\d+)\s*:\s*)?(\d+)(?:\s*-\s*(?:(\d+)\s*:\s*)?(\d+))?$')
+
+
+def resolve_book_name(book_abbrev: str, language: Optional[str] = None) -> Tuple[str, Optional[int], str, float]:
+    """
+    입력한 책 이름 → (언어별 전체 이름, 책 번호, 언어, 신뢰도)
+    별칭에 없으면 오타 교정 (예: "요한북음" → 요한복음, 신뢰도 0.91)
+    교정 신뢰도가 FUZZY_MIN_CONFIDENCE보다 낮으면 (입력 그대로, None, 감지한 언어, 0.0)
+    """
+    match = resolve_book(book_abbrev, language)
+    if match is not None:
+        return book_name(match.number, match.language), match.number, match.language, 1.0
+
+    fuzzy = fuzzy_resolve_book(book_abbrev, language)
+    if fuzzy is not None and fuzzy.confidence >= FUZZY_MIN_CONFIDENCE:
+        return book_name(fuzzy.number, fuzzy.language), fuzzy.number, fuzzy.language, fuzzy.confidence
+    return book_abbrev, None, normalize_language(language) or detect_language(book_abbrev), 0.0
 
-def parse_bible_reference(reference: str, language: str = "korean") -> dict:
+def parse_bible_reference(reference: str, language: Optional[str] = None) -> dict:
     """
     성경 참조를 파싱하여 책, 장, 절 정보를 반환
+    책 이름은 모든 지원 언어에서 찾아 정규 책 번호(book_id, 1-66)로 변환
+    별칭에 없는 이름은 오타로 보고 가장 가까운 책으로 교정 (confidence: 1.0이면 정확히 일치)
+
+    Args:
+        language: 언어 힌트 (같은 약어가 여러 언어에 있을 때만 사용), 없으면 입력 문자로 감지
 
     예시:
-        "요 3:16" -> {"book": "요한복음", "chapter": 3, "verses": "16"}
-        "창1:1-5" -> {"book": "창세기", "chapter": 1, "verses": "1-5"}
-        "롬8" -> {"book": "로마서", "chapter": 8, "verses": None}
+        "요 3:16" -> {"book": "요한복음", "book_id": 43, "chapter": 3, "verses": "16"}
+        "창1:1-5" -> {"book": "창세기", "book_id": 1, "chapter": 1, "verses": "1-5"}
+        "1. Mose 1" -> {"book": "1. Mose", "book_id": 1, "language": "german", ...}
     """
-    # 언어별 약어 선택
-    if language.lower() in ["korean", "ko", "한국어"]:
-        abbreviations = BIBLE_ABBREVIATIONS_KR
-    elif language.lower() in ["english", "en", "영어"]:
-        abbreviations = BIBLE_ABBREVIATIONS_EN
-    elif language.lower() in ["german", "de", "deutsch", "독일어"]:
-        abbreviations = BIBLE_ABBREVIATIONS_DE
-    else:
-        abbreviations = BIBLE_ABBREVIATIONS_KR
-
-    # 공백 제거 및 소문자 변환
     reference = reference.strip()
 
     # 패턴 매칭: 책이름 장:절
-    # 예: "요 3:16", "창세기 1:1-5", "롬8:28-30", "창1:1"
+    # 예: "요 3:16", "창세기 1:1-5", "롬8:28-30", "창1:1", "1 Cor 13:4"
     # 책이름 뒤에 공백 없이 숫자가 올 수 있음 (창1:1)
-    pattern = r'^([가-힣a-zA-Z]+)\s*(\d+)(?::(\d+(?:-\d+)?))?$'
-    match = re.match(pattern, reference)
+    match = REFERENCE_PATTERN.match(reference)
 
     if not match:
         return {
             "original": reference,
             "book": None,
+            "book_id": None,
             "chapter": None,
             "verses": None,
             "error": "Invalid format"
@@ -264,18 +67,153 @@ def parse_bible_reference(reference: str, language: str = "korean") -> dict:
     chapter = int(match.group(2)) if match.group(2) else None
     verses = match.group(3) if match.group(3) else None
 
-    # 약어를 전체 이름으로 변환
-    book_full = abbreviations.get(book_abbrev, book_abbrev)
+    # 약어를 전체 이름과 책 번호로 변환 (오타는 교정)
+    book_full, book_id, book_language, confidence = resolve_book_name(book_abbrev, language)
 
     return {
         "original": reference,
         "book": book_full,
         "book_abbrev": book_abbrev,
+        "book_id": book_id,
+        "language": book_language,
+        "confidence": confidence,
         "chapter": chapter,
         "verses": verses,
         "formatted": format_reference(book_full, chapter, verses)
     }
 
+def parse_bible_references(reference: str, language: Optional[str] = None) -> List[dict]:
+    """
+    쉼표(,)와 세미콜론(;)으로 이어진 여러 성경 참조를 구절 구간 목록으로 파싱
+    같은 입력은 한 번만 파싱 (결과는 호출마다 새 dict)
+
+    - 세미콜론은 새 참조를 시작 (책 이름을 생략하면 앞 참조의 책을 이어 씀)
+    - 쉼표 뒤의 숫자는 같은 장의 절, "장:절"은 같은 책의 다른 장
+    - "장:절-장:절"은 장을 넘는 구간, "장-장"은 여러 장 전체, 책 이름만 쓰면 책 전체
+
+    예시:
+        "요3:16,18; 롬8:28-30; 롬8:35-39"
+        -> [요 3:16, 요 3:18, 롬 8:28-30, 롬 8:35-39]
+        "롬8:28, 9:1-3; 12" -> [롬 8:28, 롬 9:1-3, 롬 12]
+        "창1:26-2:3" -> [창 1:26-2:3]
+        "John 3:16; 1 Cor 13:4-7" -> [요 3:16, 고전 13:4-7] (book_id 43, 46)
+
+    Returns:
+        [{"book", "book_abbrev", "book_id", "language", "confidence", "chapter", "verse_start",
+          "chapter_end", "verse_end", "verses", "formatted"}, ...]
+        verse_start/verse_end가 None이면 장 처음/끝, chapter_end가 None이면 책 끝까지,
+        book_id가 None이면 모르는 책
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    return [dict(segment) for segment in _parse_bible_references(reference, normalize_language(language))]
+
+@lru_cache(maxsize=1024)
+def _parse_bible_references(reference: str, language: Optional[str]) -> Tuple[dict, ...]:
+    """parse_bible_references 본체 (메모이즈, 반환한 dict는 수정하지 않음)"""
+    segments = []
+    book = None
+    for group in reference.split(';'):
+        group = group.strip()
+        if not group:
+            continue
+
+        group_match = GROUP_PATTERN.match(group)
+        if not group_match:
+            raise ValueError(f"Invalid format: {group}")
+        if group_match.group(1):
+            book_abbrev = group_match.group(1)
+            book = (book_abbrev,) + resolve_book_name(book_abbrev, language)
+        if not book:
+            raise ValueError(f"Book is required: {group}")
+
+        # 책 이름만 있으면 책 전체
+        if not group_match.group(2):
+            segments.append(_make_segment(book, 1, None, None, None))
+            continue
+
+        chapter = None
+        has_verses = False
+        for item in group_match.group(2).split(','):
+            item = item.strip()
+            item_match = ITEM_PATTERN.match(item)
+            if not item_match:
+                raise ValueError(f"Invalid format: {item}")
+            start_chapter, start_number, end_chapter, end_number = (
+                int(g) if g else None for g in item_match.groups()
+            )
+
+            if start_chapter is not None or (chapter is not None and has_verses):
+                # "장:절", "장:절-절", "장:절-장:절" 또는 쉼표 뒤의 같은 장 "절-절"
+                if start_chapter is not None:
+                    chapter = start_chapter
+                verse_start = start_number
+                chapter_end = end_chapter if end_chapter is not None else chapter
+                verse_end = end_number if end_number is not None else verse_start
+                has_verses = True
+            else:
+                # "장", "장-장" 또는 "장-장:절"
+                chapter = start_number
+                verse_start = None
+                chapter_end = end_chapter if end_chapter is not None else (end_number or chapter)
+                verse_end = end_number if end_chapter is not None else None
+
+            if (chapter_end, verse_end or 0) < (chapter, verse_start or 0) or chapter_end < chapter:
+                raise ValueError(f"Invalid verse range: {item}")
+
+            segments.append(_make_segment(book, chapter, verse_start, chapter_end, verse_end))
+            chapter = chapter_end
+
+    if not segments:
+        raise ValueError(f"Invalid format: {reference}")
+    return tuple(segments)
+
+def _make_segment(book: Tuple[str, str, Optional[int], str, float], chapter: int, verse_start: Optional[int],
+                  chapter_end: Optional[int], verse_end: Optional[int]) -> dict:
+    """
+    구절 구간 dict 생성
+
+    book: (입력한 책 이름, 전체 이름, 책 번호, 언어, 신뢰도)
+    verse_start가 None이면 장 처음부터, verse_end가 None이면 chapter_end 장 끝까지,
+    chapter_end가 None이면 책 끝까지
+    """
+    book_abbrev, book_full, book_id, language, confidence = book
+    if chapter_end is None:
+        # 책 전체
+        verses = None
+        formatted = book_full
+    elif chapter_end == chapter:
+        if verse_start is None:
+            verses = None
+        elif verse_start == verse_end:
+            verses = str(verse_start)
+        else:
+            verses = f"{verse_start}-{verse_end}"
+        formatted = format_reference(book_full, chapter, verses)
+    elif verse_start is None and verse_end is None:
+        # 여러 장 전체 (예: 시1-3)
+        verses = None
+        formatted = f"{book_full} {chapter}-{chapter_end}"
+    else:
+        # 장을 넘는 구간 (예: 창1:26-2:3)
+        verses = f"{verse_start or 1}-{chapter_end}:{verse_end}"
+        formatted = f"{book_full} {chapter}:{verses}"
+
+    return {
+        "book": book_full,
+        "book_abbrev": book_abbrev,
+        "book_id": book_id,
+        "language": language,
+        "confidence": confidence,
+        "chapter": chapter,
+        "verse_start": verse_start,
+        "chapter_end": chapter_end,
+        "verse_end": verse_end,
+        "verses": verses,
+        "formatted": formatted
+    }
+
 def format_reference(book: str, chapter: int = None, verses: str = None) -> str:
     """성경 참조를 포맷팅"""
     result = book
@@ -288,14 +226,21 @@ def format_reference(book: str, chapter: int = None, verses: str = None) -> str:
 # 테스트
 if __name__ == "__main__":
     test_cases = [
-        ("요 3:16", "korean"),
-        ("창1:1-5", "korean"),
-        ("롬8:28-30", "korean"),
-        ("시편 23", "korean"),
-        ("계 21:1-4", "korean"),
-        ("John 3:16", "english"),
+        ("요 3:16", None),
+        ("요한복음 3:16", None),
+        ("창1:1-5", None),
+        ("롬8:28-30", None),
+        ("시편 23", None),
+        ("계 21:1-4", None),
+        ("John 3:16", None),
+        ("1 Cor 13:4", None),
         ("Gen 1:1", "english"),
         ("Joh 3:16", "german"),
+        ("1. Mose 1:1", None),
+        ("Röm 8:28", None),
+        ("요한북음 3:16", None),
+        ("Jhn 3:16", None),
+        ("Johanes 3:16", None),
     ]
 
     print("="*60)
@@ -305,7 +250,7 @@ if __name__ == "__main__":
     for ref, lang in test_cases:
         result = parse_bible_reference(ref, lang)
         print(f"\n입력: {ref} ({lang})")
-        print(f"  책: {result['book']}")
+        print(f"  책: {result['book']} ({result['book_id']}, {result.get('language')}, 신뢰도 {result.get('confidence')})")
         print(f"  장: {result['chapter']}")
         print(f"  절: {result['verses']}")
         print(f"  포맷: {result['formatted']}")
@@ -0,0 +1,171 @@
+"""
+바이트 예산 기반 LRU 캐시
+메모리 사용량(추정 바이트)이 예산을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+모든 캐시는 프로세스 전체 메모리 예산(memory_budget)에 등록되어 전체 상한도 함께 적용됨
+"""
+import sys
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .memory_budget import get_memory_budget
+
+
+def estimate_size(value: Any) -> int:
+    """값의 대략적인 메모리 크기(바이트) 추정"""
+    if isinstance(value, (str, bytes, bytearray)):
+        return sys.getsizeof(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """
+    바이트 예산 LRU 캐시 (스레드 안전)
+
+    각 항목은 validator(예: 파일 수정 시각)와 함께 저장되고,
+    조회 시 validator가 다르면 만료된 것으로 보고 제거
+    """
+
+    def __init__(self, name: str, max_bytes: int, sizeof: Callable[[Any], int] = estimate_size,
+                 weight: float = 1.0):
+        """
+        Args:
+            name: 캐시 이름 (통계 표시용)
+            max_bytes: 메모리 예산 (바이트), 0이면 캐시 사용 안 함
+            sizeof: 값 크기 추정 함수
+            weight: 항목을 다시 만드는 비용 가중치 (클수록 전체 예산 초과 시 늦게 제거)
+        """
+        self.name = name
+        self.max_bytes = max_bytes
+        self.weight = weight
+        self._sizeof = sizeof
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._budget = get_memory_budget()
+        self._budget.register(self)
+
+    def get(self, key: Hashable, validator: Any = None) -> Optional[Any]:
+        """
+        캐시 조회
+
+        Args:
+            key: 캐시 키
+            validator: 저장 당시 validator와 다르면 만료 처리
+
+        Returns:
+            캐시된 값, 없거나 만료되었으면 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, size, stored_validator, _ = entry
+            if stored_validator != validator:
+                self._remove(key)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+
+            self._entries[key] = (value, size, stored_validator, time.monotonic())
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, validator: Any = None, size: int = None):
+        """
+        캐시 저장 (예산을 넘으면 오래된 항목부터 제거, 전체 메모리 예산을 넘으면 다른 캐시 항목도 제거)
+
+        Args:
+            size: 값 크기 (생략하면 sizeof로 추정)
+        """
+        if size is None:
+            size = self._sizeof(value)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # 예산보다 큰 항목은 저장하지 않음
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (value, size, validator, time.monotonic())
+            self.current_bytes += size
+
+            while self.current_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+        self._budget.enforce()
+
+    def oldest(self) -> Optional[Tuple[Hashable, int, float]]:
+        """가장 오래 사용하지 않은 항목 (키, 크기, 마지막 사용 시각), 비어 있으면 None"""
+        with self._lock:
+            for key, (_, size, _, last_used) in self._entries.items():
+                return key, size, last_used
+            return None
+
+    def evict(self, key: Hashable) -> Optional[int]:
+        """
+        전체 메모리 예산 초과로 항목 제거 (MemoryBudget이 호출)
+
+        Returns:
+            제거한 크기, 가장 오래된 항목이 아니게 되었거나(그 사이 사용됨) 없으면 None
+        """
+        with self._lock:
+            if not self._entries or next(iter(self._entries)) != key:
+                return None
+            size = self._entries[key][1]
+            self._remove(key)
+            self.evictions += 1
+            return size
+
+    def invalidate(self, key: Hashable):
+        """항목 제거"""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        """전체 비우기"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _remove(self, key: Hashable):
+        """항목 제거 (lock 안에서 호출)"""
+        _, size, _, _ = self._entries.pop(key)
+        self.current_bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
@@ -0,0 +1,77 @@
+"""
+Reference 데이터 컴파일러
+Reference 폴더의 성경/찬송가 마크다운을 하나의 체크섬 포함 바이너리 팩으로 변환
+
+사용법:
+    python -m backend.compile_reference
+    python -m backend.compile_reference --bible <성경 폴더> --hymns <찬송가 폴더> --output <팩 경로>
+"""
+import argparse
+import time
+
+from .bible_loader import BibleLoader, extract_verse_texts
+from .hymn_loader import HymnLoader
+from .reference_pack import ReferencePackBuilder, ReferencePack, DEFAULT_PACK_PATH
+from .verse_index import scan_chapter_files
+
+
+def compile_reference(bible_path: str = None, hymn_path: str = None, output_path: str = None) -> dict:
+    """
+    성경과 찬송가를 읽어 Reference 팩 생성
+
+    Args:
+        bible_path: 성경 폴더 (기본: BibleLoader 자동 탐색)
+        hymn_path: 찬송가 폴더 (기본: HymnLoader 자동 탐색)
+        output_path: 팩 저장 경로 (기본: backend/reference.pack)
+
+    Returns:
+        요약 정보
+    """
+    bible_loader = BibleLoader(bible_path)
+    hymn_loader = HymnLoader(hymn_path)
+    builder = ReferencePackBuilder()
+
+    # 1. 성경 (장 단위)
+    chapter_files = scan_chapter_files(bible_loader.bible_path) if bible_loader.bible_path else []
+    for book_number, chapter, path in chapter_files:
+        with open(path, 'r', encoding='utf-8') as f:
+            builder.add_chapter(book_number, chapter, extract_verse_texts(f.read()))
+
+    if not chapter_files:
+        raise ValueError("성경 데이터를 찾을 수 없습니다. Reference 폴더를 확인하세요.")
+
+    # 2. 찬송가
+    for number, path in sorted(hymn_loader.scan_hymn_files().items()):
+        with open(path, 'r', encoding='utf-8') as f:
+            hymn = hymn_loader._parse_hymn_content(f.read(), number)
+        builder.add_hymn(number, hymn["title"], hymn["verses"], hymn["chorus"])
+
+    return builder.write(output_path or DEFAULT_PACK_PATH)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reference 데이터를 바이너리 팩으로 컴파일")
+    parser.add_argument("--bible", help="성경 폴더 경로 (기본: backend/Reference 자동 탐색)")
+    parser.add_argument("--hymns", help="찬송가 폴더 경로 (기본: backend/Reference 자동 탐색)")
+    parser.add_argument("--output", help=f"팩 저장 경로 (기본: {DEFAULT_PACK_PATH})")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    summary = compile_reference(args.bible, args.hymns, args.output)
+    elapsed = time.perf_counter() - started
+
+    # 작성한 팩을 다시 열어 체크섬 검증
+    ReferencePack(summary["path"]).close()
+
+    print("=" * 60)
+    print(f"✅ Reference 팩 생성 완료 ({elapsed:.2f}초)")
+    print(f"   경로: {summary['path']}")
+    print(f"   성경: {summary['chapters']}개 장, {summary['verses']}개 절")
+    print(f"   찬송가: {summary['hymns']}곡")
+    print(f"   크기: {summary['size'] / 1024 / 1024:.2f} MB")
+    print(f"   SHA-256: {summary['sha256']}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+생성된 덱 캐시 (내용 주소 기반)
+요청(SlideConfig, Reference 데이터에서 읽은 본문/가사 포함)의 해시를 키로,
+메모리(LRU, 바이트 예산)와 디스크(용량 상한, 오래 안 쓴 파일부터 삭제) 두 단계로 보관
+"""
+import os
+import time
+import shutil
+import tempfile
+import threading
+from typing import Dict, Optional
+
+from .cache import LRUCache
+from .artifacts import DeckOutput, DECK_SPOOL_BYTES
+from .instrumentation import get_logger
+
+logger = get_logger("DeckCache")
+
+# 메모리 캐시 예산 (바이트)
+DECK_CACHE_BYTES = int(os.getenv("DECK_CACHE_BYTES", str(64 * 1024 * 1024)))
+# 디스크 캐시 폴더와 용량 상한 (바이트, 0이면 디스크 캐시 사용 안 함)
+DECK_CACHE_DIR = os.getenv("DECK_CACHE_DIR", os.path.join(tempfile.gettempdir(), "sermon-slides-cache"))
+DECK_DISK_CACHE_BYTES = int(os.getenv("DECK_DISK_CACHE_BYTES", str(256 * 1024 * 1024)))
+# 최근 사용한 디스크 캐시 파일은 이 시간(초) 동안 용량 정리에서 제외 (응답으로 내려보내는 중일 수 있음)
+DECK_DISK_GRACE_SECONDS = int(os.getenv("DECK_DISK_GRACE_SECONDS", "600"))
+
+
+class DeckCache:
+    """메모리 + 디스크 2단계 덱 캐시 (스레드 안전)"""
+
+    def __init__(self, directory: str, memory_bytes: int, disk_bytes: int,
+                 grace_seconds: int = DECK_DISK_GRACE_SECONDS):
+        self.directory = directory
+        self.disk_bytes = disk_bytes
+        self.grace_seconds = grace_seconds
+        # 덱은 다시 만드는 비용이 가장 크므로 전체 메모리 예산 초과 시 가장 늦게 제거
+        self.memory = LRUCache("decks", memory_bytes, sizeof=len, weight=4.0)
+        self._disk_lock = threading.Lock()
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pptx")
+
+    def get(self, key: str) -> Optional[DeckOutput]:
+        """
+        캐시 조회 (메모리 → 디스크)
+        디스크에서 찾은 작은 덱은 메모리로 올림
+
+        Returns:
+            DeckOutput (디스크 파일이면 temporary=False), 없으면 None
+        """
+        data = self.memory.get(key)
+        if data is not None:
+            return DeckOutput(data, None, len(data))
+
+        if self.disk_bytes <= 0:
+            return None
+
+        path = self._path(key)
+        try:
+            size = os.path.getsize(path)
+            # 최근 사용 시각 갱신 (디스크 용량 정리 순서)
+            os.utime(path)
+            if size <= DECK_SPOOL_BYTES:
+                with open(path, "rb") as f:
+                    data = f.read()
+        except FileNotFoundError:
+            self.disk_misses += 1
+            return None
+
+        self.disk_hits += 1
+        if data is not None:
+            self.memory.put(key, data)
+            return DeckOutput(data, None, size)
+        return DeckOutput(None, path, size)
+
+    def put(self, key: str, output: DeckOutput) -> DeckOutput:
+        """
+        캐시 저장
+
+        Returns:
+            응답에 사용할 DeckOutput (큰 덱의 산출물 파일은 디스크 캐시로 옮겨지면 temporary=False)
+        """
+        if output.data is not None:
+            self.memory.put(key, output.data)
+
+        if self.disk_bytes <= 0 or output.size > self.disk_bytes:
+            return output
+
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if output.data is not None:
+                fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(output.data)
+                os.replace(tmp_path, path)
+            else:
+                shutil.move(output.path, path)
+                output = DeckOutput(None, path, output.size)
+        except OSError as e:
+            logger.warning("⚠️ 디스크 캐시 저장 실패: %s", e)
+            return output
+
+        self._trim_disk()
+        return output
+
+    def _trim_disk(self):
+        """
+        디스크 캐시가 용량 상한을 넘으면 오래 안 쓴 파일부터 삭제
+        최근 grace_seconds 안에 저장/조회한 파일은 응답 중일 수 있으므로 남김 (그동안은 상한을 잠시 넘을 수 있음)
+        """
+        in_use_after = time.time() - self.grace_seconds
+        with self._disk_lock:
+            files = []
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".pptx") and entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        files.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in files)
+            for mtime, size, path in sorted(files):
+                if total <= self.disk_bytes or mtime > in_use_after:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def disk_usage(self) -> Dict:
+        """디스크 캐시 파일 수와 크기"""
+        files = 0
+        total = 0
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".pptx") and entry.is_file(follow_symlinks=False):
+                        files += 1
+                        total += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            pass
+        return {"files": files, "bytes": total, "max_bytes": self.disk_bytes}
+
+    def stats(self) -> Dict:
+        """캐시 통계 (메모리 LRU + 디스크)"""
+        return {
+            "memory": self.memory.stats(),
+            "disk": dict(self.disk_usage(), hits=self.disk_hits, misses=self.disk_misses)
+        }
+
+
+# 전역 인스턴스
+_deck_cache = None
+_deck_cache_lock = threading.Lock()
+
+def get_deck_cache() -> DeckCache:
+    """덱 캐시 싱글톤"""
+    global _deck_cache
+    if _deck_cache is None:
+        with _deck_cache_lock:
+            if _deck_cache is None:
+                _deck_cache = DeckCache(DECK_CACHE_DIR, DECK_CACHE_BYTES, DECK_DISK_CACHE_BYTES)
+    return _deck_cache
@@ -0,0 +1,34 @@
+"""
+편집 세션 (부분 재생성)
+예배 준비 중 구절 하나를 바꾸거나 찬송가 순서를 바꿔 다시 생성할 때,
+세션마다 마지막 덱의 구역(제목, 예배 순서, 성경 구절, 찬송가)별 슬라이드 파트를 보관해 두고
+바뀐 구역만 다시 그려 패키지를 조립
+"""
+import os
+from typing import Dict, Tuple
+
+from .cache import LRUCache
+
+# 편집 세션 캐시 메모리 예산 (바이트, 0이면 사용 안 함)
+EDIT_SESSION_BYTES = int(os.getenv("EDIT_SESSION_BYTES", str(32 * 1024 * 1024)))
+# 세션 ID 최대 길이
+MAX_SESSION_ID_LENGTH = 128
+
+# 구역 하나의 슬라이드 파트: ((슬라이드 XML, 관계 파일 XML), ...)
+SectionParts = Tuple[Tuple[bytes, bytes], ...]
+
+
+def _sections_size(sections: Dict[str, SectionParts]) -> int:
+    return sum(
+        len(key) + sum(len(slide_xml) + len(rels_xml) for slide_xml, rels_xml in parts)
+        for key, parts in sections.items()
+    )
+
+
+# 세션 ID → {구역 키: 슬라이드 파트} (마지막으로 생성한 덱의 구역만 보관)
+_edit_sessions = LRUCache("edit-sessions", EDIT_SESSION_BYTES, sizeof=_sections_size, weight=2.0)
+
+
+def get_edit_sessions() -> LRUCache:
+    """편집 세션 캐시"""
+    return _edit_sessions
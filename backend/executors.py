@@ -0,0 +1,164 @@
+"""
+블로킹 작업 실행기
+- I/O 작업 (성경/찬송가 로드 등): 크기가 제한된 스레드 풀
+- CPU 작업 (python-pptx 덱 생성): 프로세스 풀 (RENDER_PROCESSES=0이면 스레드 풀 사용)
+async 엔드포인트가 이벤트 루프를 막지 않도록 여기서 실행
+"""
+import io
+import os
+import asyncio
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor
+from typing import Any, AsyncIterator, Callable, Optional
+
+from .instrumentation import current_timing, in_current_context, collect_stages
+
+# I/O 스레드 수
+IO_WORKERS = int(os.getenv("IO_WORKERS", "8"))
+# 덱 생성 프로세스 수 (0이면 프로세스 풀 대신 I/O 스레드 풀에서 생성)
+RENDER_PROCESSES = int(os.getenv("RENDER_PROCESSES", "1"))
+
+_io_executor: Optional[ThreadPoolExecutor] = None
+_render_executor: Optional[Executor] = None
+_executor_lock = threading.RLock()
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """I/O 스레드 풀 싱글톤"""
+    global _io_executor
+    if _io_executor is None:
+        with _executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="io")
+    return _io_executor
+
+
+def get_render_executor() -> Executor:
+    """덱 생성 프로세스 풀 싱글톤"""
+    global _render_executor
+    if _render_executor is None:
+        with _executor_lock:
+            if _render_executor is None:
+                if RENDER_PROCESSES > 0:
+                    # fork 시 부모의 스레드 풀/락 상태가 복사되지 않도록 spawn 사용
+                    _render_executor = ProcessPoolExecutor(
+                        max_workers=RENDER_PROCESSES,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                else:
+                    _render_executor = get_io_executor()
+    return _render_executor
+
+
+async def run_io(func: Callable, *args, **kwargs) -> Any:
+    """I/O 스레드 풀에서 실행하고 결과를 기다림 (요청 타이밍 컨텍스트 유지)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_io_executor(), in_current_context(func, *args, **kwargs))
+
+
+async def run_render(func: Callable, *args) -> Any:
+    """
+    덱 생성 프로세스 풀에서 실행하고 결과를 기다림
+    func와 인자는 pickle 가능해야 함 (모듈 최상위 함수, pydantic 모델 등)
+    요청 타이밍 중이면 워커에서 측정한 단계 시간을 받아 현재 요청에 합침
+    """
+    loop = asyncio.get_running_loop()
+    timing = current_timing()
+    if timing is None:
+        return await loop.run_in_executor(get_render_executor(), func, *args)
+
+    result, stages = await loop.run_in_executor(get_render_executor(), collect_stages, func, *args)
+    timing.merge(stages)
+    return result
+
+
+class _QueueWriter(io.RawIOBase):
+    """
+    I/O 스레드에서 쓴 바이트를 이벤트 루프의 asyncio.Queue로 넘기는 쓰기 전용 스트림
+    작은 쓰기는 모아서 넘기고, 큐가 차면 생산 스레드가 기다림 (소비 속도에 맞춤)
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        self._loop = loop
+        self._queue = queue
+        self._buffer = bytearray()
+        self.cancelled = False
+        self._stopped = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self.cancelled:
+            # 생산 코드를 멈추기 위해 한 번만 예외를 내고, 이후 정리 중의 쓰기(zip 닫기 등)는 버림
+            if self._stopped:
+                return len(data)
+            self._stopped = True
+            raise OSError("스트림 소비가 중단되었습니다")
+        self._buffer += data
+        if len(self._buffer) >= self.CHUNK_SIZE:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+        return len(data)
+
+    def finish(self):
+        """남은 바이트와 종료 표시 전달"""
+        if self._buffer and not self.cancelled:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+        self._put(None)
+
+    def _put(self, item):
+        asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop).result()
+
+
+async def stream_io(func: Callable, *args, max_chunks: int = 16) -> AsyncIterator[bytes]:
+    """
+    func(output, *args)를 I/O 스레드 풀에서 실행하면서 output에 쓰인 바이트를 바로 내보냄
+    (전체 결과를 메모리나 파일에 모으지 않고 응답으로 스트리밍할 때 사용)
+
+    func에서 난 예외는 스트림 끝에서 다시 발생
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_chunks)
+    writer = _QueueWriter(loop, queue)
+
+    def produce():
+        try:
+            func(writer, *args)
+        finally:
+            writer.finish()
+
+    future = loop.run_in_executor(get_io_executor(), in_current_context(produce))
+    try:
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            yield chunk
+        await future
+    finally:
+        if not future.done():
+            # 클라이언트 연결이 끊긴 경우: 생산 스레드를 멈추고 대기 중인 put을 풀어줌
+            writer.cancelled = True
+            while not future.done():
+                while not queue.empty():
+                    queue.get_nowait()
+                await asyncio.sleep(0.01)
+            # 중단으로 생긴 예외는 의도된 것이므로 확인만 하고 버림
+            future.exception()
+
+
+def shutdown():
+    """서버 종료 시 실행기 정리"""
+    global _io_executor, _render_executor
+    with _executor_lock:
+        if _render_executor is not None and _render_executor is not _io_executor:
+            _render_executor.shutdown(wait=False, cancel_futures=True)
+        if _io_executor is not None:
+            _io_executor.shutdown(wait=False, cancel_futures=True)
+        _io_executor = None
+        _render_executor = None
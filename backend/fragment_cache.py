@@ -0,0 +1,125 @@
+"""
+슬라이드 조각 캐시
+찬송가와 고정 예배 순서(예배로의 부름, 축도 등)는 덱마다 같은 슬라이드가 반복되므로,
+구역 키(찬송가 번호/예배 순서 항목 + 스타일 해시)별로 직렬화된 슬라이드 파트를 요청 간에 공유
+
+- 바이트 예산 LRU로 크기를 관리하고 예산을 넘으면 오래 안 쓴 조각부터 제거
+- 찬송가 사용 횟수를 파일에 기록해 두고, 서버 시작 시 많이 쓰는 찬송가와 고정 예배 순서를 미리 생성
+"""
+import os
+import json
+import tempfile
+import threading
+from collections import Counter
+from typing import Dict, List
+
+from .cache import LRUCache
+from .edit_sessions import SectionParts
+from .instrumentation import get_logger
+
+logger = get_logger("FragmentCache")
+
+# 조각 캐시 메모리 예산 (바이트, 0이면 사용 안 함)
+FRAGMENT_CACHE_BYTES = int(os.getenv("FRAGMENT_CACHE_BYTES", str(16 * 1024 * 1024)))
+# 조각으로 공유하는 구역 종류
+FRAGMENT_KINDS = frozenset({"hymn", "order"})
+# 서버 시작 시 미리 생성할 찬송가 수 (사용 횟수 상위, 0이면 생략)
+FRAGMENT_WARM_HYMNS = int(os.getenv("FRAGMENT_WARM_HYMNS", "100"))
+# 서버 시작 시 미리 생성할 예배 순서 (쉼표 구분)
+FRAGMENT_WARM_ORDERS = [
+    title.strip()
+    for title in os.getenv(
+        "FRAGMENT_WARM_ORDERS",
+        "묵도,예배로의 부름,신앙고백,찬송,기도,성경봉독,설교,헌금,광고,축도"
+    ).split(",")
+    if title.strip()
+]
+# 찬송가 사용 횟수 기록 파일 (Reference 팩/검색 인덱스와 같은 폴더, 임시 폴더는 재시작마다 비워질 수 있음)
+FRAGMENT_USAGE_PATH = os.getenv(
+    "FRAGMENT_USAGE_PATH",
+    os.path.join(os.path.dirname(__file__), "hymn_usage.json")
+)
+
+
+def _parts_size(parts: SectionParts) -> int:
+    return sum(len(slide_xml) + len(rels_xml) for slide_xml, rels_xml in parts)
+
+
+# 구역 키 → 슬라이드 파트
+_fragment_cache = LRUCache("slide-fragments", FRAGMENT_CACHE_BYTES, sizeof=_parts_size, weight=2.0)
+
+
+def get_fragment_cache() -> LRUCache:
+    """슬라이드 조각 캐시"""
+    return _fragment_cache
+
+
+class HymnUsage:
+    """찬송가 사용 횟수 (미리 생성할 찬송가 선정용, 스레드 안전)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, hymn_number: int):
+        with self._lock:
+            self._counts[hymn_number] += 1
+
+    def most_used(self, limit: int) -> List[int]:
+        """사용 횟수 상위 찬송가 번호"""
+        with self._lock:
+            return [number for number, _ in self._counts.most_common(limit)]
+
+    def load(self) -> int:
+        """
+        기록 파일 읽기 (없거나 깨졌으면 무시)
+
+        Returns:
+            읽은 찬송가 수
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                counts: Dict[str, int] = json.load(f)
+            loaded = Counter({int(number): int(count) for number, count in counts.items()})
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("⚠️ 찬송가 사용 기록 읽기 실패: %s", e)
+            return 0
+
+        with self._lock:
+            self._counts.update(loaded)
+        return len(loaded)
+
+    def save(self):
+        """기록 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        with self._lock:
+            counts = {str(number): count for number, count in self._counts.items()}
+        if not counts:
+            return
+        try:
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(counts, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("⚠️ 찬송가 사용 기록 저장 실패: %s", e)
+
+
+# 전역 인스턴스
+_hymn_usage = None
+_hymn_usage_lock = threading.Lock()
+
+def get_hymn_usage() -> HymnUsage:
+    """찬송가 사용 기록 싱글톤 (처음 사용할 때 기록 파일 읽기)"""
+    global _hymn_usage
+    if _hymn_usage is None:
+        with _hymn_usage_lock:
+            if _hymn_usage is None:
+                usage = HymnUsage(FRAGMENT_USAGE_PATH)
+                usage.load()
+                _hymn_usage = usage
+    return _hymn_usage
@@ -4,7 +4,51 @@ Reference/새찬송가🎼 폴더에서 찬송가 가사 로드
 """
 import os
 import re
-from typing import Optional, Dict, List
+import sys
+import threading
+from typing import Optional, Dict, List, Tuple
+from .reference_pack import get_reference_pack
+from .cache import LRUCache
+from .instrumentation import get_logger, stage
+from .singleflight import SingleFlight
+
+logger = get_logger("HymnLoader")
+
+# 파싱된 찬송가 캐시 메모리 예산 (바이트, 전체 645곡이 수백 KB)
+HYMN_CACHE_BYTES = int(os.getenv("HYMN_CACHE_BYTES", str(4 * 1024 * 1024)))
+
+# 같은 찬송가의 동시 읽기 합치기
+_hymn_flight = SingleFlight("hymn")
+
+
+class HymnRecord:
+    """파싱된 찬송가 한 곡 (제목, 절 가사, 후렴)"""
+
+    __slots__ = ("number", "title", "verses", "chorus")
+
+    def __init__(self, number: int, title: str, verses: Tuple[str, ...], chorus: str):
+        self.number = number
+        self.title = title
+        self.verses = verses
+        self.chorus = chorus
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "HymnRecord":
+        return cls(data["number"], data["title"], tuple(data["verses"]), data["chorus"])
+
+    def size(self) -> int:
+        """대략적인 메모리 크기 (바이트, 캐시 예산용)"""
+        return (sys.getsizeof(self) + sys.getsizeof(self.title) + sys.getsizeof(self.chorus)
+                + sys.getsizeof(self.verses) + sum(sys.getsizeof(verse) for verse in self.verses))
+
+    def to_dict(self) -> Dict:
+        """load_hymn 응답 형식 (호출자가 수정해도 캐시는 그대로)"""
+        return {
+            "number": self.number,
+            "title": self.title,
+            "verses": list(self.verses),
+            "chorus": self.chorus
+        }
 
 
 class HymnLoader:
@@ -32,7 +76,7 @@ class HymnLoader:
                     if '찬송가' in item or '새찬송가' in item:
                         hymn_data_path = item_path
                         found = True
-                        print(f"[HymnLoader] 찬송가 폴더 발견: {item}")
+                        logger.info("찬송가 폴더 발견: %s", item)
                         break
 
                 # 내부 구조로 검색 (인코딩 깨져도 작동)
@@ -51,7 +95,7 @@ class HymnLoader:
                             if file_count >= 600:
                                 hymn_data_path = item_path
                                 found = True
-                                print(f"[HymnLoader] ✅ 찬송가 폴더 발견 (파일 수): {item} ({file_count}개)")
+                                logger.info("✅ 찬송가 폴더 발견 (파일 수): %s (%d개)", item, file_count)
                                 break
 
                             # 또는 _숫자.md 형식 파일이 있는지 확인
@@ -64,7 +108,7 @@ class HymnLoader:
                                             int(parts[-1].replace('.md', ''))
                                             hymn_data_path = item_path
                                             found = True
-                                            print(f"[HymnLoader] ✅ 찬송가 폴더 발견 (파일 형식): {item}")
+                                            logger.info("✅ 찬송가 폴더 발견 (파일 형식): %s", item)
                                             break
                                         except:
                                             continue
@@ -75,9 +119,13 @@ class HymnLoader:
 
                 if not found:
                     hymn_data_path = base_path
-                    print(f"[HymnLoader] ⚠️ 찬송가 폴더를 찾을 수 없어 Reference를 기본 경로로 사용")
+                    logger.warning("⚠️ 찬송가 폴더를 찾을 수 없어 Reference를 기본 경로로 사용")
 
         self.hymn_path = hymn_data_path
+        # {찬송가 번호: HymnRecord} - 파싱된 찬송가 (전체 메모리 예산에 포함)
+        self._records = LRUCache("hymns", HYMN_CACHE_BYTES, sizeof=HymnRecord.size)
+        # {찬송가 번호: 파일 경로}
+        self._hymn_files: Optional[Dict[int, str]] = None
 
     def load_hymn(self, hymn_number: int) -> Optional[Dict]:
         """
@@ -99,49 +147,86 @@ class HymnLoader:
             }
         """
         try:
-            if not self.hymn_path or not os.path.exists(self.hymn_path):
-                return None
-
-            # 찬송가 파일 찾기 (번호 기반, 인코딩 무관)
-            hymn_file = None
+            record = self._records.get(hymn_number)
+            if record is None:
+                # 같은 찬송가를 동시에 요청하면 한 번만 읽고 레코드를 함께 사용 (dict는 호출마다 새로 만듦)
+                record = _hymn_flight.do((self.hymn_path, hymn_number), self._read_record, hymn_number)
+                if record is None:
+                    return None
+            return record.to_dict()
 
-            if os.path.isdir(self.hymn_path):
-                # 파일 목록 가져오기
-                files = os.listdir(self.hymn_path)
+        except Exception as e:
+            logger.error("Error loading hymn: %s", e)
+            return None
 
-                # "_123.md" 형식으로 번호 찾기
-                for file in files:
-                    if not file.endswith('.md'):
-                        continue
+    def warm_up(self) -> int:
+        """
+        찬송가 전체를 미리 파싱해 캐시에 적재 (캐시 예산을 넘으면 오래된 곡부터 빠짐)
 
-                    # 파일명에서 번호 추출
-                    try:
-                        # "_123.md" → 123
-                        if '_' in file:
-                            number_part = file.split('_')[-1].replace('.md', '')
-                            file_number = int(number_part)
+        Returns:
+            적재된 찬송가 수
+        """
+        pack = get_reference_pack()
+        numbers = set(pack.hymn_numbers) if pack is not None else set()
+        numbers.update(self._get_hymn_files())
+
+        loaded = sum(1 for hymn_number in sorted(numbers) if self.load_hymn(hymn_number) is not None)
+
+        logger.info("✅ 찬송가 %d곡 적재 완료", loaded)
+        return loaded
+
+    def _read_record(self, hymn_number: int) -> Optional["HymnRecord"]:
+        """찬송가 하나를 읽어 캐시에 적재"""
+        with stage("read"):
+            record = self._load_record(hymn_number)
+        if record is not None:
+            self._records.put(hymn_number, record)
+        return record
+
+    def _load_record(self, hymn_number: int) -> Optional["HymnRecord"]:
+        """팩 또는 마크다운 파일에서 찬송가 하나를 읽어 레코드로 변환"""
+        # Reference 팩이 있으면 mmap에서 바로 조회
+        pack = get_reference_pack()
+        if pack is not None:
+            hymn = pack.hymn(hymn_number)
+            if hymn is not None:
+                return HymnRecord.from_dict(hymn)
+
+        # 번호 → 파일 경로 테이블에서 바로 찾기
+        hymn_file = self._get_hymn_files().get(hymn_number)
+        if not hymn_file or not os.path.exists(hymn_file):
+            return None
 
-                            if file_number == hymn_number:
-                                hymn_file = os.path.join(self.hymn_path, file)
-                                print(f"[HymnLoader] ✅ 찬송가 파일 발견: {file}")
-                                break
-                    except:
-                        continue
+        with open(hymn_file, 'r', encoding='utf-8') as f:
+            content = f.read()
 
-            if not hymn_file or not os.path.exists(hymn_file):
-                return None
+        return HymnRecord.from_dict(self._parse_hymn_content(content, hymn_number))
 
-            # 파일 읽기
-            with open(hymn_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+    def _get_hymn_files(self) -> Dict[int, str]:
+        """번호 → 파일 경로 테이블 (최초 사용 시 한 번만 스캔)"""
+        if self._hymn_files is None:
+            self._hymn_files = self.scan_hymn_files()
+        return self._hymn_files
 
-            # 파싱
-            result = self._parse_hymn_content(content, hymn_number)
-            return result
+    def scan_hymn_files(self) -> Dict[int, str]:
+        """
+        찬송가 폴더를 스캔해 번호별 파일 경로 반환
 
-        except Exception as e:
-            print(f"Error loading hymn: {e}")
-            return None
+        Returns:
+            {찬송가 번호: 파일 경로}
+        """
+        hymn_files = {}
+        if not self.hymn_path or not os.path.isdir(self.hymn_path):
+            return hymn_files
+
+        for file in os.listdir(self.hymn_path):
+            if not file.endswith('.md') or '_' not in file:
+                continue
+            # "_123.md" → 123
+            number_part = file.split('_')[-1].replace('.md', '')
+            if number_part.isdigit():
+                hymn_files[int(number_part)] = os.path.join(self.hymn_path, file)
+        return hymn_files
 
     def _parse_hymn_content(self, content: str, hymn_number: int) -> Dict:
         """
@@ -215,10 +300,13 @@ class HymnLoader:
 
 # 전역 인스턴스
 _hymn_loader = None
+_hymn_loader_lock = threading.Lock()
 
 def get_hymn_loader() -> HymnLoader:
-    """찬송가 로더 싱글톤"""
+    """찬송가 로더 싱글톤 (여러 스레드에서 동시에 호출해도 한 번만 생성)"""
     global _hymn_loader
     if _hymn_loader is None:
-        _hymn_loader = HymnLoader()
+        with _hymn_loader_lock:
+            if _hymn_loader is None:
+                _hymn_loader = HymnLoader()
     return _hymn_loader
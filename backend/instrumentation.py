@@ -0,0 +1,260 @@
+"""
+로깅과 단계별 시간 측정
+- get_logger: LOG_LEVEL 환경 변수로 수준을 정하는 컴포넌트별 로거 ("[BibleLoader] ..." 형식)
+- stage: parse → resolve → read → extract → paginate → render → save 단계 시간 측정
+  요청 타이밍이 활성화되지 않은 곳(시작 작업, 빌드 스크립트 등)에서는 아무 일도 하지 않음
+- 요청별 측정 결과는 Server-Timing 헤더로 반환(요청에 X-Timing: 1)하고, 엔드포인트별로 메모리에 누적
+
+단계는 중첩될 수 있고 (예: resolve 안의 read) 각 단계 시간은 하위 단계를 포함한 값
+"""
+import os
+import sys
+import time
+import logging
+import functools
+import threading
+import contextvars
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+# 로그 수준 (DEBUG면 요청마다 상세 로그 출력)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+# 단계별 시간 측정 사용 여부 (0이면 측정 코드가 모두 no-op)
+STAGE_TIMING = os.getenv("STAGE_TIMING", "1") == "1"
+
+_log_handler = None
+_log_handler_lock = threading.Lock()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    컴포넌트 로거 (예: get_logger("BibleLoader"))
+    기존 print 출력과 같은 "[이름] 메시지" 형식으로 stdout에 출력
+    """
+    global _log_handler
+    if _log_handler is None:
+        with _log_handler_lock:
+            if _log_handler is None:
+                handler = logging.StreamHandler(sys.stdout)
+                handler.setFormatter(logging.Formatter("[%(name)s] %(message)s"))
+                _log_handler = handler
+
+    logger = logging.getLogger(name)
+    if _log_handler not in logger.handlers:
+        logger.addHandler(_log_handler)
+        logger.setLevel(LOG_LEVEL)
+        # uvicorn 루트 로거로 중복 출력되지 않도록
+        logger.propagate = False
+    return logger
+
+
+class RequestTiming:
+    """요청 하나의 단계별 시간 (여러 스레드에서 기록 가능)"""
+
+    __slots__ = ("name", "started", "stages", "_lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        # {단계: [횟수, 누적 초]} (처음 기록된 순서 유지)
+        self.stages: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage_name: str, seconds: float, count: int = 1):
+        with self._lock:
+            entry = self.stages.get(stage_name)
+            if entry is None:
+                self.stages[stage_name] = [count, seconds]
+            else:
+                entry[0] += count
+                entry[1] += seconds
+
+    def merge(self, stages: Dict[str, list]):
+        """다른 프로세스/스레드에서 측정한 단계 시간 합치기"""
+        for stage_name, (count, seconds) in stages.items():
+            self.add(stage_name, seconds, count)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (예: "parse;dur=0.12, read;dur=3.40, total;dur=5.01")"""
+        with self._lock:
+            parts = [f"{stage_name};dur={seconds * 1000:.2f}" for stage_name, (_, seconds) in self.stages.items()]
+        parts.append(f"total;dur={self.elapsed() * 1000:.2f}")
+        return ", ".join(parts)
+
+
+_current_timing: contextvars.ContextVar[Optional[RequestTiming]] = contextvars.ContextVar(
+    "request_timing", default=None
+)
+
+# 측정하지 않을 때 돌려주는 재사용 가능한 빈 컨텍스트
+_NO_SPAN = nullcontext()
+
+
+class _Span:
+    """stage()가 돌려주는 측정 구간"""
+
+    __slots__ = ("timing", "name", "started")
+
+    def __init__(self, timing: RequestTiming, name: str):
+        self.timing = timing
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timing.add(self.name, time.perf_counter() - self.started)
+        return False
+
+
+def stage(name: str):
+    """
+    단계 시간 측정 구간
+
+    사용 예:
+        with stage("read"):
+            ...
+    """
+    timing = _current_timing.get()
+    if timing is None:
+        return _NO_SPAN
+    return _Span(timing, name)
+
+
+def timed_iter(name: str, iterable: Iterable) -> Iterator:
+    """
+    생성기의 각 next() 시간을 단계로 측정 (스트리밍 페이지 분할 등)
+    측정 중이 아니면 iterable을 그대로 반환
+    """
+    timing = _current_timing.get()
+    if timing is None:
+        return iter(iterable)
+    return _timed_iter(timing, name, iter(iterable))
+
+
+def _timed_iter(timing: RequestTiming, name: str, iterator: Iterator) -> Iterator:
+    while True:
+        started = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            timing.add(name, time.perf_counter() - started, 0)
+            return
+        timing.add(name, time.perf_counter() - started)
+        yield item
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """현재 요청의 타이밍 (측정 중이 아니면 None)"""
+    return _current_timing.get()
+
+
+def in_current_context(func: Callable, *args, **kwargs) -> Callable[[], Any]:
+    """
+    현재 컨텍스트(요청 타이밍 포함)를 그대로 가지고 다른 스레드에서 실행할 호출 객체
+    run_in_executor / ThreadPoolExecutor.submit은 컨텍스트를 복사하지 않으므로 이것으로 감싸서 넘김
+    """
+    return functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+
+
+def collect_stages(func: Callable, *args) -> Tuple[Any, Dict[str, list]]:
+    """
+    새 타이밍을 켜고 func 실행 (덱 생성 프로세스 안에서 사용)
+
+    Returns:
+        (func 결과, {단계: [횟수, 누적 초]})
+    """
+    timing = RequestTiming(getattr(func, "__name__", "task"))
+    token = _current_timing.set(timing)
+    try:
+        return func(*args), timing.stages
+    finally:
+        _current_timing.reset(token)
+
+
+class StageStats:
+    """엔드포인트별 단계 시간 누적 통계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # {엔드포인트: {"requests": n, "stages": {단계: [횟수, 누적 초, 최대 초]}}}
+        self._endpoints: Dict[str, Dict] = {}
+
+    def record(self, timing: RequestTiming):
+        """끝난 요청 하나의 단계 시간 누적"""
+        samples = [(stage_name, count, seconds) for stage_name, (count, seconds) in list(timing.stages.items())]
+        samples.append(("total", 1, timing.elapsed()))
+
+        with self._lock:
+            endpoint = self._endpoints.setdefault(timing.name, {"requests": 0, "stages": {}})
+            endpoint["requests"] += 1
+            for stage_name, count, seconds in samples:
+                entry = endpoint["stages"].setdefault(stage_name, [0, 0.0, 0.0])
+                entry[0] += count
+                entry[1] += seconds
+                entry[2] = max(entry[2], seconds)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def snapshot(self) -> Dict:
+        """
+        누적 통계
+
+        Returns:
+            {엔드포인트: {"requests": n, "stages": {단계: {"count", "total_ms", "avg_ms", "max_ms"}}}}
+            avg_ms는 요청당 평균, max_ms는 한 요청에서 그 단계에 쓴 최대 시간
+        """
+        with self._lock:
+            result = {}
+            for name, endpoint in self._endpoints.items():
+                requests = endpoint["requests"]
+                result[name] = {
+                    "requests": requests,
+                    "stages": {
+                        stage_name: {
+                            "count": count,
+                            "total_ms": round(total * 1000, 3),
+                            "avg_ms": round(total * 1000 / requests, 3),
+                            "max_ms": round(maximum * 1000, 3)
+                        }
+                        for stage_name, (count, total, maximum) in endpoint["stages"].items()
+                    }
+                }
+            return result
+
+
+_stage_stats = StageStats()
+
+
+def get_stage_stats() -> StageStats:
+    """단계 시간 누적 통계 싱글톤"""
+    return _stage_stats
+
+
+def start_request(name: str) -> Tuple[Optional[RequestTiming], Optional[contextvars.Token]]:
+    """요청 타이밍 시작 (STAGE_TIMING=0이면 (None, None))"""
+    if not STAGE_TIMING:
+        return None, None
+    timing = RequestTiming(name)
+    return timing, _current_timing.set(timing)
+
+
+def finish_request(timing: Optional[RequestTiming], token: Optional[contextvars.Token], name: str = None):
+    """
+    요청 타이밍 종료 후 누적 통계에 반영
+
+    Args:
+        name: 통계에 쓸 엔드포인트 이름 (시작할 때 이름 대신, 예: 라우트 경로 템플릿)
+    """
+    if timing is None:
+        return
+    _current_timing.reset(token)
+    if name is not None:
+        timing.name = name
+    _stage_stats.record(timing)
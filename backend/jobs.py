@@ -0,0 +1,305 @@
+"""
+비동기 덱 생성 작업 큐
+요청을 받으면 작업 ID만 바로 돌려주고, 서버 안의 작업자(asyncio 태스크)가 덱 생성 풀에서 생성
+클라이언트는 상태를 조회하다가 결과 파일을 나중에 받아 감 (연결이 끊겨도 생성은 계속되고 결과는 보관)
+
+- 대기 중인 작업 수와 보관하는 작업 수에 상한, 넘으면 제출 거부
+- 끝난 작업은 JOB_RESULT_TTL_SECONDS 뒤 만료 (결과 산출물 파일도 삭제, 결과는 메모리에 두지 않고 작업 전용 파일로)
+- 생성 단계와 구역/슬라이드 진행 상황을 Server-Sent Events로 전달
+"""
+import os
+import json
+import time
+import uuid
+import asyncio
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from .artifacts import DeckOutput, remove_artifact
+from .instrumentation import get_logger
+
+logger = get_logger("Jobs")
+
+# 작업자 수 (동시에 생성하는 덱 수)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+# 대기 중인 작업 수 상한
+MAX_QUEUED_JOBS = int(os.getenv("MAX_QUEUED_JOBS", "32"))
+# 보관하는 작업 수 상한 (넘으면 오래된 끝난 작업부터 삭제)
+MAX_JOBS = int(os.getenv("MAX_JOBS", "256"))
+# 끝난 작업 보관 시간 (초)
+JOB_RESULT_TTL_SECONDS = int(os.getenv("JOB_RESULT_TTL_SECONDS", "900"))
+# 진행 상황 스트림에서 변화가 없을 때 연결 유지 주석을 보내는 간격 (초)
+JOB_EVENT_HEARTBEAT_SECONDS = float(os.getenv("JOB_EVENT_HEARTBEAT_SECONDS", "15"))
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATUSES = frozenset({DONE, FAILED, CANCELLED})
+
+
+class Job:
+    """덱 생성 작업 하나"""
+
+    __slots__ = ("job_id", "payload", "filename", "status", "created_at", "started_at", "finished_at",
+                 "output", "error", "task", "progress", "_changed")
+
+    def __init__(self, payload, filename: str):
+        self.job_id = uuid.uuid4().hex
+        self.payload = payload
+        self.filename = filename
+        self.status = QUEUED
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.output: Optional[DeckOutput] = None
+        self.error: Optional[str] = None
+        self.task: Optional[asyncio.Task] = None
+        # 마지막 진행 상황 {"stage": 단계, ...}
+        self.progress: Dict = {"stage": QUEUED}
+        self._changed = asyncio.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def report(self, stage: str, **details):
+        """진행 상황 갱신 (runner가 이벤트 루프에서 호출)"""
+        self.progress = dict(details, stage=stage)
+        self.notify()
+
+    def notify(self):
+        """상태/진행 상황을 기다리는 스트림 깨우기"""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait_changed(self, timeout: float) -> bool:
+        """상태/진행 상황이 바뀔 때까지 대기 (timeout 안에 바뀌지 않으면 False)"""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def info(self) -> Dict:
+        """상태 조회 응답"""
+        info = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "filename": self.filename,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "progress": self.progress,
+        }
+        if self.status == DONE and self.output is not None:
+            info["size"] = self.output.size
+        elif self.status == FAILED:
+            info["error"] = self.error
+        return info
+
+    def release(self):
+        """결과 놓기 (작업이 만든 임시 산출물 파일 삭제)"""
+        if self.output is not None and self.output.temporary:
+            remove_artifact(self.output.path)
+        self.output = None
+        self.payload = None
+
+
+class JobQueue:
+    """
+    덱 생성 작업 큐 (이벤트 루프 안에서만 사용)
+
+    runner(payload, report)는 덱을 만들어 DeckOutput을 돌려주는 코루틴 함수
+    (report(stage, **details)로 진행 상황 보고)
+    """
+
+    def __init__(self, runner: Callable[..., Awaitable[DeckOutput]], workers: int = JOB_WORKERS,
+                 max_queued: int = MAX_QUEUED_JOBS, max_jobs: int = MAX_JOBS,
+                 ttl_seconds: int = JOB_RESULT_TTL_SECONDS):
+        self.runner = runner
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+
+    def start(self):
+        """작업자 태스크 시작"""
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    def stop(self):
+        """작업자와 실행 중인 작업 취소, 남은 결과 파일 삭제"""
+        for task in self._tasks:
+            task.cancel()
+        for job in self._jobs.values():
+            if job.task is not None:
+                job.task.cancel()
+            job.release()
+        self._jobs.clear()
+
+    def submit(self, payload, filename: str) -> Optional[Job]:
+        """
+        작업 등록
+
+        Returns:
+            등록한 작업, 대기 작업이나 보관 작업이 상한에 닿았으면 None
+        """
+        self._expire()
+        if self.queued_count() >= self.max_queued or not self._make_room():
+            self.rejected += 1
+            return None
+
+        job = Job(payload, filename)
+        self._jobs[job.job_id] = job
+        self._queue.put_nowait(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회 (없거나 만료되었으면 None)"""
+        self._expire()
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        작업 취소 (대기 중이면 건너뛰고, 생성 중이면 기다리기를 중단), 끝난 작업은 결과 삭제
+
+        Returns:
+            취소한 작업, 없으면 None
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if job.status == RUNNING and job.task is not None:
+            job.task.cancel()
+        elif not job.finished:
+            self._finish(job, CANCELLED)
+        else:
+            del self._jobs[job_id]
+            job.release()
+        return job
+
+    def queued_count(self) -> int:
+        return sum(1 for job in self._jobs.values() if job.status == QUEUED)
+
+    def describe(self, job: Job) -> Dict:
+        """
+        작업 상태 (대기 중이면 position: 앞에 있는 작업 수, 끝났으면 expires_at: 만료 시각)
+        """
+        info = job.info()
+        if job.status == QUEUED:
+            info["position"] = sum(
+                1 for other in self._jobs.values()
+                if other.status == QUEUED and other.created_at < job.created_at
+            )
+        elif job.finished:
+            info["expires_at"] = job.finished_at + self.ttl_seconds
+        return info
+
+    def stats(self) -> Dict:
+        self._expire()
+        statuses: Dict[str, int] = {}
+        for job in self._jobs.values():
+            statuses[job.status] = statuses.get(job.status, 0) + 1
+        return {
+            "workers": self.workers,
+            "jobs": len(self._jobs),
+            "max_jobs": self.max_jobs,
+            "max_queued": self.max_queued,
+            "statuses": statuses,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+        }
+
+    def _make_room(self) -> bool:
+        """보관 작업이 상한이면 가장 오래된 끝난 작업 하나 삭제 (삭제할 작업이 없으면 False)"""
+        if len(self._jobs) < self.max_jobs:
+            return True
+        for job_id, job in self._jobs.items():
+            if job.finished:
+                del self._jobs[job_id]
+                job.release()
+                return True
+        return False
+
+    def _expire(self, now: float = None):
+        """보관 시간이 지난 끝난 작업 삭제"""
+        now = time.time() if now is None else now
+        expired = [
+            job for job in self._jobs.values()
+            if job.finished and now - job.finished_at > self.ttl_seconds
+        ]
+        for job in expired:
+            del self._jobs[job.job_id]
+            job.release()
+
+    def _finish(self, job: Job, status: str, output: DeckOutput = None, error: str = None):
+        job.status = status
+        job.finished_at = time.time()
+        job.output = output
+        job.error = error
+        job.task = None
+        job.payload = None
+        job.progress = dict(job.progress, stage=status)
+        job.notify()
+
+    async def iter_events(self, job: Job, heartbeat: float = JOB_EVENT_HEARTBEAT_SECONDS) -> AsyncIterator[str]:
+        """
+        작업 진행 상황 Server-Sent Events 스트림
+        - event: progress, data: 진행 상황 (바뀔 때마다 최신 상태, 연달아 바뀐 중간 상태는 건너뛸 수 있음)
+        - 끝나면 event: done/failed/cancelled, data: describe() 결과를 보내고 종료
+        - 변화가 없으면 heartbeat초마다 주석 줄(연결 유지)
+        """
+        last = None
+        while True:
+            if job.finished:
+                yield f"event: {job.status}\ndata: {json.dumps(self.describe(job), ensure_ascii=False)}\n\n"
+                return
+            if job.progress is not last:
+                last = job.progress
+                yield f"event: progress\ndata: {json.dumps(dict(last, status=job.status), ensure_ascii=False)}\n\n"
+            if not await job.wait_changed(heartbeat):
+                yield ": keep-alive\n\n"
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            if job.status != QUEUED:
+                # 대기 중에 취소된 작업
+                continue
+
+            job.status = RUNNING
+            job.started_at = time.time()
+            job.report(RUNNING)
+            job.task = asyncio.create_task(self.runner(job.payload, job.report))
+            try:
+                output = await job.task
+            except asyncio.CancelledError:
+                if asyncio.current_task().cancelling():
+                    # 작업자 자체가 취소됨 (서버 종료, 생성 중인 작업도 함께 취소됨)
+                    raise
+                self._finish(job, CANCELLED)
+                logger.info("🛑 작업 취소: %s", job.job_id)
+                continue
+            except Exception as e:
+                self.failed += 1
+                self._finish(job, FAILED, error=f"{type(e).__name__}: {e}")
+                logger.warning("❌ 작업 실패: %s (%s)", job.job_id, e)
+                continue
+
+            self.completed += 1
+            self._finish(job, DONE, output=output)
+            if job.job_id not in self._jobs:
+                # 생성 중에 큐가 정리됨
+                job.release()
+                continue
+            logger.info("✅ 작업 완료: %s (%d 바이트, %.1f초)",
+                        job.job_id, output.size, job.finished_at - job.started_at)
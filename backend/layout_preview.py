@@ -0,0 +1,155 @@
+"""
+슬라이드 배치 미리보기 (python-pptx 없이)
+덱 생성과 같은 구역 렌더링(render_section)에 LayoutRenderer를 넘겨 그리기 호출만 기록하고,
+그리기 함수별 텍스트박스 배치표로 위치와 넘침을 추정
+
+- 위치/크기는 인치 (슬라이드 10 × 7.5)
+- 글자 폭은 한글/한자 1em, 그 밖의 문자 0.55em으로 추정 (실제 글꼴 측정 아님)
+- 줄바꿈 없는 텍스트박스(python-pptx add_textbox 기본)는 가로 넘침, 줄바꿈 박스는 세로 넘침을 계산
+"""
+import math
+import unicodedata
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# 슬라이드 크기 (인치, 4:3)
+SLIDE_WIDTH = 10.0
+SLIDE_HEIGHT = 7.5
+# 텍스트박스 기본 여백 (인치, 좌우 0.1 / 상하 0.05)
+BOX_INSET_X = 0.1
+BOX_INSET_Y = 0.05
+# 글자 폭 추정 (em), 한 줄 높이 (글꼴 크기 배수)
+WIDE_CHAR_EM = 1.0
+NARROW_CHAR_EM = 0.55
+LINE_HEIGHT = 1.2
+
+
+class TextBox(NamedTuple):
+    """그리기 함수가 만드는 텍스트박스 하나 (text가 있으면 고정 문구, 없으면 texts[name])"""
+    name: str
+    left: float
+    top: float
+    width: float
+    height: float
+    font_size: Callable[[object], int]
+    line_spacing: float = 1.0
+    word_wrap: bool = False
+    text: Optional[str] = None
+
+
+def _reference_box(config, reference_position: str) -> TextBox:
+    """성경 참조 텍스트박스 (main.get_reference_position과 같은 배치)"""
+    margin, ref_width, ref_height = 0.5, 3.0, 0.6
+    left = SLIDE_WIDTH - ref_width - margin if "right" in reference_position else margin
+    top = SLIDE_HEIGHT - ref_height - margin if "bottom" in reference_position else margin
+    return TextBox("reference", left, top, 4.0, 0.8, lambda c: 24)
+
+
+# 그리기 함수 이름 → (슬라이드 종류, 텍스트박스 목록을 만드는 함수(config, *layout))
+# main.py의 add_*_slide 함수와 같은 배치를 유지해야 함
+SLIDE_LAYOUTS: Dict[str, Tuple[str, Callable[..., List[TextBox]]]] = {
+    "add_title_slide": ("title", lambda config: [
+        TextBox("title", 1, 2.5, 8, 1.5, lambda c: c.title_font_size + 12),
+        TextBox("subtitle", 1, 4.3, 8, 1, lambda c: c.font_size),
+    ]),
+    "add_single_worship_order_slide": ("order", lambda config: [
+        TextBox("title", 1, 2.5, 8, 1.5, lambda c: c.title_font_size),
+        TextBox("detail", 1.5, 4.2, 7, 1, lambda c: c.font_size - 4),
+    ]),
+    "add_hymn_placeholder_slide": ("hymn-placeholder", lambda config: [
+        TextBox("title", 1, 3, 8, 1.5, lambda c: c.title_font_size),
+    ]),
+    "add_hymn_title_slide": ("hymn-title", lambda config: [
+        TextBox("number", 1, 2.5, 8, 0.8, lambda c: c.font_size),
+        TextBox("title", 1, 3.5, 8, 1, lambda c: c.title_font_size),
+    ]),
+    "add_hymn_verse_slide": ("hymn-verse", lambda config: [
+        TextBox("label", 1, 0.8, 8, 0.5, lambda c: 20),
+        TextBox("lyrics", 1.5, 2, 7, 4.5, lambda c: c.font_size - 4, line_spacing=1.8),
+    ]),
+    "add_hymn_chorus_slide": ("hymn-chorus", lambda config: [
+        TextBox("chorus", 1, 0.8, 8, 0.5, lambda c: 24, text="후렴"),
+        TextBox("lyrics", 1.5, 2, 7, 4.5, lambda c: c.font_size - 4, line_spacing=1.8),
+    ]),
+    "add_scripture_slide": ("scripture", lambda config, reference_position: [
+        _reference_box(config, reference_position),
+        TextBox("text", 0.8, 1.8, 8.4, 5, lambda c: c.font_size, line_spacing=1.5, word_wrap=True),
+    ]),
+}
+
+
+class LayoutRenderer:
+    """슬라이드를 만들지 않고 그리기 호출(함수 이름, layout, texts)만 기록하는 렌더러"""
+
+    def __init__(self):
+        self.slides: List[Tuple[str, tuple, Dict[str, str]]] = []
+
+    def add(self, draw: Callable, config, *layout, **texts):
+        self.slides.append((draw.__name__, layout, texts))
+
+
+def text_width_em(line: str) -> float:
+    """한 줄의 추정 폭 (em)"""
+    return sum(
+        WIDE_CHAR_EM if unicodedata.east_asian_width(ch) in ("W", "F") else NARROW_CHAR_EM
+        for ch in line
+    )
+
+
+def measure_box(box: TextBox, config, text: str) -> Dict:
+    """텍스트박스 하나의 배치와 추정 줄 수/넘침 (인치)"""
+    font_size = box.font_size(config)
+    em = font_size / 72
+    usable_width = box.width - 2 * BOX_INSET_X
+
+    lines = 0
+    widest = 0.0
+    for paragraph in text.split("\n"):
+        width = text_width_em(paragraph) * em
+        widest = max(widest, width)
+        lines += max(1, math.ceil(width / usable_width)) if box.word_wrap else 1
+
+    text_height = lines * font_size * LINE_HEIGHT * box.line_spacing / 72 + 2 * BOX_INSET_Y
+    text_width = min(widest, usable_width) if box.word_wrap else widest
+    # 슬라이드 밖으로 나가는 부분도 넘침으로 계산
+    overflow_width = max(text_width - usable_width, 0.0, box.left + box.width - SLIDE_WIDTH)
+    overflow_height = max(text_height - box.height, 0.0, box.top + text_height - SLIDE_HEIGHT)
+
+    return {
+        "name": box.name,
+        "text": text,
+        "left": box.left,
+        "top": box.top,
+        "width": box.width,
+        "height": box.height,
+        "font_size": font_size,
+        "lines": lines,
+        "overflow_width": round(overflow_width, 2),
+        "overflow_height": round(overflow_height, 2),
+    }
+
+
+def describe_slide(draw_name: str, config, layout: tuple, texts: Dict[str, str]) -> Dict:
+    """
+    기록한 그리기 호출 하나 → 슬라이드 배치
+
+    Returns:
+        {"kind", "boxes": [measure_box 결과, ...], "overflow": 넘치는 텍스트박스가 있는지}
+        배치표에 없는 그리기 함수는 {"kind": 함수 이름, "boxes": [], "overflow": False}
+    """
+    entry = SLIDE_LAYOUTS.get(draw_name)
+    if entry is None:
+        return {"kind": draw_name, "boxes": [], "overflow": False}
+
+    kind, boxes = entry
+    measured = []
+    for box in boxes(config, *layout):
+        text = box.text if box.text is not None else texts.get(box.name)
+        if text is None:
+            continue
+        measured.append(measure_box(box, config, text))
+
+    return {
+        "kind": kind,
+        "boxes": measured,
+        "overflow": any(box["overflow_width"] > 0 or box["overflow_height"] > 0 for box in measured)
+    }
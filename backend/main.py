@@ -1,28 +1,118 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from typing import List, Optional, Literal
+from typing import Callable, Dict, List, Optional, Literal, Iterable, Iterator, AsyncIterator, Tuple
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 import os
-import tempfile
+import re
+import json
+import asyncio
+import hashlib
+from urllib.parse import quote
+from functools import lru_cache
 from datetime import datetime
 from .bible_parser import parse_bible_reference
 from .bible_loader import get_bible_loader
 from .hymn_loader import get_hymn_loader
+from .search_index import get_search_index
+from .reference_extractor import get_reference_extractor, load_scriptures
 from .startup import initialize as startup_initialize
+from .executors import run_io, run_render, stream_io, shutdown as shutdown_executors
+from .slide_renderer import DirectRenderer, create_renderer
+from .layout_preview import LayoutRenderer, describe_slide
+from .streaming_writer import StreamingDeckWriter, StreamingRenderer, package_parts, slide_part_xml, detach_slides
+from .artifacts import DeckOutput, spool_output, own_output, remove_artifact, run_janitor
+from .deck_cache import get_deck_cache
+from .jobs import JobQueue, DONE
+from .singleflight import AsyncSingleFlight, get_single_flight_stats
+from .memory_budget import get_memory_budget
+from .admission import AdmissionRejected, estimate_render_cost, get_render_limiter, get_lookup_limiter
+from .edit_sessions import SectionParts, MAX_SESSION_ID_LENGTH, get_edit_sessions
+from .fragment_cache import (
+    FRAGMENT_KINDS, FRAGMENT_WARM_HYMNS, FRAGMENT_WARM_ORDERS, get_fragment_cache, get_hymn_usage
+)
+from .instrumentation import get_logger, stage, timed_iter, start_request, finish_request, get_stage_stats
 
 app = FastAPI(title="Sermon Slide Generator v3")
 
+logger = get_logger("API")
+
 # 서버 시작 시 Reference 데이터 다운로드
 @app.on_event("startup")
 async def startup_event():
     """서버 시작 시 초기화 작업"""
     startup_initialize()
+    # 남은 덱 산출물 파일을 주기적으로 정리
+    app.state.janitor = asyncio.create_task(run_janitor())
+    # 많이 쓰는 찬송가와 고정 예배 순서 슬라이드 미리 생성
+    app.state.fragment_warmup = asyncio.create_task(warm_fragment_cache())
+    # 비동기 덱 생성 작업 큐
+    app.state.jobs = JobQueue(run_presentation_job)
+    app.state.jobs.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """서버 종료 시 백그라운드 작업, 작업 큐, 찬송가 사용 기록, 스레드/프로세스 풀 정리"""
+    for name in ("janitor", "fragment_warmup"):
+        task = getattr(app.state, name, None)
+        if task is not None:
+            task.cancel()
+    jobs = getattr(app.state, "jobs", None)
+    if jobs is not None:
+        jobs.stop()
+    get_hymn_usage().save()
+    shutdown_executors()
+
+# 라우트에 맞지 않은 요청(404 등)을 모으는 통계 이름
+UNMATCHED_ENDPOINT = "(unmatched)"
+
+def endpoint_name(request: Request) -> str:
+    """
+    통계용 엔드포인트 이름 (라우트 경로 템플릿, 예: /jobs/{job_id})
+    실제 경로로 모으면 작업 ID나 404 탐색마다 항목이 늘어나므로 사용하지 않음
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    return path if path else UNMATCHED_ENDPOINT
+
+@app.middleware("http")
+async def stage_timing(request: Request, call_next):
+    """
+    요청별 단계 시간 측정 (parse → resolve → read → extract → paginate → render → save)
+    요청 헤더에 X-Timing: 1이 있으면 응답의 Server-Timing 헤더로 단계별 시간 반환
+    """
+    timing, token = start_request(request.url.path)
+    try:
+        response = await call_next(request)
+    finally:
+        finish_request(timing, token, endpoint_name(request))
+
+    if timing is not None and request.headers.get("x-timing") == "1":
+        response.headers["Server-Timing"] = timing.server_timing()
+    return response
+
+# 조회 API (덱 생성과 별도의 더 큰 입장 한도)
+LOOKUP_PATHS = frozenset({
+    "/parse-bible-reference", "/auto-parse-scripture", "/fetch-scripture", "/fetch-scriptures",
+    "/extract-references", "/search-scripture", "/fetch-hymn", "/preview-layout",
+})
+
+@app.middleware("http")
+async def lookup_admission(request: Request, call_next):
+    """조회 API 입장 제어 (포화 상태면 429/503과 Retry-After)"""
+    if request.url.path not in LOOKUP_PATHS:
+        return await call_next(request)
+    try:
+        async with get_lookup_limiter().slot():
+            return await call_next(request)
+    except AdmissionRejected as e:
+        return JSONResponse({"detail": e.detail}, status_code=e.status_code, headers=e.headers)
 
 # 정적 파일 서빙 (프론트엔드)
 frontend_path = os.path.join(os.path.dirname(__file__), "..", "frontend")
@@ -36,12 +126,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Retry-After"],
 )
 
 class ScriptureVerse(BaseModel):
     """성경 구절 모델"""
     reference: str  # 예: "마5:13" or "요한복음 3:16"
-    text: str
+    text: str = ""  # 비어 있으면 Reference 데이터에서 본문 로드
     translation: str = "개역개정"
     reference_position: Literal["top-left", "top-right", "bottom-left", "bottom-right"] = "top-left"
 
@@ -75,8 +166,9 @@ class PresentationRequest(BaseModel):
     config: SlideConfig = SlideConfig()
     auto_parse_references: bool = True  # 자동 성경 참조 파싱
 
+@lru_cache(maxsize=64)
 def hex_to_rgb(hex_color: str) -> RGBColor:
-    """Hex 색상을 RGB로 변환"""
+    """Hex 색상을 RGB로 변환 (같은 색상은 한 번만 파싱)"""
     hex_color = hex_color.lstrip('#')
     return RGBColor(
         int(hex_color[0:2], 16),
@@ -84,7 +176,10 @@ def hex_to_rgb(hex_color: str) -> RGBColor:
         int(hex_color[4:6], 16)
     )
 
-def add_title_slide(prs: Presentation, title: str, subtitle: str, config: SlideConfig):
+# 슬라이드 그리기 함수: draw(prs, config, *layout, **texts) 형식으로 슬라이드 하나를 추가
+# (slide_renderer 참고 - 원형 렌더러가 텍스트 자리만 바꿔 복제할 수 있도록 texts는 가공 없이 사용)
+
+def add_title_slide(prs: Presentation, config: SlideConfig, title: str, subtitle: str):
     """제목 슬라이드 추가"""
     slide = prs.slides.add_slide(prs.slide_layouts[6])  # 빈 레이아웃
 
@@ -118,7 +213,7 @@ def add_title_slide(prs: Presentation, title: str, subtitle: str, config: SlideC
     subtitle_frame.paragraphs[0].font.name = config.font_name
     subtitle_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
 
-def add_single_worship_order_slide(prs: Presentation, order: WorshipOrder, config: SlideConfig):
+def add_single_worship_order_slide(prs: Presentation, config: SlideConfig, title: str, detail: Optional[str] = None):
     """
     예배 순서 슬라이드 추가 - 한 순서가 한 슬라이드
     교회 예시와 비슷한 디자인: 중앙에 제목, 부제목
@@ -134,7 +229,7 @@ def add_single_worship_order_slide(prs: Presentation, order: WorshipOrder, confi
     # 제목 (예배 순서 항목) - 중앙 배치
     title_box = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(1.5))
     title_frame = title_box.text_frame
-    title_frame.text = order.title
+    title_frame.text = title
     title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     title_frame.paragraphs[0].font.size = Pt(config.title_font_size)
     title_frame.paragraphs[0].font.bold = True
@@ -142,44 +237,34 @@ def add_single_worship_order_slide(prs: Presentation, order: WorshipOrder, confi
     title_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.title_color)
 
     # 상세 정보 (있는 경우)
-    if order.detail:
+    if detail:
         detail_box = slide.shapes.add_textbox(Inches(1.5), Inches(4.2), Inches(7), Inches(1))
         detail_frame = detail_box.text_frame
-        detail_frame.text = order.detail
+        detail_frame.text = detail
         detail_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
         detail_frame.paragraphs[0].font.size = Pt(config.font_size - 4)
         detail_frame.paragraphs[0].font.name = config.font_name
         detail_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
 
-def add_hymn_slides(prs: Presentation, hymn_number: int, config: SlideConfig):
-    """
-    찬송가 슬라이드 추가
-    - 제목 슬라이드 (찬송가 번호 + 제목)
-    - 각 절마다 별도 슬라이드
-    - 후렴이 있으면 후렴 슬라이드 추가
-    """
-    loader = get_hymn_loader()
-    hymn_data = loader.load_hymn(hymn_number)
+def add_hymn_placeholder_slide(prs: Presentation, config: SlideConfig, title: str):
+    """찬송가 데이터가 없을 때의 기본 슬라이드"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    background = slide.background
+    fill = background.fill
+    fill.solid()
+    fill.fore_color.rgb = hex_to_rgb(config.background_color)
 
-    if not hymn_data:
-        # 찬송가 데이터가 없으면 기본 슬라이드
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = hex_to_rgb(config.background_color)
-
-        title_box = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(8), Inches(1.5))
-        title_frame = title_box.text_frame
-        title_frame.text = f"찬송가 {hymn_number}장"
-        title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        title_frame.paragraphs[0].font.size = Pt(config.title_font_size)
-        title_frame.paragraphs[0].font.bold = True
-        title_frame.paragraphs[0].font.name = config.font_name
-        title_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.title_color)
-        return
+    title_box = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(8), Inches(1.5))
+    title_frame = title_box.text_frame
+    title_frame.text = title
+    title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    title_frame.paragraphs[0].font.size = Pt(config.title_font_size)
+    title_frame.paragraphs[0].font.bold = True
+    title_frame.paragraphs[0].font.name = config.font_name
+    title_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.title_color)
 
-    # 1. 제목 슬라이드
+def add_hymn_title_slide(prs: Presentation, config: SlideConfig, number: str, title: str):
+    """찬송가 제목 슬라이드 (찬송가 번호 + 제목)"""
     slide = prs.slides.add_slide(prs.slide_layouts[6])
     background = slide.background
     fill = background.fill
@@ -189,7 +274,7 @@ def add_hymn_slides(prs: Presentation, hymn_number: int, config: SlideConfig):
     # 찬송가 번호
     num_box = slide.shapes.add_textbox(Inches(1), Inches(2.5), Inches(8), Inches(0.8))
     num_frame = num_box.text_frame
-    num_frame.text = f"찬송가 {hymn_number}장"
+    num_frame.text = number
     num_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     num_frame.paragraphs[0].font.size = Pt(config.font_size)
     num_frame.paragraphs[0].font.name = config.font_name
@@ -198,83 +283,129 @@ def add_hymn_slides(prs: Presentation, hymn_number: int, config: SlideConfig):
     # 제목
     title_box = slide.shapes.add_textbox(Inches(1), Inches(3.5), Inches(8), Inches(1))
     title_frame = title_box.text_frame
-    title_frame.text = hymn_data['title']
+    title_frame.text = title
     title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
     title_frame.paragraphs[0].font.size = Pt(config.title_font_size)
     title_frame.paragraphs[0].font.bold = True
     title_frame.paragraphs[0].font.name = config.font_name
     title_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.title_color)
 
+def add_hymn_verse_slide(prs: Presentation, config: SlideConfig, label: str, lyrics: str):
+    """찬송가 절 슬라이드 (절 번호 + 가사)"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    background = slide.background
+    fill = background.fill
+    fill.solid()
+    fill.fore_color.rgb = hex_to_rgb(config.background_color)
+
+    # 절 번호 (작게 상단)
+    verse_num_box = slide.shapes.add_textbox(Inches(1), Inches(0.8), Inches(8), Inches(0.5))
+    verse_num_frame = verse_num_box.text_frame
+    verse_num_frame.text = label
+    verse_num_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    verse_num_frame.paragraphs[0].font.size = Pt(20)
+    verse_num_frame.paragraphs[0].font.name = config.font_name
+    verse_num_frame.paragraphs[0].font.color.rgb = RGBColor(120, 120, 120)
+
+    # 가사
+    lyrics_box = slide.shapes.add_textbox(Inches(1.5), Inches(2), Inches(7), Inches(4.5))
+    lyrics_frame = lyrics_box.text_frame
+    lyrics_frame.text = lyrics
+    lyrics_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    lyrics_frame.paragraphs[0].font.size = Pt(config.font_size - 4)
+    lyrics_frame.paragraphs[0].font.name = config.font_name
+    lyrics_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
+    lyrics_frame.paragraphs[0].line_spacing = 1.8
+
+def add_hymn_chorus_slide(prs: Presentation, config: SlideConfig, lyrics: str):
+    """찬송가 후렴 슬라이드"""
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    background = slide.background
+    fill = background.fill
+    fill.solid()
+    fill.fore_color.rgb = hex_to_rgb(config.background_color)
+
+    # 후렴 제목
+    chorus_title_box = slide.shapes.add_textbox(Inches(1), Inches(0.8), Inches(8), Inches(0.5))
+    chorus_title_frame = chorus_title_box.text_frame
+    chorus_title_frame.text = "후렴"
+    chorus_title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    chorus_title_frame.paragraphs[0].font.size = Pt(24)
+    chorus_title_frame.paragraphs[0].font.bold = True
+    chorus_title_frame.paragraphs[0].font.name = config.font_name
+    chorus_title_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.title_color)
+
+    # 후렴 가사
+    chorus_box = slide.shapes.add_textbox(Inches(1.5), Inches(2), Inches(7), Inches(4.5))
+    chorus_frame = chorus_box.text_frame
+    chorus_frame.text = lyrics
+    chorus_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
+    chorus_frame.paragraphs[0].font.size = Pt(config.font_size - 4)
+    chorus_frame.paragraphs[0].font.name = config.font_name
+    chorus_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
+    chorus_frame.paragraphs[0].line_spacing = 1.8
+
+def add_hymn_slides(renderer: DirectRenderer, hymn_number: int, config: SlideConfig):
+    """
+    찬송가 슬라이드 추가
+    - 제목 슬라이드 (찬송가 번호 + 제목)
+    - 각 절마다 별도 슬라이드
+    - 후렴이 있으면 후렴 슬라이드 추가
+    """
+    loader = get_hymn_loader()
+    hymn_data = loader.load_hymn(hymn_number)
+
+    if not hymn_data:
+        # 찬송가 데이터가 없으면 기본 슬라이드
+        renderer.add(add_hymn_placeholder_slide, config, title=f"찬송가 {hymn_number}장")
+        return
+
+    # 1. 제목 슬라이드
+    renderer.add(add_hymn_title_slide, config, number=f"찬송가 {hymn_number}장", title=hymn_data['title'])
+
     # 2. 각 절 슬라이드
     for idx, verse in enumerate(hymn_data['verses'], 1):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = hex_to_rgb(config.background_color)
-
-        # 절 번호 (작게 상단)
-        verse_num_box = slide.shapes.add_textbox(Inches(1), Inches(0.8), Inches(8), Inches(0.5))
-        verse_num_frame = verse_num_box.text_frame
-        verse_num_frame.text = f"{idx}절"
-        verse_num_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        verse_num_frame.paragraphs[0].font.size = Pt(20)
-        verse_num_frame.paragraphs[0].font.name = config.font_name
-        verse_num_frame.paragraphs[0].font.color.rgb = RGBColor(120, 120, 120)
-
-        # 가사
-        lyrics_box = slide.shapes.add_textbox(Inches(1.5), Inches(2), Inches(7), Inches(4.5))
-        lyrics_frame = lyrics_box.text_frame
-        lyrics_frame.text = verse
-        lyrics_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        lyrics_frame.paragraphs[0].font.size = Pt(config.font_size - 4)
-        lyrics_frame.paragraphs[0].font.name = config.font_name
-        lyrics_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
-        lyrics_frame.paragraphs[0].line_spacing = 1.8
+        renderer.add(add_hymn_verse_slide, config, label=f"{idx}절", lyrics=verse)
 
     # 3. 후렴 슬라이드 (있는 경우)
     if hymn_data.get('chorus'):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = hex_to_rgb(config.background_color)
-
-        # 후렴 제목
-        chorus_title_box = slide.shapes.add_textbox(Inches(1), Inches(0.8), Inches(8), Inches(0.5))
-        chorus_title_frame = chorus_title_box.text_frame
-        chorus_title_frame.text = "후렴"
-        chorus_title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        chorus_title_frame.paragraphs[0].font.size = Pt(24)
-        chorus_title_frame.paragraphs[0].font.bold = True
-        chorus_title_frame.paragraphs[0].font.name = config.font_name
-        chorus_title_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.title_color)
-
-        # 후렴 가사
-        chorus_box = slide.shapes.add_textbox(Inches(1.5), Inches(2), Inches(7), Inches(4.5))
-        chorus_frame = chorus_box.text_frame
-        chorus_frame.text = hymn_data['chorus']
-        chorus_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        chorus_frame.paragraphs[0].font.size = Pt(config.font_size - 4)
-        chorus_frame.paragraphs[0].font.name = config.font_name
-        chorus_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
-        chorus_frame.paragraphs[0].line_spacing = 1.8
+        renderer.add(add_hymn_chorus_slide, config, lyrics=hymn_data['chorus'])
 
-def split_scripture_text(text: str, max_lines: int, chars_per_line: int) -> List[str]:
+# 문장 구분자 (마침표/느낌표/물음표 또는 절 번호)
+SENTENCE_DELIMITER = re.compile(r'([.!?]\s+|\d+\s+)')
+# 본문을 찾지 못한 구절 자리에 넣는 안내 문구
+MISSING_SCRIPTURE_TEXT = "본문을 찾을 수 없습니다"
+
+def iter_sentences(pieces: Iterable[str]) -> Iterator[str]:
     """
-    성경 본문을 슬라이드에 맞게 분할
-    줄 수와 줄당 글자 수를 고려하여 자연스럽게 분할
+    텍스트 조각 스트림을 문장 단위로 분리
+    전체 텍스트를 한 번에 re.split 한 것과 같은 결과를, 조각이 들어오는 대로 생성
     """
-    # 문장 단위로 분리 (마침표, 느낌표, 물음표 기준)
-    import re
-    sentences = re.split(r'([.!?]\s+|\d+\s+)', text)
-    sentences = [''.join(sentences[i:i+2]) for i in range(0, len(sentences), 2)]
+    buffer = ""
+    for piece in pieces:
+        buffer += piece
+        consumed = 0
+        for match in SENTENCE_DELIMITER.finditer(buffer):
+            # 버퍼 끝에 닿은 구분자는 다음 조각과 이어질 수 있으므로 보류
+            if match.end() >= len(buffer):
+                break
+            yield buffer[consumed:match.end()]
+            consumed = match.end()
+        buffer = buffer[consumed:]
+
+    sentences = SENTENCE_DELIMITER.split(buffer)
+    for i in range(0, len(sentences), 2):
+        yield ''.join(sentences[i:i+2])
 
-    chunks = []
+def iter_scripture_chunks(pieces: Iterable[str], max_lines: int, chars_per_line: int) -> Iterator[str]:
+    """
+    성경 본문 조각 스트림을 슬라이드 단위로 분할 (현재 슬라이드 분량만 메모리에 유지)
+    줄 수와 줄당 글자 수를 고려하여 자연스럽게 분할
+    """
     current_chunk = ""
     current_lines = 0
 
-    for sentence in sentences:
+    for sentence in iter_sentences(pieces):
         # 현재 문장이 몇 줄을 차지할지 추정
         sentence_lines = (len(sentence) + chars_per_line - 1) // chars_per_line
 
@@ -283,15 +414,33 @@ def split_scripture_text(text: str, max_lines: int, chars_per_line: int) -> List
             current_lines += sentence_lines
         else:
             if current_chunk:
-                chunks.append(current_chunk.strip())
+                yield current_chunk.strip()
             current_chunk = sentence
             current_lines = sentence_lines
 
     if current_chunk:
-        chunks.append(current_chunk.strip())
+        yield current_chunk.strip()
 
+def split_scripture_text(text: str, max_lines: int, chars_per_line: int) -> List[str]:
+    """
+    성경 본문을 슬라이드에 맞게 분할
+    줄 수와 줄당 글자 수를 고려하여 자연스럽게 분할
+    """
+    chunks = list(iter_scripture_chunks([text], max_lines, chars_per_line))
     return chunks if chunks else [text]
 
+def iter_reference_text(reference: str) -> Iterator[str]:
+    """
+    레퍼런스 본문을 Reference 데이터에서 절 단위 텍스트 조각으로 스트리밍
+    레퍼런스를 해석할 수 없으면 경고만 남기고 빈 스트림 (렌더러 안으로 ValueError가 나가지 않도록)
+    """
+    try:
+        for i, record in enumerate(get_bible_loader().iter_passage_verses(reference)):
+            piece = f"{record.verse} {record.text}".strip()
+            yield piece if i == 0 else ' ' + piece
+    except ValueError as e:
+        logger.warning("⚠️ 레퍼런스를 해석할 수 없음: %s (%s)", reference, e)
+
 def get_reference_position(position: str, slide_width=Inches(10), slide_height=Inches(7.5)):
     """
     레퍼런스 위치를 반환
@@ -310,7 +459,58 @@ def get_reference_position(position: str, slide_width=Inches(10), slide_height=I
 
     return positions.get(position, positions["top-left"])
 
-def add_scripture_slides(prs: Presentation, scripture: ScriptureVerse, config: SlideConfig, auto_parse: bool = True):
+def add_scripture_slide(prs: Presentation, config: SlideConfig, reference_position: str, reference: str, text: str):
+    """
+    성경 본문 슬라이드 한 장 추가 - 교회 예시 스타일
+    reference는 "[마5:13]"처럼 표시할 그대로 전달
+    """
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+
+    # 배경색
+    background = slide.background
+    fill = background.fill
+    fill.solid()
+    fill.fore_color.rgb = hex_to_rgb(config.background_color)
+
+    # 성경 참조 위치 계산
+    ref_left, ref_top = get_reference_position(reference_position)
+
+    # 성경 참조 텍스트박스 - 교회 예시 스타일: 간결하게
+    # 페이지 번호는 표시하지 않음 (교회 예시와 동일)
+    ref_box = slide.shapes.add_textbox(ref_left, ref_top, Inches(4), Inches(0.8))
+    ref_frame = ref_box.text_frame
+    ref_frame.text = reference
+
+    # 레퍼런스 정렬 (위치에 따라)
+    if "right" in reference_position:
+        ref_frame.paragraphs[0].alignment = PP_ALIGN.RIGHT
+    else:
+        ref_frame.paragraphs[0].alignment = PP_ALIGN.LEFT
+
+    ref_frame.paragraphs[0].font.size = Pt(24)  # 조금 더 크게
+    ref_frame.paragraphs[0].font.bold = True  # 볼드체
+    ref_frame.paragraphs[0].font.name = config.font_name
+    ref_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
+
+    # 본문 텍스트박스 - 교회 예시 스타일: 왼쪽 정렬
+    content_left = Inches(0.8)
+    content_top = Inches(1.8)
+    content_width = Inches(8.4)
+    content_height = Inches(5)
+
+    content_box = slide.shapes.add_textbox(content_left, content_top, content_width, content_height)
+    content_frame = content_box.text_frame
+    content_frame.word_wrap = True
+    content_frame.text = text
+
+    # 본문 스타일 - 교회 예시: 왼쪽 정렬
+    content_frame.paragraphs[0].alignment = PP_ALIGN.LEFT
+    content_frame.paragraphs[0].font.size = Pt(config.font_size)
+    content_frame.paragraphs[0].font.name = config.font_name
+    content_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
+    content_frame.paragraphs[0].line_spacing = 1.5
+
+def add_scripture_slides(renderer: DirectRenderer, scripture: ScriptureVerse, config: SlideConfig, auto_parse: bool = True):
     """
     성경 구절 슬라이드 추가 - 교회 예시 스타일
     - 레퍼런스는 축약형으로 간결하게 (예: [마5:13])
@@ -321,15 +521,14 @@ def add_scripture_slides(prs: Presentation, scripture: ScriptureVerse, config: S
     reference_display = scripture.reference
     if auto_parse:
         try:
-            lang = "korean"
-            if scripture.translation.upper() in ["NIV", "ESV", "KJV", "NKJV", "NASB"]:
-                lang = "english"
-            elif "Luther" in scripture.translation or "Elberfelder" in scripture.translation:
-                lang = "german"
-
-            parsed = parse_bible_reference(scripture.reference, lang)
+            # 언어는 레퍼런스 문자로 자동 감지 (한글/영어/독일어 약어 모두 같은 책 번호로 해석)
+            with stage("parse"):
+                parsed = parse_bible_reference(scripture.reference)
             # 교회 예시 스타일: 축약형 사용 (마5:13)
             book_abbrev = parsed.get("book_abbrev", scripture.reference)
+            # 오타를 교정한 경우 입력 대신 교정된 책 이름 표시
+            if parsed.get("book_id") and parsed.get("confidence", 1.0) < 1.0:
+                book_abbrev = parsed["book"]
             chapter = parsed.get("chapter")
             verses = parsed.get("verses")
 
@@ -343,98 +542,622 @@ def add_scripture_slides(prs: Presentation, scripture: ScriptureVerse, config: S
             reference_display = scripture.reference
 
     # 본문을 슬라이드에 맞게 분할
-    text_chunks = split_scripture_text(
-        scripture.text,
-        config.max_lines_per_slide,
-        config.chars_per_line
+    # 본문이 비어 있으면 Reference 데이터에서 절 단위로 스트리밍 (긴 본문도 한 슬라이드 분량씩 처리)
+    if scripture.text:
+        with stage("paginate"):
+            text_chunks = split_scripture_text(
+                scripture.text,
+                config.max_lines_per_slide,
+                config.chars_per_line
+            )
+    else:
+        # 스트리밍 분할은 슬라이드를 만들면서 진행되므로 다음 분량을 꺼낼 때마다 측정 (절 읽기 포함)
+        text_chunks = timed_iter("paginate", iter_scripture_chunks(
+            iter_reference_text(scripture.reference),
+            config.max_lines_per_slide,
+            config.chars_per_line
+        ))
+
+    reference_text = f"[{reference_display}]"
+    slide_count = 0
+    for chunk in text_chunks:
+        renderer.add(add_scripture_slide, config, scripture.reference_position, reference=reference_text, text=chunk)
+        slide_count += 1
+
+    if slide_count == 0:
+        # 본문이 없으면(없는 장, 데이터 없음) 구역이 사라지지 않도록 안내 슬라이드
+        logger.warning("⚠️ 본문을 찾을 수 없음: %s", scripture.reference)
+        renderer.add(add_scripture_slide, config, scripture.reference_position,
+                     reference=reference_text, text=MISSING_SCRIPTURE_TEXT)
+
+# 덱 구성 단위 (제목, 예배 순서 하나, 성경 구절 하나, 찬송가 하나)
+Section = Tuple[str, object]
+
+def presentation_sections(request: PresentationRequest) -> List[Section]:
+    """요청을 덱 구역 목록으로 분리 (슬라이드 순서대로)"""
+    return (
+        [("title", (request.title, request.date))]
+        + [("order", order) for order in request.worship_orders]
+        + [("scripture", scripture) for scripture in request.scriptures]
+        + [("hymn", hymn) for hymn in request.hymns]
     )
 
-    for i, chunk in enumerate(text_chunks):
-        slide = prs.slides.add_slide(prs.slide_layouts[6])
+def render_section(renderer: DirectRenderer, request: PresentationRequest, section: Section):
+    """구역 하나의 슬라이드 추가"""
+    kind, item = section
+    config = request.config
+
+    if kind == "title":
+        # 제목 슬라이드
+        title, date = item
+        renderer.add(add_title_slide, config, title=title, subtitle=date)
+    elif kind == "order":
+        # 예배 순서 슬라이드 (한 순서 = 한 슬라이드)
+        if item.detail:
+            renderer.add(add_single_worship_order_slide, config, title=item.title, detail=item.detail)
+        else:
+            renderer.add(add_single_worship_order_slide, config, title=item.title)
+    elif kind == "scripture":
+        # 성경 본문 슬라이드들 (자동 분할)
+        add_scripture_slides(renderer, item, config, request.auto_parse_references)
+    elif kind == "hymn":
+        # 찬송가 슬라이드들
+        add_hymn_slides(renderer, item.hymn_number, config)
+
+def new_presentation() -> Presentation:
+    """슬라이드 없는 4:3 프레젠테이션"""
+    prs = Presentation()
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    return prs
+
+def build_presentation(request: PresentationRequest,
+                       renderer_factory: Callable[[Presentation], DirectRenderer] = create_renderer) -> Presentation:
+    """
+    요청 내용으로 덱 생성
+    제목 → 예배 순서 → 성경 본문 → 찬송가 순서
 
-        # 배경색
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = hex_to_rgb(config.background_color)
+    Args:
+        renderer_factory: 렌더러 생성 함수 (기본: SLIDE_RENDERER 설정, 원형 복제 렌더러)
+    """
+    prs = new_presentation()
+    renderer = renderer_factory(prs)
+    for section in presentation_sections(request):
+        render_section(renderer, request, section)
+    return prs
 
-        # 성경 참조 위치 계산
-        ref_left, ref_top = get_reference_position(scripture.reference_position)
+def layout_presentation(request: PresentationRequest) -> Dict:
+    """
+    덱 생성과 같은 내용 해석/분할로 슬라이드 배치만 계산 (python-pptx 사용 안 함)
 
-        # 성경 참조 텍스트박스 - 교회 예시 스타일: 간결하게
-        reference_text = f"[{reference_display}]"
-        # 페이지 번호는 표시하지 않음 (교회 예시와 동일)
+    Returns:
+        {"slides": [{"index", "section", "section_kind", "kind", "boxes", "overflow"}, ...],
+         "slide_count", "overflow_slides": [넘치는 슬라이드 번호, ...]}
+    """
+    renderer = LayoutRenderer()
+    slides = []
+    for section_index, section in enumerate(presentation_sections(request)):
+        start = len(renderer.slides)
+        render_section(renderer, request, section)
+        for draw_name, layout, texts in renderer.slides[start:]:
+            slide = describe_slide(draw_name, request.config, layout, texts)
+            slides.append(dict(slide, index=len(slides), section=section_index, section_kind=section[0]))
 
-        ref_box = slide.shapes.add_textbox(ref_left, ref_top, Inches(4), Inches(0.8))
-        ref_frame = ref_box.text_frame
-        ref_frame.text = reference_text
+    return {
+        "slides": slides,
+        "slide_count": len(slides),
+        "overflow_slides": [slide["index"] for slide in slides if slide["overflow"]]
+    }
+
+def render_section_parts(request: PresentationRequest, indices: List[int]) -> Dict[int, SectionParts]:
+    """
+    지정한 구역만 그려서 슬라이드 파트로 직렬화 (덱 생성 프로세스 풀에서 실행)
 
-        # 레퍼런스 정렬 (위치에 따라)
-        if "right" in scripture.reference_position:
-            ref_frame.paragraphs[0].alignment = PP_ALIGN.RIGHT
+    Returns:
+        {구역 위치: 슬라이드 파트}
+    """
+    sections = presentation_sections(request)
+    prs = new_presentation()
+    renderer = create_renderer(prs)
+    parts = {}
+    for index in indices:
+        with stage("render"):
+            render_section(renderer, request, sections[index])
+        with stage("save"):
+            parts[index] = tuple(slide_part_xml(slide) for slide in detach_slides(prs))
+    return parts
+
+@lru_cache(maxsize=1)
+def empty_package_parts() -> Tuple[Tuple[str, bytes], ...]:
+    """빈 프레젠테이션의 패키지 파트 (조립할 때마다 저장하지 않도록 한 번만 생성)"""
+    return package_parts(new_presentation())
+
+def assemble_presentation_output(sections: List[SectionParts]) -> DeckOutput:
+    """구역별 슬라이드 파트를 .pptx 패키지로 조립 (DECK_SPOOL_BYTES보다 크면 산출물 파일)"""
+    def write(output):
+        writer = StreamingDeckWriter(output)
+        writer.begin_parts(empty_package_parts())
+        for parts in sections:
+            for slide_xml, rels_xml in parts:
+                writer.write_slide_part(slide_xml, rels_xml)
+        writer.finish()
+
+    with stage("save"):
+        return spool_output(write)
+
+# 진행 상황 보고 함수: progress(단계, **세부 정보)
+ProgressCallback = Callable[..., None]
+
+async def render_sections_with_progress(request: PresentationRequest, parts: List[Optional[SectionParts]],
+                                        missing: List[int], progress: ProgressCallback) -> Dict[int, SectionParts]:
+    """
+    캐시에 없는 구역을 하나씩 따로 그려 끝날 때마다 진행 상황 보고
+    (슬라이드 총수는 배치 미리보기로 미리 계산, 구역들은 덱 생성 풀에서 동시에 그림)
+    """
+    layout = await run_io(layout_presentation, request)
+    state = {
+        "sections_done": len(parts) - len(missing),
+        "sections_total": len(parts),
+        "slides_done": sum(len(section_parts) for section_parts in parts if section_parts is not None),
+        "slides_total": layout["slide_count"],
+    }
+    progress("render", **state)
+
+    futures = [asyncio.ensure_future(run_render(render_section_parts, request, [index])) for index in missing]
+    rendered: Dict[int, SectionParts] = {}
+    try:
+        for future in asyncio.as_completed(futures):
+            result = await future
+            rendered.update(result)
+            for section_parts in result.values():
+                state["sections_done"] += 1
+                state["slides_done"] += len(section_parts)
+            progress("render", **state)
+    finally:
+        for future in futures:
+            future.cancel()
+    return rendered
+
+async def build_sectioned_output(request: PresentationRequest, section_keys: List[str],
+                                 session_id: Optional[str] = None,
+                                 progress: Optional[ProgressCallback] = None
+                                 ) -> Tuple[DeckOutput, Dict[str, SectionParts]]:
+    """
+    구역별 슬라이드 파트를 모아 패키지 조립 (캐시에 없는 구역만 덱 생성 프로세스 풀에서 그림)
+    - 편집 세션: 그 세션의 마지막 덱에 있던 구역 재사용 (세션 갱신은 호출하는 쪽에서, 반환한 구역 파트로)
+    - 찬송가/예배 순서: 요청 간에 공유하는 조각 캐시 재사용
+    (구역 키는 구역 내용 + SlideConfig의 해시이므로 순서만 바뀐 구역도 재사용)
+    progress가 있으면 구역을 하나씩 그리면서 단계("render", "assemble")와 구역/슬라이드 수를 보고
+    """
+    sections = presentation_sections(request)
+    sessions = get_edit_sessions()
+    fragments = get_fragment_cache()
+    previous = (sessions.get(session_id) or {}) if session_id is not None else {}
+
+    parts: List[Optional[SectionParts]] = []
+    for (kind, _), key in zip(sections, section_keys):
+        if key in previous:
+            parts.append(previous[key])
+        elif kind in FRAGMENT_KINDS:
+            parts.append(fragments.get(key))
         else:
-            ref_frame.paragraphs[0].alignment = PP_ALIGN.LEFT
-
-        ref_frame.paragraphs[0].font.size = Pt(24)  # 조금 더 크게
-        ref_frame.paragraphs[0].font.bold = True  # 볼드체
-        ref_frame.paragraphs[0].font.name = config.font_name
-        ref_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
-
-        # 본문 텍스트박스 - 교회 예시 스타일: 왼쪽 정렬
-        content_left = Inches(0.8)
-        content_top = Inches(1.8)
-        content_width = Inches(8.4)
-        content_height = Inches(5)
-
-        content_box = slide.shapes.add_textbox(content_left, content_top, content_width, content_height)
-        content_frame = content_box.text_frame
-        content_frame.word_wrap = True
-        content_frame.text = chunk
-
-        # 본문 스타일 - 교회 예시: 왼쪽 정렬
-        content_frame.paragraphs[0].alignment = PP_ALIGN.LEFT
-        content_frame.paragraphs[0].font.size = Pt(config.font_size)
-        content_frame.paragraphs[0].font.name = config.font_name
-        content_frame.paragraphs[0].font.color.rgb = hex_to_rgb(config.text_color)
-        content_frame.paragraphs[0].line_spacing = 1.5
+            parts.append(None)
+
+    missing = [index for index, section_parts in enumerate(parts) if section_parts is None]
+    if missing:
+        if progress is None:
+            rendered = await run_render(render_section_parts, request, missing)
+        else:
+            rendered = await render_sections_with_progress(request, parts, missing, progress)
+        for index in missing:
+            parts[index] = rendered[index]
+            if sections[index][0] in FRAGMENT_KINDS:
+                fragments.put(section_keys[index], rendered[index])
+
+    logger.debug("구역 %d개 중 %d개 생성", len(section_keys), len(missing))
+
+    if progress is not None:
+        progress("assemble", slides_total=sum(len(section_parts) for section_parts in parts))
+    return await run_io(assemble_presentation_output, parts), dict(zip(section_keys, parts))
+
+async def warm_fragment_cache():
+    """
+    많이 쓰는 찬송가(사용 기록 상위)와 고정 예배 순서의 조각을 기본 SlideConfig로 미리 생성
+    (서버 시작 시 백그라운드 작업으로 실행, 덱 생성 입장 제어를 거쳐 실제 요청과 같은 한도 안에서 그림)
+    """
+    usage = await run_io(get_hymn_usage)
+    request = PresentationRequest(
+        worship_orders=[WorshipOrder(title=title) for title in FRAGMENT_WARM_ORDERS],
+        hymns=[HymnRequest(hymn_number=number) for number in usage.most_used(FRAGMENT_WARM_HYMNS)]
+    )
+    _, section_keys = await run_io(presentation_cache_keys, request)
+    indices = [index for index, (kind, _) in enumerate(presentation_sections(request)) if kind in FRAGMENT_KINDS]
+    if not indices:
+        return
 
-@app.post("/generate-presentation")
-async def generate_presentation(request: PresentationRequest):
-    """PPT 생성 API - 성경 본문 중심"""
     try:
-        prs = Presentation()
-        prs.slide_width = Inches(10)
-        prs.slide_height = Inches(7.5)
+        cost = layout_render_cost(await run_io(layout_presentation, request))
+        async with get_render_limiter().slot(cost, block=True):
+            rendered = await run_render(render_section_parts, request, indices)
+    except Exception as e:
+        logger.warning("⚠️ 슬라이드 조각 미리 생성 실패: %r", e)
+        return
+
+    fragments = get_fragment_cache()
+    for index in indices:
+        fragments.put(section_keys[index], rendered[index])
+    logger.info("✅ 슬라이드 조각 %d개 미리 생성 (찬송가 %d곡)", len(indices), len(request.hymns))
+
+PPTX_MEDIA_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+
+def attachment_headers(filename: str) -> dict:
+    """다운로드 파일 이름 헤더 (한글 파일명은 RFC 5987 형식)"""
+    return {"Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}"}
+
+def write_presentation_stream(output, request: PresentationRequest) -> int:
+    """
+    덱을 만들면서 슬라이드마다 output 스트림에 바로 기록 (프레젠테이션 전체를 메모리에 두지 않음)
 
-        # 1. 제목 슬라이드
-        add_title_slide(prs, request.title, request.date, request.config)
+    Returns:
+        기록한 슬라이드 수
+    """
+    writer = StreamingDeckWriter(output)
+    with stage("render"):
+        build_presentation(request, lambda prs: StreamingRenderer(prs, writer))
+    writer.finish()
+    return writer.slide_count
 
-        # 2. 예배 순서 슬라이드들 (한 순서 = 한 슬라이드)
-        for order in request.worship_orders:
-            add_single_worship_order_slide(prs, order, request.config)
+# 덱 형식 버전 (그리기 함수나 저장 방식이 바뀌어 같은 요청의 결과가 달라지면 올려서 기존 캐시 무효화)
+DECK_FORMAT_VERSION = 2
 
-        # 3. 성경 본문 슬라이드들 (자동 분할)
-        for scripture in request.scriptures:
-            add_scripture_slides(prs, scripture, request.config, request.auto_parse_references)
+def section_cache_key(request: PresentationRequest, section: Section) -> str:
+    """
+    구역 키 (구역 내용 + SlideConfig + Reference 데이터에서 읽는 본문의 버전/가사의 SHA-256)
+    같은 구역이라도 Reference 데이터가 바뀌면 다른 키
+    (본문은 읽지 않고 장별 원본 버전만 사용하므로 304로 끝나는 요청도 본문 전체를 읽지 않음)
+    """
+    kind, item = section
+    digest = hashlib.sha256(f"deck-v{DECK_FORMAT_VERSION}\0{kind}\0".encode())
+    # pydantic은 필드 정의 순서로 직렬화하므로 같은 내용은 같은 JSON
+    digest.update(request.config.model_dump_json().encode("utf-8"))
+    if kind == "title":
+        digest.update(json.dumps(item, ensure_ascii=False).encode("utf-8"))
+    else:
+        digest.update(item.model_dump_json().encode("utf-8"))
+
+    if kind == "scripture":
+        digest.update(b"\0auto_parse" if request.auto_parse_references else b"\0")
+        if not item.text:
+            digest.update(b"\0source\0")
+            try:
+                digest.update(get_bible_loader().reference_version(item.reference).encode("utf-8"))
+            except ValueError:
+                # 잘못된 레퍼런스는 덱 생성에서 오류가 나므로 요청 자체로 구분
+                digest.update(b"\0invalid")
+    elif kind == "hymn":
+        hymn_data = get_hymn_loader().load_hymn(item.hymn_number)
+        digest.update(json.dumps(hymn_data, ensure_ascii=False, sort_keys=True).encode("utf-8"))
+
+    return digest.hexdigest()
+
+def presentation_cache_keys(request: PresentationRequest) -> Tuple[str, List[str]]:
+    """
+    덱 캐시 키와 구역 키 목록
 
-        # 4. 찬송가 슬라이드들
-        for hymn in request.hymns:
-            add_hymn_slides(prs, hymn.hymn_number, request.config)
+    Returns:
+        (덱 키, [구역 키])
+    """
+    section_keys = [section_cache_key(request, section) for section in presentation_sections(request)]
+    digest = hashlib.sha256(f"deck-v{DECK_FORMAT_VERSION}\0".encode())
+    digest.update(request.model_dump_json().encode("utf-8"))
+    for key in section_keys:
+        digest.update(key.encode("ascii"))
+    return digest.hexdigest(), section_keys
+
+# 같은 덱의 동시 생성 합치기
+_deck_flight = AsyncSingleFlight("deck")
+# 생성 중인 덱 키 → 진행 상황을 받을 함수 목록 (함께 기다리는 요청도 진행 상황을 받도록)
+_deck_progress: Dict[str, List[ProgressCallback]] = {}
+
+def deck_progress_broadcast(key: str) -> ProgressCallback:
+    """덱 키의 진행 상황을 그 덱을 기다리는 모든 요청에 전달하는 함수"""
+    def report(stage_name: str, **details):
+        for listener in list(_deck_progress.get(key, ())):
+            listener(stage_name, **details)
+    return report
+
+def layout_render_cost(layout: Dict) -> int:
+    """배치 미리보기 결과로 덱 생성 비용 추정 (슬라이드 수와 글자 수)"""
+    characters = sum(len(box["text"]) for slide in layout["slides"] for box in slide["boxes"])
+    return estimate_render_cost(layout["slide_count"], characters)
+
+async def cached_presentation_output(request: PresentationRequest, key: str, section_keys: List[str],
+                                     session_id: Optional[str] = None,
+                                     progress: Optional[ProgressCallback] = None,
+                                     block: bool = False) -> DeckOutput:
+    """
+    덱 캐시에서 찾고, 없으면 구역별로 생성해서 캐시에 저장 (찬송가 사용 횟수 기록 포함)
+    같은 덱을 생성하는 중에 들어온 요청은 새로 만들지 않고 그 결과를 함께 받음
+    (생성 중인 진행 상황도 함께 받고, 편집 세션은 요청마다 자기 세션을 갱신)
+    생성은 입장 제어(동시 실행 수, 비용 예산)를 거침 (block이면 대기열 제한 없이 기다림)
+    함께 기다리던 생성이 입장 거부되면 이 요청의 입장 조건으로 다시 시도
 
-        # 임시 파일로 저장
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pptx')
-        prs.save(temp_file.name)
-        temp_file.close()
+    Raises:
+        AdmissionRejected: 덱 생성이 포화 상태이거나 요청 비용이 상한을 넘는 경우
 
-        return FileResponse(
-            temp_file.name,
-            media_type='application/vnd.openxmlformats-officedocument.presentationml.presentation',
-            filename=f"{request.title}_{request.date}.pptx"
-        )
+    Returns:
+        응답에 사용할 DeckOutput (temporary면 응답 후 파일 삭제)
+    """
+    usage = get_hymn_usage()
+    for hymn in request.hymns:
+        usage.record(hymn.hymn_number)
+
+    deck_cache = get_deck_cache()
+    output = await run_io(deck_cache.get, key)
+    if output is None:
+        async def build() -> Tuple[DeckOutput, Dict[str, SectionParts]]:
+            with stage("admission"):
+                cost = layout_render_cost(await run_io(layout_presentation, request))
+            async with get_render_limiter().slot(cost, block):
+                # python-pptx 작업은 CPU를 많이 쓰므로 캐시에 없는 구역만 별도 프로세스에서 그림 (이벤트 루프 차단 방지)
+                built, sections = await build_sectioned_output(
+                    request, section_keys, session_id,
+                    deck_progress_broadcast(key) if progress is not None else None
+                )
+            return await run_io(deck_cache.put, key, built), sections
+
+        if progress is not None:
+            _deck_progress.setdefault(key, []).append(progress)
+        try:
+            while True:
+                joining = _deck_flight.running(key)
+                try:
+                    (output, sections), shared = await _deck_flight.run(key, build)
+                    break
+                except AdmissionRejected:
+                    if not joining:
+                        raise
+                    # 함께 기다리던 다른 요청의 생성이 거부됨 (그 요청의 입장 조건이었으므로 다시 시도)
+                    logger.debug("덱 생성 입장 거부를 함께 받아 다시 시도: %s", key)
+        finally:
+            if progress is not None:
+                listeners = _deck_progress[key]
+                listeners.remove(progress)
+                if not listeners:
+                    del _deck_progress[key]
+
+        if session_id is not None:
+            get_edit_sessions().put(session_id, sections)
+        if joining and progress is not None:
+            # 생성을 시작한 요청이 진행 상황을 보고하지 않았으면 그리는 동안의 진행 상황은 없음
+            progress("assemble", slides_total=sum(len(sections[section_key]) for section_key in section_keys))
+        if shared and output.temporary:
+            # 여러 응답이 같은 산출물 파일을 보내므로 응답 후 삭제하지 않음 (정리기가 TTL 뒤 삭제)
+            output = output._replace(temporary=False)
+    return output
+
+async def run_presentation_job(payload: Tuple[PresentationRequest, Optional[str]],
+                               progress: ProgressCallback) -> DeckOutput:
+    """
+    작업 큐에서 덱 생성 (/generate-presentation과 같은 캐시 사용, 진행 상황 보고, 결과는 항상 산출물 파일)
+    payload: (요청, 편집 세션 ID)
+    """
+    request, session_id = payload
+    progress("resolve")
+    key, section_keys = await run_io(presentation_cache_keys, request)
+    # 작업은 이미 작업 큐에서 기다렸으므로 덱 생성 자리가 날 때까지 기다림
+    output = await cached_presentation_output(request, key, section_keys, session_id, progress=progress, block=True)
+    # 결과는 만료될 때까지 보관하므로 메모리가 아닌 작업 전용 산출물 파일로 (만료/취소 시 삭제)
+    return await run_io(own_output, output)
+
+def deck_response(output: DeckOutput, headers: dict, delete_after: bool = True) -> Response:
+    """
+    덱 다운로드 응답 (작은 덱은 메모리에서, 큰 덱은 파일 스트리밍)
+    delete_after면 임시 산출물 파일을 응답 후 삭제 (남으면 정리기가 삭제)
+    """
+    if output.data is not None:
+        return Response(content=output.data, media_type=PPTX_MEDIA_TYPE, headers=headers)
+    return FileResponse(
+        output.path,
+        media_type=PPTX_MEDIA_TYPE,
+        headers=headers,
+        background=BackgroundTask(remove_artifact, output.path) if delete_after and output.temporary else None
+    )
 
+def edit_session_id(http_request: Request) -> Optional[str]:
+    """X-Edit-Session 헤더 (없으면 None, 길이가 맞지 않으면 400)"""
+    session_id = http_request.headers.get("x-edit-session")
+    if session_id is not None and not 0 < len(session_id) <= MAX_SESSION_ID_LENGTH:
+        raise HTTPException(status_code=400, detail=f"X-Edit-Session은 1~{MAX_SESSION_ID_LENGTH}자여야 합니다")
+    return session_id
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (여러 값, *, 약한 비교 W/ 지원)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+@app.post("/generate-presentation")
+async def generate_presentation(request: PresentationRequest, http_request: Request):
+    """
+    PPT 생성 API - 성경 본문 중심
+    같은 내용의 덱은 캐시에서 응답하고, If-None-Match가 ETag와 같으면 304
+    덱 생성이 포화 상태면 429/503 (Retry-After), 너무 큰 덱은 413
+    찬송가/예배 순서 슬라이드는 조각 캐시에서 가져오고,
+    X-Edit-Session 헤더가 있으면 그 세션의 마지막 덱에서 바뀐 구역만 다시 생성
+    """
+    session_id = edit_session_id(http_request)
+
+    try:
+        with stage("cache"):
+            key, section_keys = await run_io(presentation_cache_keys, request)
+        etag = f'"{key}"'
+        if etag_matches(http_request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        output = await cached_presentation_output(request, key, section_keys, session_id)
+
+        filename = f"{request.title}_{request.date}.pptx"
+        # 큰 덱은 파일을 스트리밍 (디스크 캐시에 넣지 못한 산출물 파일은 응답 후 삭제)
+        return deck_response(output, dict(attachment_headers(filename), ETag=etag))
+
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+async def resume_stream(first: bytes, chunks: AsyncIterator[bytes], name: str) -> AsyncIterator[bytes]:
+    """
+    미리 받은 첫 조각 뒤로 나머지 스트림을 이어서 내보냄
+    응답을 시작한 뒤 생성이 실패하면 기록하고 예외를 다시 내서 연결을 끊음
+    (잘린 .pptx가 정상 응답처럼 끝나지 않도록)
+    """
+    try:
+        yield first
+        async for chunk in chunks:
+            yield chunk
+    except Exception:
+        logger.exception("❌ 스트리밍 덱 생성 중단: %s", name)
+        raise
+    finally:
+        await chunks.aclose()
+
+async def admitted_stream(chunks: AsyncIterator[bytes], cost: int) -> AsyncIterator[bytes]:
+    """
+    덱 생성 자리를 얻은 뒤에 스트림을 시작하고 스트림이 끝나거나 끊기면 반납
+    (첫 조각을 기다릴 때 자리를 얻으므로 입장 거부는 응답 전에 AdmissionRejected로 남)
+    """
+    async with get_render_limiter().slot(cost):
+        async for chunk in chunks:
+            yield chunk
+
+@app.post("/generate-presentation-stream")
+async def generate_presentation_stream(request: PresentationRequest):
+    """
+    PPT 생성 API (스트리밍) - /generate-presentation과 같은 요청
+    슬라이드를 만드는 대로 .pptx zip을 내려보내므로 책 전체 봉독처럼 긴 덱도 메모리 사용량이 일정하고,
+    마지막 슬라이드가 만들어지기 전에 다운로드가 시작됨
+    (덱 생성 프로세스 풀이 아닌 I/O 스레드에서 생성)
+
+    응답을 시작하기 전에 레퍼런스 해석/분할을 미리 해 보고 첫 조각(첫 슬라이드 포함)이 나올 때까지 기다리므로
+    그 전에 난 오류는 500으로 응답, 그 뒤의 오류는 연결을 끊음
+    /generate-presentation과 같은 입장 제어를 거침 (포화 상태면 429/503, 너무 큰 덱은 413)
+    """
+    filename = f"{request.title}_{request.date}.pptx"
+    try:
+        with stage("preflight"):
+            cost = layout_render_cost(await run_io(layout_presentation, request))
+        chunks = admitted_stream(stream_io(write_presentation_stream, request), cost)
+        first = await anext(chunks, b"")
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail, headers=e.headers)
+    except Exception as e:
+        logger.warning("❌ 스트리밍 덱 생성 실패: %s (%s)", filename, e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        resume_stream(first, chunks, filename),
+        media_type=PPTX_MEDIA_TYPE,
+        headers=attachment_headers(filename)
+    )
+
+def get_job_queue() -> JobQueue:
+    """서버 시작 시 만든 작업 큐 (시작 전이면 503)"""
+    jobs = getattr(app.state, "jobs", None)
+    if jobs is None:
+        raise HTTPException(status_code=503, detail="Job queue is not running")
+    return jobs
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: PresentationRequest, http_request: Request):
+    """
+    덱 생성 작업 등록 API - /generate-presentation과 같은 요청 (X-Edit-Session 헤더도 같게 처리)
+    작업 ID를 바로 돌려주고 서버 작업자가 생성 (요청 시간 제한이나 연결 끊김과 무관)
+    출력: {"job_id", "status": "queued", "position", "status_url", "events_url", "result_url"}
+    """
+    session_id = edit_session_id(http_request)
+    job = get_job_queue().submit((request, session_id), f"{request.title}_{request.date}.pptx")
+    if job is None:
+        raise HTTPException(status_code=503, detail="Too many jobs, try again later")
+    return dict(
+        get_job_queue().describe(job),
+        status_url=f"/jobs/{job.job_id}",
+        events_url=f"/jobs/{job.job_id}/events",
+        result_url=f"/jobs/{job.job_id}/result"
+    )
+
+@app.get("/jobs")
+async def job_stats():
+    """작업 큐 통계 (작업자 수, 상태별 작업 수, 완료/실패/거부 횟수)"""
+    return get_job_queue().stats()
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    """
+    작업 상태 API
+    status: queued (position: 앞에 있는 작업 수) → running → done / failed (error) / cancelled
+    끝난 작업은 expires_at 이후 삭제
+    """
+    jobs = get_job_queue()
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return jobs.describe(job)
+
+@app.get("/jobs/{job_id}/result")
+async def job_result(job_id: str):
+    """작업 결과 .pptx 다운로드 (만료 전까지 여러 번 받을 수 있음, 끝나지 않았으면 409)"""
+    job = get_job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    if job.status != DONE:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    if job.output.path is not None and not os.path.exists(job.output.path):
+        raise HTTPException(status_code=404, detail="Job result expired")
+    # 결과 파일은 작업이 만료될 때 삭제
+    return deck_response(job.output, attachment_headers(job.filename), delete_after=False)
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """
+    작업 진행 상황 스트림 (Server-Sent Events, 브라우저에서는 EventSource로 구독)
+    event: progress → data: {"status", "stage": "queued" | "running" | "resolve" | "render" | "assemble",
+                             "sections_done", "sections_total", "slides_done", "slides_total"}
+    끝나면 event: done / failed / cancelled → data: /jobs/{job_id}와 같은 상태를 보내고 종료
+    """
+    jobs = get_job_queue()
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return StreamingResponse(
+        jobs.iter_events(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """작업 취소 (끝난 작업이면 결과 삭제)"""
+    jobs = get_job_queue()
+    job = jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return jobs.describe(job)
+
+@app.post("/preview-layout")
+async def preview_layout(request: PresentationRequest):
+    """
+    슬라이드 배치 미리보기 API - /generate-presentation과 같은 요청
+    .pptx를 만들지 않고 슬라이드 목록(종류, 텍스트, 위치, 추정 넘침)만 JSON으로 반환하므로
+    입력하는 동안 실시간 미리보기에 사용
+    """
+    with stage("preview"):
+        return await run_io(layout_presentation, request)
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """메인 페이지 - 웹 인터페이스"""
@@ -510,11 +1233,51 @@ async def debug_reference():
 
     return result
 
+@app.get("/cache-stats")
+async def cache_stats():
+    """캐시 적중/미스/제거 통계 (single_flight: 동시 요청을 합친 횟수)"""
+    return {
+        "passages": get_bible_loader().cache.stats(),
+        "decks": get_deck_cache().stats(),
+        "edit_sessions": get_edit_sessions().stats(),
+        "slide_fragments": get_fragment_cache().stats(),
+        "single_flight": get_single_flight_stats()
+    }
+
+@app.get("/memory-stats")
+async def memory_stats():
+    """
+    프로세스 전체 캐시 메모리 예산과 캐시별 사용량 (추정 바이트)
+    budget_evictions: 전체 예산 초과로 제거한 항목 수
+    """
+    return get_memory_budget().stats()
+
+@app.get("/admission-stats")
+async def admission_stats():
+    """입장 제어 통계 (render: 덱 생성, lookup: 조회 API)"""
+    return {
+        "render": get_render_limiter().stats(),
+        "lookup": get_lookup_limiter().stats()
+    }
+
+@app.get("/timing-stats")
+async def timing_stats(reset: bool = False):
+    """
+    엔드포인트별 단계 시간 누적 통계 (덱 생성 지연이 어느 단계에서 생기는지 확인용)
+    reset=true면 조회 후 초기화
+    """
+    stats = get_stage_stats()
+    snapshot = stats.snapshot()
+    if reset:
+        stats.reset()
+    return snapshot
+
 @app.get("/parse-bible-reference")
-async def parse_reference(reference: str, language: str = "korean"):
+async def parse_reference(reference: str, language: Optional[str] = None):
     """
     성경 참조 파싱 API
-    예: /parse-bible-reference?reference=마5:13&language=korean
+    예: /parse-bible-reference?reference=마5:13
+    language(korean/english/german)는 같은 약어가 여러 언어에 있을 때만 쓰는 힌트, 없으면 자동 감지
     """
     try:
         result = parse_bible_reference(reference, language)
@@ -526,12 +1289,12 @@ async def parse_reference(reference: str, language: str = "korean"):
 async def auto_parse_scripture(data: dict):
     """
     성경 구절 자동 파싱 API
-    입력: {"reference": "마5:13", "language": "korean"}
-    출력: {"book": "마태복음", "chapter": 5, "verse": 13, "formatted": "마태복음 5:13"}
+    입력: {"reference": "마5:13"} (language는 선택, 없으면 자동 감지)
+    출력: {"book": "마태복음", "book_id": 40, "language": "korean", "chapter": 5, "verses": "13", "formatted": "마태복음 5:13"}
     """
     try:
         reference = data.get("reference", "")
-        language = data.get("language", "korean")
+        language = data.get("language")
         result = parse_bible_reference(reference, language)
         return result
     except Exception as e:
@@ -541,32 +1304,36 @@ async def auto_parse_scripture(data: dict):
 async def fetch_scripture(data: dict):
     """
     성경 본문 자동 로드 API - 레퍼런스만 입력하면 본문을 가져옴
-    입력: {"reference": "출24:12-18"}
-    출력: {"reference": "출24:12-18", "text": "여호와께서 모세에게 이르시되...", "success": true}
+    입력: {"reference": "출24:12-18"} 또는 {"reference": "요3:16,18; 롬8:28-30"}
+    출력: {"reference": "출24:12-18", "text": "여호와께서 모세에게 이르시되...", "passages": [...], "success": true}
     """
     try:
         reference = data.get("reference", "")
         if not reference:
             raise HTTPException(status_code=400, detail="Reference is required")
 
-        print(f"📖 성경 본문 요청: {reference}")
+        logger.debug("📖 성경 본문 요청: %s", reference)
 
-        # 성경 본문 로드
-        loader = get_bible_loader()
-        print(f"   Bible loader path: {loader.bible_path}")
-        print(f"   Path exists: {os.path.exists(loader.bible_path) if loader.bible_path else False}")
+        # 성경 본문 로드 (파일 I/O는 스레드 풀에서)
+        loader = await run_io(get_bible_loader)
+        logger.debug("Bible loader path: %s", loader.bible_path)
 
-        text = loader.load_scripture(reference)
+        # 여러 구간 참조 지원 (예: "요3:16,18; 롬8:28-30")
+        passages = await run_io(loader.load_passages, reference)
+        text = None
+        if all(p["text"] is not None for p in passages):
+            text = ' '.join(p["text"] for p in passages)
 
         if text:
-            print(f"   ✅ 본문 로드 성공 ({len(text)} 글자)")
+            logger.debug("✅ 본문 로드 성공 (%d 글자)", len(text))
             return {
                 "success": True,
                 "reference": reference,
-                "text": text
+                "text": text,
+                "passages": passages
             }
         else:
-            print(f"   ❌ 본문 로드 실패")
+            logger.info("❌ 본문 로드 실패: %s", reference)
             # 디버깅 정보 추가
             backend_dir = os.path.dirname(__file__)
             ref_dir = os.path.join(backend_dir, "Reference")
@@ -587,15 +1354,117 @@ async def fetch_scripture(data: dict):
                 "debug": debug_info
             }
     except Exception as e:
-        print(f"   ❌ 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ 오류 발생: %s", e)
         return {
             "success": False,
             "reference": data.get("reference", ""),
             "error": f"{type(e).__name__}: {str(e)}"
         }
 
+# /fetch-scriptures 한 번에 받을 수 있는 최대 레퍼런스 수
+MAX_BATCH_REFERENCES = 50
+
+@app.post("/fetch-scriptures")
+async def fetch_scriptures(data: dict):
+    """
+    여러 성경 본문을 한 번에 로드하는 API
+    여러 레퍼런스가 같은 장을 공유하면 그 장은 한 번만 읽음
+    입력: {"references": ["출24:12-18", "요3:16,18"]}
+    출력: {"success": true, "results": [/fetch-scripture와 같은 형식, ...]} (입력 순서)
+    """
+    references = data.get("references")
+    if not isinstance(references, list) or not references:
+        raise HTTPException(status_code=400, detail="References list is required")
+    if len(references) > MAX_BATCH_REFERENCES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_REFERENCES} references are allowed")
+
+    references = [str(reference or "").strip() for reference in references]
+    loader = await run_io(get_bible_loader)
+    loaded = await run_io(loader.load_many, references)
+
+    results = []
+    for reference, passages in zip(references, loaded):
+        if isinstance(passages, ValueError):
+            results.append({
+                "success": False,
+                "reference": reference,
+                "error": f"ValueError: {passages}"
+            })
+        elif all(p["text"] is not None for p in passages):
+            results.append({
+                "success": True,
+                "reference": reference,
+                "text": ' '.join(p["text"] for p in passages),
+                "passages": passages
+            })
+        else:
+            results.append({
+                "success": False,
+                "reference": reference,
+                "error": "해당 구절을 찾을 수 없습니다. Reference 데이터가 설치되어 있는지 확인하세요."
+            })
+
+    return {
+        "success": all(result["success"] for result in results),
+        "results": results
+    }
+
+# /extract-references 원고 최대 길이 (글자)
+MAX_MANUSCRIPT_CHARS = int(os.getenv("MAX_MANUSCRIPT_CHARS", str(1_000_000)))
+
+@app.post("/extract-references")
+async def extract_references(data: dict):
+    """
+    설교 원고에서 성경 구절을 모두 찾아 본문과 함께 반환하는 API
+    원고를 한 번만 훑어 위치를 찾고, 본문은 /fetch-scriptures처럼 장 단위로 묶어 한 번에 로드
+    입력: {"text": "원고 (마크다운/일반 텍스트)", "language": "korean" (선택), "unique": true (같은 구절은 한 번만, 기본)}
+    출력: {"success": true,
+          "matches": [{"reference", "formatted", "text", "start", "end", "line", "book_id", "language"}, ...],
+          "scriptures": [{"reference", "text"}, ...] (PresentationRequest.scriptures에 그대로 사용),
+          "missing": [본문을 찾지 못한 레퍼런스, ...]}
+    """
+    text = data.get("text")
+    if not isinstance(text, str) or not text.strip():
+        raise HTTPException(status_code=400, detail="Manuscript text is required")
+    if len(text) > MAX_MANUSCRIPT_CHARS:
+        raise HTTPException(status_code=400, detail=f"Manuscript must be at most {MAX_MANUSCRIPT_CHARS} characters")
+
+    extractor = await run_io(get_reference_extractor)
+    matches = await run_io(extractor.extract, text, data.get("language"))
+    scriptures, missing = await run_io(load_scriptures, matches, bool(data.get("unique", True)))
+    logger.info("📖 원고 구절 추출: %d개 (본문 %d개, 실패 %d개)", len(matches), len(scriptures), len(missing))
+
+    return {
+        "success": not missing,
+        "matches": matches,
+        "scriptures": scriptures,
+        "missing": missing
+    }
+
+@app.get("/search-scripture")
+async def search_scripture(q: str, limit: int = 20):
+    """
+    성경 본문 전문 검색 API (한글 bigram 역색인)
+    예: /search-scripture?q=세상을 이처럼 사랑하사
+    출력: {"query": "...", "results": [{"reference": "요3:16", "snippet": "...", "score": 2.0, ...}]}
+    """
+    if not q.strip():
+        raise HTTPException(status_code=400, detail="Query is required")
+
+    index = await run_io(get_search_index)
+    if index is None:
+        return {
+            "success": False,
+            "query": q,
+            "error": "검색 인덱스를 만들 수 없습니다. Reference 데이터가 설치되어 있는지 확인하세요."
+        }
+
+    return {
+        "success": True,
+        "query": q,
+        "results": index.search(q, max(1, min(limit, 100)))
+    }
+
 @app.post("/fetch-hymn")
 async def fetch_hymn(data: dict):
     """
@@ -612,9 +1481,9 @@ async def fetch_hymn(data: dict):
         if hymn_number < 1 or hymn_number > 645:
             raise HTTPException(status_code=400, detail="Hymn number must be between 1 and 645")
 
-        # 찬송가 데이터 로드
-        loader = get_hymn_loader()
-        hymn_data = loader.load_hymn(hymn_number)
+        # 찬송가 데이터 로드 (파일 I/O는 스레드 풀에서)
+        loader = await run_io(get_hymn_loader)
+        hymn_data = await run_io(loader.load_hymn, hymn_number)
 
         if hymn_data:
             return {
@@ -0,0 +1,100 @@
+"""
+프로세스 전체 캐시 메모리 예산
+캐시마다 따로 정한 예산(DECK_CACHE_BYTES, EDIT_SESSION_BYTES, ...)은 합치면 작은 인스턴스의 메모리를 넘을 수 있으므로,
+모든 LRUCache가 생성될 때 여기에 등록하고 전체 사용량이 CACHE_MEMORY_BYTES를 넘으면 캐시를 가로질러 제거
+
+- 제거 대상: 각 캐시의 가장 오래 사용하지 않은 항목 중 크기 × 마지막 사용 후 경과 시간 ÷ 캐시 가중치가 가장 큰 것
+  (크고 오래 안 쓴 항목부터, 다시 만드는 비용이 큰 캐시(가중치가 큰 캐시)의 항목은 늦게)
+- 각 캐시 자체 예산은 그대로 적용됨 (전체 예산은 그 위의 상한)
+- 잠금 순서: 예산 잠금 → 캐시 잠금 (캐시는 자기 잠금을 쥔 채로 예산을 호출하지 않음)
+"""
+import os
+import time
+import threading
+import weakref
+from typing import Dict, List, Optional
+
+# 프로세스 전체 캐시 메모리 상한 (바이트, 0이면 전체 상한 없이 캐시별 예산만 적용)
+CACHE_MEMORY_BYTES = int(os.getenv("CACHE_MEMORY_BYTES", str(96 * 1024 * 1024)))
+
+
+class MemoryBudget:
+    """등록한 캐시들의 전체 메모리 상한 (스레드 안전)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        # 캐시 → 전체 예산 때문에 제거한 항목 수 (캐시가 사라지면 함께 빠짐)
+        self._caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def register(self, cache):
+        """캐시 등록 (LRUCache 생성 시 자동 호출)"""
+        with self._lock:
+            self._caches.setdefault(cache, 0)
+
+    def _registered(self) -> List:
+        return list(self._caches.keys())
+
+    def enforce(self):
+        """전체 사용량이 상한을 넘으면 넘지 않을 때까지 캐시를 가로질러 제거 (캐시 저장 후 호출)"""
+        if self.max_bytes <= 0:
+            return
+        with self._lock:
+            caches = self._registered()
+            total = sum(cache.current_bytes for cache in caches)
+            while total > self.max_bytes:
+                victim = self._pick_victim(caches)
+                if victim is None:
+                    break
+                cache, key = victim
+                size = cache.evict(key)
+                if size is None:
+                    # 그 사이 다른 스레드가 제거하거나 다시 사용함
+                    total = sum(cache.current_bytes for cache in caches)
+                    continue
+                self._caches[cache] += 1
+                self.evictions += 1
+                self.evicted_bytes += size
+                total -= size
+
+    def _pick_victim(self, caches: List) -> Optional[tuple]:
+        """제거할 (캐시, 키) (각 캐시의 가장 오래된 항목 중 점수가 가장 큰 것)"""
+        now = time.monotonic()
+        best = None
+        best_score = -1.0
+        for cache in caches:
+            oldest = cache.oldest()
+            if oldest is None:
+                continue
+            key, size, last_used = oldest
+            score = size * (now - last_used + 1.0) / cache.weight
+            if score > best_score:
+                best, best_score = (cache, key), score
+        return best
+
+    def stats(self) -> Dict:
+        """전체/캐시별 사용량"""
+        with self._lock:
+            caches = [
+                dict(cache.stats(), weight=cache.weight, budget_evictions=evictions)
+                for cache, evictions in self._caches.items()
+            ]
+        caches.sort(key=lambda cache: cache["bytes"], reverse=True)
+        return {
+            "bytes": sum(cache["bytes"] for cache in caches),
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+            "caches": caches,
+        }
+
+
+# 전역 인스턴스 (LRUCache가 import 시점에 등록하므로 바로 생성)
+_memory_budget = MemoryBudget(CACHE_MEMORY_BYTES)
+
+
+def get_memory_budget() -> MemoryBudget:
+    """프로세스 전체 캐시 메모리 예산"""
+    return _memory_budget
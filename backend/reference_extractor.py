@@ -0,0 +1,305 @@
+"""
+설교 원고에서 성경 구절 추출
+원고(마크다운/일반 텍스트) 전체를 한 번만 훑으며 모든 책 이름/약어를 아호-코라식 오토마톤으로 동시에 찾고,
+책 이름 바로 뒤의 장:절 표기를 읽어 레퍼런스로 변환
+
+- 책 이름 앞이 글자/숫자이면(단어 중간) 무시, 영어/독일어 책 이름은 대문자로 시작해야 인정
+- 한글 한 글자, 라틴 문자 두 글자 이하 약어("요", "사", "Ps")는 오인식을 줄이기 위해 절까지 있어야 인정
+  ("요 3:16"은 인정, "사 3"은 무시)
+- "3장 16절", "23편" 같은 한국어 표기는 "3:16", "23"으로 변환
+- 콜론 없이 장 하나와 절(구간)을 쉼표로 이은 "3,16", "3,16-18"은 책 이름의 언어와 관계없이 독일어식 "장,절"로 보고 "3:16"으로 변환
+- "23편"처럼 편이 붙은 표기는 시편 표기이므로 짧은 약어("시 23편")도 인정
+- 원고는 유니코드 NFC로 정규화하며, 위치(start/end)는 정규화한 원고 기준
+
+사용법: python -m backend.reference_extractor 원고.md
+"""
+import re
+import sys
+import json
+import bisect
+import argparse
+import threading
+import unicodedata
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .bible_books import iter_aliases, normalize_alias, resolve_book
+from .bible_parser import parse_bible_references
+from .bible_loader import get_bible_loader
+from .instrumentation import get_logger
+
+logger = get_logger("ReferenceExtractor")
+
+# 이 길이 이하의 약어는 절까지 있어야 구절로 인정 (한글, 라틴 문자)
+SHORT_HANGUL_ALIAS_LENGTH = 1
+SHORT_LATIN_ALIAS_LENGTH = 2
+
+# 장:절 구간 하나 (예: "3", "3:16", "3:16-18", "1:26-2:3")
+_RANGE = r'\d+(?:\s*:\s*\d+)?(?:\s*[-~–]\s*\d+(?:\s*:\s*\d+)?)?'
+# 책 이름 뒤의 장:절 표기 (줄바꿈은 넘지 않음)
+TAIL_PATTERN = re.compile(
+    r'[^\S\n]*(?:'
+    r'(?P<chapter>\d+)\s*장(?:\s*(?P<verses>\d+(?:\s*[-~–]\s*\d+)?)\s*절)?'
+    # 쉼표 뒤가 숫자로 시작하는 책 이름이면 다음 구절 (예: "John 3:16, 1 Cor 13:4")
+    rf'|(?P<ranges>{_RANGE}(?:\s*,\s*(?![1-3]\.?\s*[A-ZÄÖÜ]){_RANGE}(?![\w:]))*)(?P<psalm>\s*편)?'
+    r')'
+)
+_DASHES = re.compile(r'\s*[-~–]\s*')
+_SPACES = re.compile(r'\s+')
+_NUMBERED = re.compile(r'^([1-3])\.?\s*(.+)$')
+_HANGUL = re.compile(r'[가-힣]')
+# 독일어식 "장,절" 표기 (예: "3,16", "3,16-18", 콜론이 있으면 "3:16, 18"처럼 절 목록)
+_COMMA_VERSE = re.compile(r'^(\d+),(\d+(?:-\d+)?)$')
+
+
+class AhoCorasick:
+    """여러 문자열을 한 번에 찾는 아호-코라식 오토마톤 (본문 길이에 선형)"""
+
+    def __init__(self, patterns: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 상태에서 끝나는 패턴 길이 (실패 링크를 따라 도달하는 패턴 포함)
+        self._out: List[Tuple[int, ...]] = [()]
+        for pattern in patterns:
+            self._add(pattern)
+        self._build()
+
+    def _add(self, pattern: str):
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][ch] = next_state
+            state = next_state
+        if pattern and len(pattern) not in self._out[state]:
+            self._out[state] += (len(pattern),)
+
+    def _build(self):
+        """실패 링크 계산 (너비 우선, 얕은 상태의 출력이 먼저 확정됨)"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(ch, 0)
+                self._out[next_state] += self._out[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """일치하는 모든 (시작, 끝) 위치 (끝 위치 순)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for end, ch in enumerate(text, 1):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for length in out[state]:
+                yield end - length, end
+
+
+def surface_forms(alias: str) -> Set[str]:
+    """별칭의 원고 표기 변형 (소문자, 예: "1. Mose" → "1. mose", "1.mose", "1 mose", "1mose")"""
+    alias = unicodedata.normalize("NFC", alias).lower()
+    match = _NUMBERED.match(alias)
+    if not match:
+        return {alias}
+    number, rest = match.groups()
+    return {f"{number}{separator}{rest}" for separator in ("", " ", ".", ". ")}
+
+
+def _lower_same_length(text: str) -> str:
+    """위치가 바뀌지 않는 소문자 변환 (소문자가 두 글자 이상이 되는 문자는 그대로)"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(ch.lower() if len(ch.lower()) == 1 else ch for ch in text)
+
+
+def _tail_reference(tail: re.Match) -> Optional[Tuple[str, bool]]:
+    """장:절 표기 → (파서 형식 문자열, 절 포함 여부)"""
+    if tail.group("chapter"):
+        verses = tail.group("verses")
+        if verses:
+            return f"{tail.group('chapter')}:{_DASHES.sub('-', verses)}", True
+        return tail.group("chapter"), False
+    ranges = tail.group("ranges")
+    if not ranges:
+        return None
+    ranges = _SPACES.sub('', _DASHES.sub('-', ranges))
+    comma_verse = _COMMA_VERSE.match(ranges)
+    if comma_verse:
+        return f"{comma_verse.group(1)}:{comma_verse.group(2)}", True
+    return ranges, ':' in ranges
+
+
+class ReferenceExtractor:
+    """원고 → 성경 구절 목록 (모든 책 별칭으로 만든 오토마톤 하나로 한 번에 탐색, 스레드 안전)"""
+
+    def __init__(self):
+        patterns = set()
+        for alias, _, _ in iter_aliases():
+            patterns |= surface_forms(alias)
+        self.automaton = AhoCorasick(sorted(patterns))
+        logger.info("📖 원고 구절 추출기 준비 (책 이름 표기 %d개)", len(patterns))
+
+    def _candidate(self, text: str, start: int, end: int, language: Optional[str]) -> Optional[Dict]:
+        """책 이름 후보 하나를 검사하고 뒤의 장:절까지 읽어 구절로 변환, 구절이 아니면 None"""
+        # 단어 중간이면 무시 (예: "이사 3:1"의 "사")
+        if start > 0 and text[start - 1].isalnum():
+            return None
+        # 영어/독일어 책 이름은 대문자로 시작 (예: "am 3:00"의 "am"은 무시)
+        first_letter = next((ch for ch in text[start:end] if ch.isalpha()), "")
+        if first_letter.islower():
+            return None
+
+        tail = TAIL_PATTERN.match(text, end)
+        if tail is None:
+            return None
+        parsed = _tail_reference(tail)
+        if parsed is None:
+            return None
+        chapter_verses, has_verses = parsed
+
+        book = _SPACES.sub(' ', text[start:end])
+        if not has_verses and not tail.group("psalm"):
+            short_length = SHORT_HANGUL_ALIAS_LENGTH if _HANGUL.search(book) else SHORT_LATIN_ALIAS_LENGTH
+            if len(normalize_alias(book)) <= short_length:
+                return None
+            # 장만 있는데 바로 뒤에 글자가 붙으면 구절 표기가 아님 (예: "요한 2명")
+            if not tail.group("chapter"):
+                after = text[tail.end():tail.end() + 1]
+                if after.isalpha():
+                    return None
+
+        match = resolve_book(book, language)
+        if match is None:
+            return None
+        reference = f"{book} {chapter_verses}"
+        try:
+            segments = parse_bible_references(reference, match.language)
+        except ValueError:
+            return None
+
+        return {
+            "reference": reference,
+            "formatted": "; ".join(segment["formatted"] for segment in segments),
+            "text": text[start:tail.end()],
+            "start": start,
+            "end": tail.end(),
+            "book_id": match.number,
+            "language": match.language,
+        }
+
+    def extract(self, text: str, language: Optional[str] = None) -> List[Dict]:
+        """
+        원고에서 성경 구절을 모두 찾음 (원고 순서, 겹치면 먼저 시작하는 더 긴 표기 하나만)
+
+        Args:
+            language: 언어 힌트 (같은 약어가 여러 언어에 있을 때만 사용)
+
+        Returns:
+            [{"reference": 파서 형식 레퍼런스, "formatted", "text": 원고 표기, "start", "end",
+              "line": 줄 번호(1부터), "book_id", "language"}, ...]
+        """
+        text = unicodedata.normalize("NFC", text)
+        lowered = _lower_same_length(text)
+
+        candidates = {}
+        for start, end in self.automaton.iter_matches(lowered):
+            # 같은 위치에서 시작하는 표기 중 구절이 되는 가장 긴 것
+            if end - start <= candidates.get(start, (0, None))[0]:
+                continue
+            found = self._candidate(text, start, end, language)
+            if found is not None:
+                candidates[start] = (end - start, found)
+
+        newlines = [i for i, ch in enumerate(text) if ch == '\n']
+        results = []
+        covered = 0
+        for start in sorted(candidates):
+            found = candidates[start][1]
+            if start < covered:
+                continue
+            found["line"] = bisect.bisect_left(newlines, start) + 1
+            results.append(found)
+            covered = found["end"]
+        return results
+
+
+def load_scriptures(matches: List[Dict], unique: bool = True) -> Tuple[List[Dict], List[str]]:
+    """
+    추출한 구절의 본문을 한 번에 로드 (여러 구절이 같은 장을 공유하면 그 장은 한 번만 읽음)
+
+    Args:
+        unique: 같은 구절(formatted 기준)은 처음 한 번만
+
+    Returns:
+        ([{"reference", "text"}, ...] (PresentationRequest.scriptures 형식), 본문을 찾지 못한 레퍼런스 목록)
+    """
+    references = []
+    seen = set()
+    for found in matches:
+        if unique:
+            if found["formatted"] in seen:
+                continue
+            seen.add(found["formatted"])
+        references.append(found["reference"])
+
+    loaded = get_bible_loader().load_many(references)
+    scriptures = []
+    missing = []
+    for reference, passages in zip(references, loaded):
+        if isinstance(passages, ValueError) or any(p["text"] is None for p in passages):
+            missing.append(reference)
+            continue
+        scriptures.append({
+            "reference": reference,
+            "text": ' '.join(p["text"] for p in passages)
+        })
+    return scriptures, missing
+
+
+# 전역 인스턴스
+_reference_extractor = None
+_reference_extractor_lock = threading.Lock()
+
+def get_reference_extractor() -> ReferenceExtractor:
+    """원고 구절 추출기 싱글톤 (처음 사용할 때 오토마톤 생성)"""
+    global _reference_extractor
+    if _reference_extractor is None:
+        with _reference_extractor_lock:
+            if _reference_extractor is None:
+                _reference_extractor = ReferenceExtractor()
+    return _reference_extractor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="설교 원고에서 성경 구절 추출")
+    parser.add_argument("manuscript", help="원고 파일 경로 (-이면 표준 입력)")
+    parser.add_argument("--language", help="언어 힌트 (korean, english, german)")
+    parser.add_argument("--all", action="store_true", help="같은 구절도 나올 때마다 모두 포함")
+    parser.add_argument("--no-text", action="store_true", help="본문을 로드하지 않고 위치만 출력")
+    args = parser.parse_args()
+
+    if args.manuscript == "-":
+        text = sys.stdin.read()
+    else:
+        with open(args.manuscript, "r", encoding="utf-8") as f:
+            text = f.read()
+
+    matches = get_reference_extractor().extract(text, args.language)
+    result = {"matches": matches}
+    if not args.no_text:
+        result["scriptures"], result["missing"] = load_scriptures(matches, unique=not args.all)
+    json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
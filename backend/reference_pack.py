@@ -0,0 +1,286 @@
+"""
+Reference 데이터 팩 (성경 + 찬송가)
+compile_reference로 만든 단일 바이너리 파일을 mmap으로 열어 사용
+여러 워커 프로세스가 같은 페이지를 공유하고, 압축 해제 없이 바로 조회 가능
+
+파일 구조 (모두 little-endian):
+    헤더        magic(8) version(2) reserved(2) sha256(32) payload_length(8)
+    개수        장 수, 구절 수, 찬송가 수, 찬송가 절 수 (각 4바이트)
+    장 테이블    (책 번호, 장, 첫 구절 레코드, 구절 수)
+    구절 테이블  (절 번호, 문자열 오프셋, 문자열 길이)
+    찬송가 테이블 (번호, 제목 오프셋/길이, 후렴 오프셋/길이, 첫 절 레코드, 절 수)
+    찬송가 절 테이블 (문자열 오프셋, 문자열 길이)
+    문자열 풀    UTF-8 문자열 연속 저장
+"""
+import os
+import mmap
+import struct
+import hashlib
+import threading
+from typing import Optional, Dict, List, Tuple
+
+PACK_MAGIC = b"SSGPACK\0"
+PACK_VERSION = 1
+
+# 기본 팩 경로 (환경 변수로 변경 가능)
+DEFAULT_PACK_PATH = os.getenv(
+    "REFERENCE_PACK",
+    os.path.join(os.path.dirname(__file__), "reference.pack")
+)
+
+HEADER = struct.Struct('<8sHH32sQ')
+COUNTS = struct.Struct('<IIII')
+CHAPTER_RECORD = struct.Struct('<HHII')
+VERSE_RECORD = struct.Struct('<HII')
+HYMN_RECORD = struct.Struct('<HIIIIII')
+STRING_RECORD = struct.Struct('<II')
+
+
+class ReferencePackBuilder:
+    """Reference 팩 작성기 (compile_reference에서 사용)"""
+
+    def __init__(self):
+        self._pool = bytearray()
+        self._strings: Dict[str, Tuple[int, int]] = {}
+        self._chapters: List[tuple] = []
+        self._verses: List[tuple] = []
+        self._hymns: List[tuple] = []
+        self._hymn_verses: List[tuple] = []
+
+    def _add_string(self, text: str) -> Tuple[int, int]:
+        """문자열 풀에 추가 (같은 문자열은 한 번만 저장)"""
+        if text not in self._strings:
+            data = text.encode('utf-8')
+            self._strings[text] = (len(self._pool), len(data))
+            self._pool.extend(data)
+        return self._strings[text]
+
+    def add_chapter(self, book_number: int, chapter: int, verses: List[Tuple[int, str]]):
+        """
+        장 하나 추가
+
+        Args:
+            verses: [(절 번호, 정리된 본문), ...]
+        """
+        first = len(self._verses)
+        for verse, text in sorted(verses):
+            offset, length = self._add_string(text)
+            self._verses.append((verse, offset, length))
+        self._chapters.append((book_number, chapter, first, len(verses)))
+
+    def add_hymn(self, number: int, title: str, verses: List[str], chorus: str):
+        """찬송가 하나 추가"""
+        title_offset, title_length = self._add_string(title)
+        chorus_offset, chorus_length = self._add_string(chorus or "")
+        first = len(self._hymn_verses)
+        for verse in verses:
+            self._hymn_verses.append(self._add_string(verse))
+        self._hymns.append((number, title_offset, title_length, chorus_offset, chorus_length, first, len(verses)))
+
+    def write(self, path: str) -> Dict:
+        """
+        팩 파일 저장 (임시 파일에 쓴 뒤 교체)
+
+        Returns:
+            요약 정보 (개수, 크기, 체크섬)
+        """
+        chapters = sorted(self._chapters)
+        hymns = sorted(self._hymns)
+
+        payload = bytearray()
+        payload += COUNTS.pack(len(chapters), len(self._verses), len(hymns), len(self._hymn_verses))
+        for record in chapters:
+            payload += CHAPTER_RECORD.pack(*record)
+        for record in self._verses:
+            payload += VERSE_RECORD.pack(*record)
+        for record in hymns:
+            payload += HYMN_RECORD.pack(*record)
+        for record in self._hymn_verses:
+            payload += STRING_RECORD.pack(*record)
+        payload += self._pool
+
+        checksum = hashlib.sha256(payload).digest()
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, 0, checksum, len(payload)))
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+        return {
+            "path": path,
+            "chapters": len(chapters),
+            "verses": len(self._verses),
+            "hymns": len(hymns),
+            "size": HEADER.size + len(payload),
+            "sha256": checksum.hex()
+        }
+
+
+class ReferencePack:
+    """mmap으로 연 읽기 전용 Reference 팩"""
+
+    def __init__(self, path: str, verify: bool = True):
+        """
+        Args:
+            path: 팩 파일 경로
+            verify: 체크섬 검증 여부
+
+        Raises:
+            ValueError: 팩 형식이 잘못되었거나 체크섬이 맞지 않는 경우
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._open(verify)
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _open(self, verify: bool):
+        """헤더 검증 후 장/찬송가 테이블 위치 계산"""
+        if len(self._mm) < HEADER.size:
+            raise ValueError("Reference 팩이 너무 작습니다")
+
+        magic, version, _, checksum, payload_length = HEADER.unpack_from(self._mm, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError("Reference 팩 형식이 아닙니다")
+        if version != PACK_VERSION:
+            raise ValueError(f"지원하지 않는 Reference 팩 버전: {version}")
+        if HEADER.size + payload_length != len(self._mm):
+            raise ValueError("Reference 팩 크기가 헤더와 다릅니다")
+
+        if verify:
+            view = memoryview(self._mm)[HEADER.size:]
+            try:
+                actual = hashlib.sha256(view).digest()
+            finally:
+                view.release()
+            if actual != checksum:
+                raise ValueError("Reference 팩 체크섬이 맞지 않습니다")
+
+        self.checksum = checksum.hex()
+
+        offset = HEADER.size
+        chapter_count, verse_count, hymn_count, hymn_verse_count = COUNTS.unpack_from(self._mm, offset)
+        offset += COUNTS.size
+
+        # {(책 번호, 장): (첫 구절 레코드, 구절 수)}
+        self._chapters: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        for book_number, chapter, first, count in CHAPTER_RECORD.iter_unpack(
+                self._mm[offset:offset + chapter_count * CHAPTER_RECORD.size]):
+            self._chapters[(book_number, chapter)] = (first, count)
+        offset += chapter_count * CHAPTER_RECORD.size
+
+        self._verses_offset = offset
+        offset += verse_count * VERSE_RECORD.size
+
+        # {찬송가 번호: 레코드 위치}
+        self._hymns: Dict[int, int] = {}
+        hymns_offset = offset
+        for i in range(hymn_count):
+            number = struct.unpack_from('<H', self._mm, hymns_offset + i * HYMN_RECORD.size)[0]
+            self._hymns[number] = hymns_offset + i * HYMN_RECORD.size
+        offset += hymn_count * HYMN_RECORD.size
+
+        self._hymn_verses_offset = offset
+        offset += hymn_verse_count * STRING_RECORD.size
+
+        self._pool_offset = offset
+
+    def close(self):
+        """mmap 해제"""
+        self._mm.close()
+
+    def _string(self, offset: int, length: int) -> str:
+        """문자열 풀에서 문자열 읽기"""
+        start = self._pool_offset + offset
+        return self._mm[start:start + length].decode('utf-8')
+
+    def chapter_numbers(self, book_number: int) -> List[int]:
+        """책에 있는 장 번호 목록 (오름차순)"""
+        return sorted(chapter for book, chapter in self._chapters if book == book_number)
+
+    def has_chapter(self, book_number: int, chapter: int) -> bool:
+        """해당 장이 팩에 있는지 확인"""
+        return (book_number, chapter) in self._chapters
+
+    def verses(self, book_number: int, chapter: int, start: int = 1,
+               end: Optional[int] = None) -> Optional[List[Tuple[int, str]]]:
+        """
+        장의 start~end 절 조회 (end가 None이면 장 끝까지)
+
+        Returns:
+            [(절 번호, 본문), ...], 장이 없으면 None
+        """
+        location = self._chapters.get((book_number, chapter))
+        if location is None:
+            return None
+
+        first, count = location
+        record_offset = self._verses_offset + first * VERSE_RECORD.size
+        records = self._mm[record_offset:record_offset + count * VERSE_RECORD.size]
+
+        result = []
+        for verse, offset, length in VERSE_RECORD.iter_unpack(records):
+            if verse < start:
+                continue
+            if end is not None and verse > end:
+                break
+            result.append((verse, self._string(offset, length)))
+        return result
+
+    @property
+    def hymn_numbers(self) -> List[int]:
+        """팩에 있는 찬송가 번호 목록"""
+        return sorted(self._hymns)
+
+    def hymn(self, number: int) -> Optional[Dict]:
+        """
+        찬송가 조회
+
+        Returns:
+            HymnLoader.load_hymn과 같은 형식의 dict, 없으면 None
+        """
+        record_offset = self._hymns.get(number)
+        if record_offset is None:
+            return None
+
+        (_, title_offset, title_length, chorus_offset, chorus_length,
+         first, count) = HYMN_RECORD.unpack_from(self._mm, record_offset)
+
+        verses_offset = self._hymn_verses_offset + first * STRING_RECORD.size
+        verses = [
+            self._string(offset, length)
+            for offset, length in STRING_RECORD.iter_unpack(
+                self._mm[verses_offset:verses_offset + count * STRING_RECORD.size])
+        ]
+
+        return {
+            "number": number,
+            "title": self._string(title_offset, title_length),
+            "verses": verses,
+            "chorus": self._string(chorus_offset, chorus_length)
+        }
+
+
+# 전역 인스턴스
+_reference_pack = None
+_reference_pack_checked = False
+_reference_pack_lock = threading.Lock()
+
+def get_reference_pack() -> Optional[ReferencePack]:
+    """Reference 팩 싱글톤 (팩이 없거나 손상되었으면 None)"""
+    global _reference_pack, _reference_pack_checked
+    if not _reference_pack_checked:
+        with _reference_pack_lock:
+            if not _reference_pack_checked:
+                if os.path.exists(DEFAULT_PACK_PATH):
+                    try:
+                        _reference_pack = ReferencePack(DEFAULT_PACK_PATH)
+                        print(f"[ReferencePack] ✅ 팩 로드: {DEFAULT_PACK_PATH}")
+                    except (OSError, ValueError) as e:
+                        print(f"[ReferencePack] ⚠️ 팩을 사용할 수 없음: {e}")
+                _reference_pack_checked = True
+    return _reference_pack
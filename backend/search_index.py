@@ -0,0 +1,276 @@
+"""
+성경 본문 전문 검색 인덱스
+개역개정 전체 구절을 한글 글자 bigram 역색인으로 만들어 파일로 저장
+검색 시에는 메모리의 역색인만 사용 (파일 스캔 없음)
+
+파일 구조 (모두 little-endian):
+    헤더        magic(8) version(2) 원본 서명 길이(2) 원본 서명
+    개수        구절 수, bigram 수 (각 4바이트)
+    구절 키      (책 번호, 장, 절) × 구절 수 (각 2바이트)
+    구절 본문    UTF-8 바이트 길이(4) + 본문 ('\n' 구분)
+    bigram 목록  UTF-8 바이트 길이(4) + bigram ('\n' 구분)
+    포스팅 범위  bigram마다 시작 위치 (4바이트, bigram 수 + 1개)
+    포스팅      구절 ID (4바이트)
+"""
+import os
+import re
+import sys
+import time
+import struct
+import threading
+from array import array
+from collections import defaultdict
+from typing import Optional, Dict, List, Tuple
+
+from .bible_loader import BibleLoader, get_bible_loader
+from .bible_books import book_abbrev
+
+INDEX_MAGIC = b"SSGSRCH\0"
+INDEX_VERSION = 1
+
+# 기본 인덱스 경로 (환경 변수로 변경 가능)
+DEFAULT_INDEX_PATH = os.getenv(
+    "SEARCH_INDEX",
+    os.path.join(os.path.dirname(__file__), "search_index.bin")
+)
+
+HEADER = struct.Struct('<8sHH')
+COUNTS = struct.Struct('<II')
+LENGTH = struct.Struct('<I')
+
+# 검색용 정규화: 공백과 문장부호 제거
+NORMALIZE_PATTERN = re.compile(r'[\s\W_]+')
+
+
+def normalize(text: str) -> str:
+    """검색용 정규화 (공백/문장부호 제거, 소문자)"""
+    return NORMALIZE_PATTERN.sub('', text).lower()
+
+
+def bigrams(normalized: str) -> List[str]:
+    """글자 bigram 목록 (두 글자 미만이면 빈 목록)"""
+    return [normalized[i:i + 2] for i in range(len(normalized) - 1)]
+
+
+def _native(values: array) -> array:
+    """파일은 little-endian으로 저장 (빅엔디언 환경 대응)"""
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+class ScriptureSearchIndex:
+    """성경 bigram 역색인"""
+
+    def __init__(self):
+        # 구절 ID → (책 번호, 장, 절)을 펼쳐 저장
+        self.keys = array('H')
+        self.texts: List[str] = []
+        # {bigram: (포스팅 시작, 끝)}
+        self.terms: Dict[str, Tuple[int, int]] = {}
+        self.postings = array('I')
+        self.signature = ""
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def build(cls, loader: BibleLoader, signature: str) -> "ScriptureSearchIndex":
+        """BibleLoader로 성경 전체를 한 번 읽어 역색인 생성"""
+        index = cls()
+        index.signature = signature
+        term_postings: Dict[str, array] = defaultdict(lambda: array('I'))
+
+        for book_number in range(1, 67):
+            for record in loader.iter_verses(book_number):
+                verse_id = len(index.texts)
+                index.keys.extend((record.book_number, record.chapter, record.verse))
+                index.texts.append(record.text)
+                for term in set(bigrams(normalize(record.text))):
+                    term_postings[term].append(verse_id)
+
+        for term in sorted(term_postings):
+            start = len(index.postings)
+            index.postings.extend(term_postings[term])
+            index.terms[term] = (start, len(index.postings))
+        return index
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        구절 검색
+
+        Returns:
+            [{"reference", "book_number", "chapter", "verse", "snippet", "score"}, ...] (점수 순)
+        """
+        normalized_query = normalize(query)
+        query_terms = set(bigrams(normalized_query))
+        if not query_terms:
+            return []
+
+        # 포스팅이 짧은 bigram부터 세어서 구절별 일치 bigram 수 계산
+        counts: Dict[int, int] = defaultdict(int)
+        postings = memoryview(self.postings)
+        for term in sorted(query_terms, key=lambda t: self._posting_length(t)):
+            span = self.terms.get(term)
+            if span is None:
+                continue
+            for verse_id in postings[span[0]:span[1]]:
+                counts[verse_id] += 1
+
+        # 절반 이상의 bigram이 일치하는 구절만 후보
+        threshold = max(1, (len(query_terms) + 1) // 2)
+        candidates = [(count, verse_id) for verse_id, count in counts.items() if count >= threshold]
+
+        scored = []
+        for count, verse_id in candidates:
+            score = count / len(query_terms)
+            # 모든 bigram이 일치하고 검색어가 그대로 들어 있으면 가산점
+            if count == len(query_terms) and normalized_query in normalize(self.texts[verse_id]):
+                score += 1.0
+            scored.append((-score, verse_id))
+        scored.sort()
+
+        results = []
+        for negative_score, verse_id in scored[:limit]:
+            book_number, chapter, verse = self.keys[verse_id * 3:verse_id * 3 + 3]
+            results.append({
+                "reference": f"{book_abbrev(book_number) or book_number}{chapter}:{verse}",
+                "book_number": book_number,
+                "chapter": chapter,
+                "verse": verse,
+                "snippet": self._snippet(self.texts[verse_id], query),
+                "score": round(-negative_score, 4)
+            })
+        return results
+
+    def _posting_length(self, term: str) -> int:
+        span = self.terms.get(term)
+        return span[1] - span[0] if span else 0
+
+    def _snippet(self, text: str, query: str, width: int = 40) -> str:
+        """검색어 주변 본문 (공백 차이는 무시하고 위치 찾기)"""
+        chars = [re.escape(c) for c in normalize(query)]
+        match = re.search(r'\s*'.join(chars), text, re.IGNORECASE) if chars else None
+        if not match:
+            return text[:width * 2] + ('…' if len(text) > width * 2 else '')
+
+        start = max(0, match.start() - width)
+        end = min(len(text), match.end() + width)
+        return ('…' if start > 0 else '') + text[start:end] + ('…' if end < len(text) else '')
+
+    def save(self, path: str):
+        """인덱스 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        signature = self.signature.encode('utf-8')
+        texts = '\n'.join(self.texts).encode('utf-8')
+        terms = sorted(self.terms, key=lambda t: self.terms[t][0])
+        term_bytes = '\n'.join(terms).encode('utf-8')
+        bounds = array('I', [self.terms[t][0] for t in terms] + [len(self.postings)])
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(signature)))
+            f.write(signature)
+            f.write(COUNTS.pack(len(self.texts), len(terms)))
+            f.write(_native(self.keys).tobytes())
+            f.write(LENGTH.pack(len(texts)))
+            f.write(texts)
+            f.write(LENGTH.pack(len(term_bytes)))
+            f.write(term_bytes)
+            f.write(_native(bounds).tobytes())
+            f.write(_native(self.postings).tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ScriptureSearchIndex":
+        """
+        인덱스 파일 읽기
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        magic, version, signature_length = HEADER.unpack_from(data, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError("검색 인덱스 형식이 아닙니다")
+        offset = HEADER.size
+
+        index = cls()
+        index.signature = data[offset:offset + signature_length].decode('utf-8')
+        offset += signature_length
+
+        verse_count, term_count = COUNTS.unpack_from(data, offset)
+        offset += COUNTS.size
+
+        index.keys = _native(array('H', data[offset:offset + verse_count * 6]))
+        offset += verse_count * 6
+
+        (texts_length,) = LENGTH.unpack_from(data, offset)
+        offset += LENGTH.size
+        index.texts = data[offset:offset + texts_length].decode('utf-8').split('\n') if verse_count else []
+        offset += texts_length
+
+        (terms_length,) = LENGTH.unpack_from(data, offset)
+        offset += LENGTH.size
+        terms = data[offset:offset + terms_length].decode('utf-8').split('\n') if term_count else []
+        offset += terms_length
+
+        bounds = _native(array('I', data[offset:offset + (term_count + 1) * 4]))
+        offset += (term_count + 1) * 4
+        index.terms = {term: (bounds[i], bounds[i + 1]) for i, term in enumerate(terms)}
+
+        index.postings = _native(array('I', data[offset:]))
+        if len(index.texts) != verse_count or len(index.postings) != bounds[-1]:
+            raise ValueError("검색 인덱스가 손상되었습니다")
+        return index
+
+
+def load_or_build(loader: BibleLoader, path: str = DEFAULT_INDEX_PATH) -> Optional[ScriptureSearchIndex]:
+    """
+    저장된 검색 인덱스를 읽고, 없거나 원본이 바뀌었으면 다시 생성해 저장
+
+    Returns:
+        검색 인덱스, 성경 데이터가 없으면 None
+    """
+    signature = loader.data_signature()
+    if signature is None:
+        return None
+
+    if os.path.exists(path):
+        try:
+            index = ScriptureSearchIndex.load(path)
+            if index.signature == signature:
+                print(f"[SearchIndex] 저장된 검색 인덱스 사용 ({len(index)}개 절)")
+                return index
+        except (OSError, ValueError, struct.error) as e:
+            print(f"[SearchIndex] ⚠️ 검색 인덱스를 읽을 수 없음: {e}")
+
+    started = time.perf_counter()
+    index = ScriptureSearchIndex.build(loader, signature)
+    print(f"[SearchIndex] 검색 인덱스 생성 완료 ({len(index)}개 절, {time.perf_counter() - started:.2f}초)")
+    try:
+        index.save(path)
+    except OSError as e:
+        print(f"[SearchIndex] ⚠️ 검색 인덱스를 저장할 수 없음: {e}")
+    return index
+
+
+# 전역 인스턴스
+_search_index = None
+_search_index_lock = threading.Lock()
+
+def get_search_index() -> Optional[ScriptureSearchIndex]:
+    """검색 인덱스 싱글톤 (최초 사용 시 로드/생성)"""
+    global _search_index
+    if _search_index is None:
+        with _search_index_lock:
+            if _search_index is None:
+                _search_index = load_or_build(get_bible_loader())
+    return _search_index
+
+
+if __name__ == "__main__":
+    # 빌드 단계에서 미리 생성: python -m backend.search_index
+    load_or_build(get_bible_loader())
@@ -0,0 +1,138 @@
+"""
+같은 작업의 동시 요청 합치기 (single-flight)
+예배 직전 여러 사람이 같은 찬송가/본문을 불러오고 같은 덱을 만들 때,
+진행 중인 같은 키의 작업이 있으면 새로 시작하지 않고 그 결과를 함께 받음
+
+- SingleFlight: 스레드용 (I/O 스레드 풀에서 실행하는 로더)
+- AsyncSingleFlight: 이벤트 루프용 (덱 생성)
+- 결과를 보관하지는 않음 (끝난 뒤의 같은 요청은 각 캐시가 처리)
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+_registry: List["SingleFlight"] = []
+_registry_lock = threading.Lock()
+
+
+class _Call:
+    """진행 중인 작업 하나 (기다리는 호출 수와 결과)"""
+
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 한 번의 실행으로 합침 (스레드 안전)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+        with _registry_lock:
+            _registry.append(self)
+
+    def do(self, key: Hashable, func: Callable, *args) -> Any:
+        """
+        key로 진행 중인 호출이 있으면 그 결과(또는 예외)를 기다려 받고, 없으면 func(*args) 실행
+        """
+        return self.do_shared(key, func, *args)[0]
+
+    def do_shared(self, key: Hashable, func: Callable, *args) -> Tuple[Any, bool]:
+        """
+        do와 같고 결과를 다른 호출과 나눠 받았는지도 반환
+
+        Returns:
+            (결과, 공유 여부)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                leader = True
+                self.executed += 1
+            else:
+                call.waiters += 1
+                leader = False
+                self.shared += 1
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, call.waiters > 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            in_flight = len(self._calls)
+        return {"name": self.name, "executed": self.executed, "shared": self.shared, "in_flight": in_flight}
+
+
+class AsyncSingleFlight(SingleFlight):
+    """
+    같은 키의 동시 코루틴을 하나의 태스크로 합침 (이벤트 루프 안에서만 사용)
+    먼저 요청한 쪽이 취소되어도(연결 끊김) 기다리는 쪽이 있으면 작업은 계속됨
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._tasks: Dict[Hashable, Tuple[asyncio.Task, List[int]]] = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable]) -> Tuple[Any, bool]:
+        """
+        key로 진행 중인 태스크가 있으면 그 결과를 기다리고, 없으면 factory()로 태스크 시작
+
+        Returns:
+            (결과, 공유 여부)
+        """
+        entry = self._tasks.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(self._run(key, factory))
+            entry = self._tasks[key] = (task, [0])
+            self.executed += 1
+        else:
+            entry[1][0] += 1
+            self.shared += 1
+
+        task, waiters = entry
+        result = await asyncio.shield(task)
+        return result, waiters[0] > 0
+
+    def running(self, key: Hashable) -> bool:
+        """key로 진행 중인 태스크가 있는지 (있으면 지금 run을 호출할 때 그 결과를 함께 받음)"""
+        return key in self._tasks
+
+    async def _run(self, key: Hashable, factory: Callable[[], Awaitable]) -> Any:
+        try:
+            return await factory()
+        finally:
+            # 태스크가 끝나는 순간 제거 (끝난 뒤에 결과를 나눠 받는 호출이 없도록)
+            self._tasks.pop(key, None)
+
+    def stats(self) -> Dict:
+        return {"name": self.name, "executed": self.executed, "shared": self.shared, "in_flight": len(self._tasks)}
+
+
+def get_single_flight_stats() -> List[Dict]:
+    """모든 single-flight 통계"""
+    with _registry_lock:
+        flights = list(_registry)
+    return [flight.stats() for flight in flights]
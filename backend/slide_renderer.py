@@ -0,0 +1,203 @@
+"""
+슬라이드 렌더러
+- DirectRenderer: 슬라이드마다 python-pptx로 배경/텍스트박스/글꼴을 직접 설정 (기존 방식)
+- PrototypeRenderer: 슬라이드 종류 × SlideConfig마다 스타일이 적용된 원형 슬라이드 XML을 한 번 만들고,
+  이후 슬라이드는 원형을 복제한 뒤 텍스트만 바꿔 생성
+
+그리기 함수 규칙:
+    draw(prs, config, *layout, **texts)
+    - layout: 슬라이드 구조를 바꾸는 값 (예: 레퍼런스 위치), 원형 키에 포함
+    - texts: 텍스트박스에 들어가는 문자열, 원형에서는 표시자(⟦이름⟧)로 그린 뒤 복제 시 치환
+    - 빈 레이아웃(slide_layouts[6]) 슬라이드 하나만 추가하고, texts는 가공 없이 텍스트박스에 넣어야 함
+"""
+import os
+from copy import deepcopy
+from typing import Callable, Dict, List, Optional, Tuple
+
+from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from lxml import etree
+
+from .cache import LRUCache
+
+# 렌더러 선택 ("prototype" 또는 "direct")
+SLIDE_RENDERER = os.getenv("SLIDE_RENDERER", "prototype")
+# 직렬화된 원형 캐시 메모리 예산 (바이트)
+PROTOTYPE_CACHE_BYTES = int(os.getenv("PROTOTYPE_CACHE_BYTES", str(2 * 1024 * 1024)))
+
+# 그리기 함수가 사용하는 빈 레이아웃
+BLANK_LAYOUT = 6
+
+
+def text_marker(name: str) -> str:
+    """원형을 그릴 때 텍스트 자리에 넣는 표시자"""
+    return f"⟦{name}⟧"
+
+
+def set_text_body(txBody, text: str):
+    """
+    텍스트박스 본문 교체 (TextFrame.text와 같은 결과)
+    첫 문단의 서식(a:pPr)은 유지
+    """
+    p_lst = txBody.p_lst
+    pPr = p_lst[0].pPr if p_lst else None
+
+    txBody.clear_content()
+    for line in text.split("\n"):
+        txBody.add_p().append_text(line)
+
+    if pPr is not None:
+        txBody.p_lst[0].insert(0, pPr)
+
+
+def _paragraph_text(txBody) -> str:
+    return "\n".join(
+        "".join(t.text or "" for t in p.iter(qn("a:t")))
+        for p in txBody.p_lst
+    )
+
+
+class SlidePrototype:
+    """스타일이 적용된 원형 슬라이드 (배경 + 도형 XML + 텍스트 자리)"""
+
+    __slots__ = ("background", "shapes", "slots")
+
+    def __init__(self, background, shapes: List, slots: List[Tuple[int, str]]):
+        self.background = background
+        self.shapes = shapes
+        # [(도형 위치, 표시자가 들어 있는 텍스트 템플릿)]
+        self.slots = slots
+
+    @classmethod
+    def capture(cls, slide, text_names) -> "SlidePrototype":
+        """
+        표시자로 그린 슬라이드에서 원형 추출
+
+        Raises:
+            ValueError: 표시자를 찾지 못한 텍스트가 있는 경우 (그리기 함수가 텍스트를 가공함)
+        """
+        cSld = slide._element.cSld
+        background = deepcopy(cSld.bg) if cSld.bg is not None else None
+        shapes = [
+            deepcopy(shape) for shape in cSld.spTree.iterchildren()
+            if shape.tag not in (qn("p:nvGrpSpPr"), qn("p:grpSpPr"), qn("p:extLst"))
+        ]
+
+        slots = []
+        found = set()
+        for index, shape in enumerate(shapes):
+            txBody = getattr(shape, "txBody", None)
+            if txBody is None:
+                continue
+            template = _paragraph_text(txBody)
+            names = [name for name in text_names if text_marker(name) in template]
+            if names:
+                slots.append((index, template))
+                found.update(names)
+
+        missing = set(text_names) - found
+        if missing:
+            raise ValueError(f"원형에서 텍스트 자리를 찾을 수 없음: {sorted(missing)}")
+        return cls(background, shapes, slots)
+
+    def serialize(self) -> Tuple[Optional[bytes], Tuple[bytes, ...], Tuple[Tuple[int, str], ...]]:
+        """프로세스/스레드 간에 공유할 수 있는 직렬화 형태"""
+        background = etree.tostring(self.background) if self.background is not None else None
+        return background, tuple(etree.tostring(shape) for shape in self.shapes), tuple(self.slots)
+
+    @classmethod
+    def deserialize(cls, data) -> "SlidePrototype":
+        background, shapes, slots = data
+        return cls(
+            parse_xml(background) if background is not None else None,
+            [parse_xml(shape) for shape in shapes],
+            list(slots)
+        )
+
+    def stamp(self, prs, layout, texts: Dict[str, str]):
+        """원형을 복제해 슬라이드 추가 (텍스트만 치환)"""
+        slide = prs.slides.add_slide(layout)
+        cSld = slide._element.cSld
+        if self.background is not None:
+            cSld.insert(0, deepcopy(self.background))
+
+        spTree = cSld.spTree
+        shapes = [deepcopy(shape) for shape in self.shapes]
+        for shape in shapes:
+            spTree.insert_element_before(shape, "p:extLst")
+
+        for index, template in self.slots:
+            text = template
+            for name, value in texts.items():
+                text = text.replace(text_marker(name), value)
+            set_text_body(shapes[index].txBody, text)
+        return slide
+
+
+def _serialized_size(data) -> int:
+    background, shapes, slots = data
+    return (len(background or b"") + sum(len(shape) for shape in shapes)
+            + sum(len(template) for _, template in slots))
+
+
+# 직렬화된 원형 캐시 (덱 생성 요청 간 공유)
+_prototype_cache = LRUCache("slide-prototypes", PROTOTYPE_CACHE_BYTES, sizeof=_serialized_size)
+
+
+def get_prototype_cache() -> LRUCache:
+    """원형 캐시 (통계 확인용)"""
+    return _prototype_cache
+
+
+class DirectRenderer:
+    """슬라이드마다 python-pptx로 직접 그리는 렌더러"""
+
+    def __init__(self, prs):
+        self.prs = prs
+
+    def add(self, draw: Callable, config, *layout, **texts):
+        """슬라이드 하나 추가"""
+        draw(self.prs, config, *layout, **texts)
+
+
+class PrototypeRenderer(DirectRenderer):
+    """원형 슬라이드를 복제해 텍스트만 바꾸는 렌더러 (덱 하나에 하나씩 사용, 스레드 간 공유하지 않음)"""
+
+    def __init__(self, prs):
+        super().__init__(prs)
+        self._layout = prs.slide_layouts[BLANK_LAYOUT]
+        # 이 덱에서 파싱한 원형 {키: SlidePrototype}
+        self._prototypes: Dict[tuple, SlidePrototype] = {}
+        self._scratch = None
+
+    def add(self, draw: Callable, config, *layout, **texts):
+        """원형을 찾아(없으면 만들어) 복제"""
+        key = (draw.__module__, draw.__qualname__, config.model_dump_json(), layout, tuple(sorted(texts)))
+        prototype = self._prototypes.get(key)
+        if prototype is None:
+            prototype = self._load_prototype(key, draw, config, layout, sorted(texts))
+            self._prototypes[key] = prototype
+        prototype.stamp(self.prs, self._layout, {name: value or "" for name, value in texts.items()})
+
+    def _load_prototype(self, key: tuple, draw: Callable, config, layout: tuple,
+                        text_names: List[str]) -> SlidePrototype:
+        """공유 캐시에서 원형을 가져오고, 없으면 임시 프레젠테이션에 표시자로 그려서 생성"""
+        data = _prototype_cache.get(key)
+        if data is None:
+            if self._scratch is None:
+                self._scratch = Presentation()
+            draw(self._scratch, config, *layout, **{name: text_marker(name) for name in text_names})
+            slide = self._scratch.slides[-1]
+            if slide.slide_layout != self._scratch.slide_layouts[BLANK_LAYOUT]:
+                raise ValueError(f"{draw.__name__}: 원형은 빈 레이아웃 슬라이드만 지원합니다")
+            data = SlidePrototype.capture(slide, text_names).serialize()
+            _prototype_cache.put(key, data)
+        return SlidePrototype.deserialize(data)
+
+
+def create_renderer(prs) -> DirectRenderer:
+    """SLIDE_RENDERER 설정에 맞는 렌더러 생성"""
+    if SLIDE_RENDERER == "direct":
+        return DirectRenderer(prs)
+    return PrototypeRenderer(prs)
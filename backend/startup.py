@@ -7,6 +7,9 @@ import gdown
 import zipfile
 import shutil
 from pathlib import Path
+from .reference_pack import get_reference_pack
+from .hymn_loader import get_hymn_loader
+from .search_index import get_search_index
 
 
 def download_reference_data():
@@ -180,7 +183,19 @@ def initialize():
     print("=" * 60)
     print("🚀 서버 초기화 시작...")
     print("=" * 60)
-    download_reference_data()
+    # 컴파일된 Reference 팩이 있으면 다운로드/압축 해제 생략
+    pack = get_reference_pack()
+    if pack is not None:
+        print(f"✅ Reference 팩 사용: {pack.path}")
+    else:
+        download_reference_data()
+
+    # 성경 검색 인덱스 로드 (없으면 한 번 생성해 저장)
+    get_search_index()
+
+    # 찬송가 전체 미리 적재 (HYMN_WARMUP=1)
+    if os.getenv("HYMN_WARMUP", "0") == "1":
+        get_hymn_loader().warm_up()
     print("=" * 60)
     print("✅ 서버 초기화 완료!")
     print("=" * 60)
@@ -0,0 +1,168 @@
+"""
+스트리밍 OOXML(.pptx) 작성기
+python-pptx는 prs.save 전까지 모든 슬라이드를 메모리에 들고 있으므로,
+긴 덱(책 전체 봉독, 몇 시간짜리 집회 등)은 슬라이드를 하나 만들 때마다 zip 스트림에 바로 쓰고 버림
+
+- 슬라이드 없는 프레젠테이션의 고정 파트(마스터, 레이아웃, 테마 등)를 먼저 기록
+- 슬라이드 XML과 관계 파일은 만들어지는 대로 기록 (seek 불가능한 스트림도 가능)
+- 슬라이드 목록이 필요한 presentation.xml, 관계 파일, [Content_Types].xml은 마지막에 기록
+"""
+import io
+import zipfile
+from typing import Callable, Iterator, Optional, Tuple
+
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, serialize_part_xml
+from pptx.oxml import parse_xml
+
+from .slide_renderer import DirectRenderer, create_renderer
+from .instrumentation import stage
+
+CONTENT_TYPES_NAME = "[Content_Types].xml"
+PRESENTATION_NAME = "ppt/presentation.xml"
+PRESENTATION_RELS_NAME = "ppt/_rels/presentation.xml.rels"
+
+
+def package_parts(prs) -> Tuple[Tuple[str, bytes], ...]:
+    """
+    슬라이드 없는 프레젠테이션의 패키지 파트 ((이름, 내용), ...)
+
+    Raises:
+        ValueError: 이미 슬라이드가 있는 경우
+    """
+    if len(prs.slides):
+        raise ValueError("슬라이드가 없는 프레젠테이션으로 시작해야 합니다")
+
+    # 빈 프레젠테이션은 작으므로 한 번 저장해서 파트를 그대로 옮김
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    with zipfile.ZipFile(buffer) as base:
+        return tuple((info.filename, base.read(info)) for info in base.infolist())
+
+
+def slide_part_xml(slide) -> Tuple[bytes, bytes]:
+    """슬라이드 파트 직렬화: (슬라이드 XML, 관계 파일 XML)"""
+    rels = CT_Relationships.new()
+    for rel in slide.part.rels.values():
+        rels.add_rel(rel.rId, rel.reltype, rel.target_ref, rel.is_external)
+    return serialize_part_xml(slide._element), rels.xml
+
+
+def detach_slides(prs) -> Iterator:
+    """프레젠테이션의 슬라이드를 순서대로 꺼내면서 제거 (슬라이드 파트는 참조가 끊겨 해제됨)"""
+    sldIdLst = prs.slides._sldIdLst
+    for sldId in list(sldIdLst):
+        slide = prs.part.related_slide(sldId.rId)
+        sldIdLst.remove(sldId)
+        prs.part.drop_rel(sldId.rId)
+        yield slide
+
+
+class StreamingDeckWriter:
+    """슬라이드를 만드는 대로 .pptx zip 스트림에 기록"""
+
+    def __init__(self, output):
+        """
+        Args:
+            output: 쓰기 가능한 바이너리 파일 객체 (seek 불필요)
+        """
+        self._zip = zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED)
+        self._presentation_xml: Optional[bytes] = None
+        self._presentation_rels: Optional[bytes] = None
+        self._content_types: Optional[bytes] = None
+        # 첫 슬라이드를 쓸 때 함께 기록할 고정 파트
+        self._pending_parts: Tuple[Tuple[str, bytes], ...] = ()
+        self.slide_count = 0
+
+    def begin(self, prs):
+        """
+        슬라이드 없는 프레젠테이션의 고정 파트 기록
+
+        Raises:
+            ValueError: 이미 슬라이드가 있는 경우
+        """
+        self.begin_parts(package_parts(prs))
+
+    def begin_parts(self, parts: Tuple[Tuple[str, bytes], ...]):
+        """
+        package_parts 결과로 고정 파트 기록 (같은 빈 프레젠테이션을 여러 번 쓸 때 저장 생략)
+        실제 기록은 첫 슬라이드와 함께 (출력의 첫 바이트가 나올 때는 첫 슬라이드까지 그려진 상태)
+        """
+        pending = []
+        for name, data in parts:
+            if name == CONTENT_TYPES_NAME:
+                self._content_types = data
+            elif name == PRESENTATION_NAME:
+                self._presentation_xml = data
+            elif name == PRESENTATION_RELS_NAME:
+                self._presentation_rels = data
+            else:
+                pending.append((name, data))
+        self._pending_parts = tuple(pending)
+
+    def _write_pending_parts(self):
+        for name, data in self._pending_parts:
+            self._zip.writestr(name, data)
+        self._pending_parts = ()
+
+    def write_slide(self, slide):
+        """슬라이드 하나와 관계 파일 기록"""
+        with stage("save"):
+            self.write_slide_part(*slide_part_xml(slide))
+
+    def write_slide_part(self, slide_xml: bytes, rels_xml: bytes):
+        """직렬화된 슬라이드 XML과 관계 파일 기록 (slide_part_xml 결과)"""
+        self._write_pending_parts()
+        number = self.slide_count + 1
+        self._zip.writestr(f"ppt/slides/slide{number}.xml", slide_xml)
+        self._zip.writestr(f"ppt/slides/_rels/slide{number}.xml.rels", rels_xml)
+        self.slide_count = number
+
+    def finish(self):
+        """슬라이드 목록이 들어가는 파트를 기록하고 zip 닫기"""
+        with stage("save"):
+            self._write_pending_parts()
+            presentation = parse_xml(self._presentation_xml)
+            presentation_rels = parse_xml(self._presentation_rels)
+            content_types = parse_xml(self._content_types)
+
+            used = {int(rel.rId[3:]) for rel in presentation_rels.relationship_lst if rel.rId[3:].isdigit()}
+            next_rid = max(used, default=0) + 1
+
+            sldIdLst = presentation.get_or_add_sldIdLst() if self.slide_count else None
+            for number in range(1, self.slide_count + 1):
+                rId = f"rId{next_rid}"
+                next_rid += 1
+                presentation_rels.add_rel(rId, RT.SLIDE, f"slides/slide{number}.xml")
+                # add_sldId는 매번 기존 id를 모두 훑으므로 id를 직접 지정 (슬라이드 id는 256부터)
+                sldIdLst._add_sldId(id=255 + number, rId=rId)
+                content_types.add_override(f"/ppt/slides/slide{number}.xml", CT.PML_SLIDE)
+
+            self._zip.writestr(PRESENTATION_NAME, serialize_part_xml(presentation))
+            self._zip.writestr(PRESENTATION_RELS_NAME, serialize_part_xml(presentation_rels))
+            self._zip.writestr(CONTENT_TYPES_NAME, serialize_part_xml(content_types))
+            self._zip.close()
+
+
+class StreamingRenderer:
+    """
+    슬라이드를 하나 그릴 때마다 작성기로 내보내고 프레젠테이션에서 제거하는 렌더러
+    그리기는 내부 렌더러(원형 복제/직접 그리기)에 맡김
+    """
+
+    def __init__(self, prs, writer: StreamingDeckWriter,
+                 renderer_factory: Callable[..., DirectRenderer] = create_renderer):
+        self.prs = prs
+        self._writer = writer
+        self._inner = renderer_factory(prs)
+        writer.begin(prs)
+
+    def add(self, draw: Callable, config, *layout, **texts):
+        """슬라이드 하나 추가 후 바로 기록"""
+        self._inner.add(draw, config, *layout, **texts)
+        self._flush()
+
+    def _flush(self):
+        """프레젠테이션에 남은 슬라이드를 기록하고 제거"""
+        for slide in detach_slides(self.prs):
+            self._writer.write_slide(slide)
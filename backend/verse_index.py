@@ -0,0 +1,277 @@
+"""
+성경 구절 오프셋 인덱스
+Reference 성경 트리를 한 번만 스캔해 (책 번호, 장, 절) → (바이트 오프셋, 길이) 매핑을 만들고
+데이터 폴더 옆에 저장. 파일이 바뀐 경우에만 다시 생성
+서버 실행 중에 장 파일이 바뀌면 읽기 전에 크기/수정 시각을 확인해 그 장만 다시 인덱싱
+"""
+import os
+import re
+import json
+import bisect
+import hashlib
+from typing import Optional, Dict, List, Tuple
+
+# 인덱스 파일 이름 (성경 폴더 안에 저장)
+INDEX_FILENAME = ".verse_index.json"
+INDEX_VERSION = 2
+
+# "01_창세기" → 1
+BOOK_DIR_PATTERN = re.compile(r'^(\d+)_')
+# "창 1.md", "창_1.md", "1.md" → 1
+CHAPTER_FILE_PATTERN = re.compile(r'(?:^|[ _])(\d+)\.md$')
+# "###### 16"
+VERSE_HEADER_PATTERN = re.compile(rb'^######\s+(\d+)')
+
+
+def scan_chapter_files(bible_path: str) -> List[Tuple[int, int, str]]:
+    """
+    성경 폴더를 스캔해 장 파일 목록 반환
+
+    Returns:
+        [(책 번호, 장, 파일 경로), ...] (책 번호, 장 순)
+    """
+    files = []
+    for book_dir in os.listdir(bible_path):
+        book_match = BOOK_DIR_PATTERN.match(book_dir)
+        book_path = os.path.join(bible_path, book_dir)
+        if not book_match or not os.path.isdir(book_path):
+            continue
+
+        book_number = int(book_match.group(1))
+        for file in os.listdir(book_path):
+            chapter_match = CHAPTER_FILE_PATTERN.search(file)
+            if chapter_match:
+                files.append((book_number, int(chapter_match.group(1)), os.path.join(book_path, file)))
+
+    files.sort()
+    return files
+
+
+def _file_stat(path: str) -> Tuple[int, int]:
+    """(파일 크기, 수정 시각 ns)"""
+    stat = os.stat(path)
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _index_chapter_file(path: str) -> Tuple[Tuple[int, int], List[list]]:
+    """
+    장 파일 하나를 읽어 구절 오프셋 계산
+
+    Returns:
+        ((크기, 수정 시각 ns), [[절, 오프셋, 길이], ...])
+    """
+    # 읽기 전에 stat (읽는 도중 바뀌면 다음 조회에서 다시 인덱싱됨)
+    stat = _file_stat(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    headers = []
+    offset = 0
+    for line in data.splitlines(keepends=True):
+        verse_match = VERSE_HEADER_PATTERN.match(line)
+        if verse_match:
+            headers.append((int(verse_match.group(1)), offset))
+        offset += len(line)
+
+    verses = []
+    for i, (verse, start) in enumerate(headers):
+        end = headers[i + 1][1] if i + 1 < len(headers) else len(data)
+        verses.append([verse, start, end - start])
+    verses.sort()
+    return stat, verses
+
+
+class ChapterEntry:
+    """장 하나의 파일 경로와 구절 오프셋 테이블"""
+
+    __slots__ = ("path", "stat", "verse_numbers", "offsets", "lookup")
+
+    def __init__(self, path: str, stat: Tuple[int, int], verses: List[Tuple[int, int, int]]):
+        """
+        Args:
+            path: 장 파일 경로
+            stat: 인덱싱할 때의 (파일 크기, 수정 시각 ns)
+            verses: [(절 번호, 바이트 오프셋, 바이트 길이), ...] (절 번호 순)
+        """
+        self.path = path
+        self.stat = stat
+        self.verse_numbers = [v[0] for v in verses]
+        self.offsets = [(v[1], v[2]) for v in verses]
+        self.lookup = {v[0]: i for i, v in enumerate(verses)}
+
+    def span(self, start: int, end: Optional[int]) -> Optional[Tuple[int, int]]:
+        """
+        start~end 절을 덮는 (오프셋, 길이) 반환. 해당 구절이 없으면 None
+        end가 None이면 장 끝까지
+        """
+        if not self.verse_numbers:
+            return None
+
+        first = self.lookup.get(start)
+        if first is None:
+            first = bisect.bisect_left(self.verse_numbers, start)
+
+        if end is None:
+            last = len(self.verse_numbers) - 1
+        else:
+            last = self.lookup.get(end)
+            if last is None:
+                last = bisect.bisect_right(self.verse_numbers, end) - 1
+
+        if first >= len(self.verse_numbers) or last < first:
+            return None
+
+        offset = self.offsets[first][0]
+        last_offset, last_length = self.offsets[last]
+        return (offset, last_offset + last_length - offset)
+
+
+class VerseIndex:
+    """Reference 성경 트리의 구절 오프셋 인덱스"""
+
+    def __init__(self, bible_path: str, index_path: str = None):
+        """
+        Args:
+            bible_path: Reference/개역개정📖 폴더 경로
+            index_path: 인덱스 저장 경로 (기본: 성경 폴더 안의 .verse_index.json)
+        """
+        self.bible_path = bible_path
+        self.index_path = index_path or os.path.join(bible_path, INDEX_FILENAME)
+        # {(책 번호, 장): ChapterEntry}
+        self.chapters: Dict[Tuple[int, int], ChapterEntry] = {}
+        self.signature = None
+
+    def load(self) -> bool:
+        """
+        저장된 인덱스를 읽고, 없거나 데이터가 바뀌었으면 다시 생성
+
+        Returns:
+            인덱스 사용 가능 여부
+        """
+        if not self.bible_path or not os.path.isdir(self.bible_path):
+            return False
+
+        files = self._scan_files()
+        signature = self._compute_signature(files)
+
+        stored = self._read_index_file()
+        if stored and stored.get("version") == INDEX_VERSION and stored.get("signature") == signature:
+            self._load_chapters(stored["chapters"])
+            self.signature = signature
+            print(f"[VerseIndex] 저장된 인덱스 사용 ({len(self.chapters)}개 장)")
+            return True
+
+        chapters = self._build(files)
+        self._load_chapters(chapters)
+        self.signature = signature
+        self._write_index_file({"version": INDEX_VERSION, "signature": signature, "chapters": chapters})
+        print(f"[VerseIndex] 인덱스 생성 완료 ({len(self.chapters)}개 장)")
+        return True
+
+    def chapter_numbers(self, book_number: int) -> List[int]:
+        """책에 있는 장 번호 목록 (오름차순)"""
+        return sorted(chapter for book, chapter in self.chapters if book == book_number)
+
+    def chapter(self, book_number: int, chapter: int) -> Optional[ChapterEntry]:
+        """장 엔트리 조회"""
+        return self.chapters.get((book_number, chapter))
+
+    def read_span(self, book_number: int, chapter: int, start: int, end: Optional[int]) -> Optional[str]:
+        """
+        start~end 절의 원본 마크다운 조각을 seek 한 번으로 읽어 반환
+        (장 파일이 인덱싱 이후 바뀌었으면 그 장을 먼저 다시 인덱싱)
+
+        Returns:
+            "###### N"으로 시작하는 마크다운 조각, 해당 구절이 없으면 None
+        """
+        entry = self._current_entry(book_number, chapter)
+        if entry is None:
+            return None
+
+        span = entry.span(start, end)
+        if span is None:
+            return None
+
+        offset, length = span
+        with open(entry.path, 'rb') as f:
+            f.seek(offset)
+            data = f.read(length)
+        return data.decode('utf-8')
+
+    def _current_entry(self, book_number: int, chapter: int) -> Optional[ChapterEntry]:
+        """장 엔트리 조회 (파일 크기/수정 시각이 인덱싱 때와 다르면 그 장을 다시 인덱싱)"""
+        entry = self.chapter(book_number, chapter)
+        if entry is None:
+            return None
+        try:
+            stat = _file_stat(entry.path)
+        except OSError:
+            return None
+        if stat == entry.stat:
+            return entry
+
+        stat, verses = _index_chapter_file(entry.path)
+        entry = ChapterEntry(entry.path, stat, [tuple(v) for v in verses])
+        self.chapters[(book_number, chapter)] = entry
+        # 파생 인덱스(검색 인덱스 등)가 변경을 감지하도록 서명도 갱신
+        self.signature = self._compute_signature(self._scan_files())
+        print(f"[VerseIndex] 바뀐 장 다시 인덱싱: {book_number} {chapter}장")
+        return entry
+
+    def _scan_files(self) -> List[Tuple[int, int, str]]:
+        """성경 트리를 한 번 스캔해 [(책 번호, 장, 파일 경로), ...] 반환"""
+        return scan_chapter_files(self.bible_path)
+
+    def _compute_signature(self, files: List[Tuple[int, int, str]]) -> str:
+        """파일 경로, 크기, 수정 시각으로 데이터 서명 계산"""
+        digest = hashlib.sha1()
+        for book_number, chapter, path in files:
+            size, mtime_ns = _file_stat(path)
+            rel_path = os.path.relpath(path, self.bible_path)
+            digest.update(f"{rel_path}\0{size}\0{mtime_ns}\n".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _build(self, files: List[Tuple[int, int, str]]) -> List[list]:
+        """
+        모든 장 파일을 한 번 읽어 구절 오프셋 계산
+
+        Returns:
+            [[책 번호, 장, 상대 경로, [크기, 수정 시각 ns], [[절, 오프셋, 길이], ...]], ...]
+        """
+        chapters = []
+        for book_number, chapter, path in files:
+            stat, verses = _index_chapter_file(path)
+            chapters.append([book_number, chapter, os.path.relpath(path, self.bible_path), list(stat), verses])
+        return chapters
+
+    def _load_chapters(self, chapters: List[list]):
+        """직렬화된 장 목록을 메모리 테이블로 변환"""
+        self.chapters = {
+            (book_number, chapter): ChapterEntry(
+                os.path.join(self.bible_path, rel_path),
+                tuple(stat),
+                [tuple(v) for v in verses]
+            )
+            for book_number, chapter, rel_path, stat, verses in chapters
+        }
+
+    def _read_index_file(self) -> Optional[dict]:
+        """저장된 인덱스 파일 읽기"""
+        if not os.path.exists(self.index_path):
+            return None
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[VerseIndex] ⚠️ 인덱스 파일을 읽을 수 없음: {e}")
+            return None
+
+    def _write_index_file(self, data: dict):
+        """인덱스 파일 저장 (쓰기 실패해도 메모리 인덱스는 사용)"""
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"[VerseIndex] ⚠️ 인덱스 파일을 저장할 수 없음: {e}")
@@ -0,0 +1,117 @@
+"""입장 제어 (AdmissionLimiter)"""
+import asyncio
+
+import pytest
+
+from backend.admission import AdmissionLimiter, AdmissionRejected, estimate_render_cost
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_estimate_render_cost():
+    assert estimate_render_cost(3, 500) == 3 * 1000 + 500
+
+
+def test_rejects_request_over_cost_cap():
+    async def scenario():
+        limiter = AdmissionLimiter("render", 2, 2, 1, cost_budget=100, max_request_cost=100)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await limiter.acquire(101)
+        assert rejected.value.status_code == 413
+        assert rejected.value.headers == {}
+        assert limiter.running == 0
+    run(scenario())
+
+
+def test_full_queue_is_rejected_with_retry_after():
+    async def scenario():
+        limiter = AdmissionLimiter("render", 1, 1, 5)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await limiter.acquire()
+        assert rejected.value.status_code == 429
+        assert int(rejected.value.headers["Retry-After"]) >= 1
+        limiter.release()
+        await waiter
+        assert limiter.running == 1
+    run(scenario())
+
+
+def test_wait_timeout_returns_503():
+    async def scenario():
+        limiter = AdmissionLimiter("render", 1, 4, 0.05)
+        await limiter.acquire()
+        with pytest.raises(AdmissionRejected) as rejected:
+            await limiter.acquire()
+        assert rejected.value.status_code == 503
+        assert "Retry-After" in rejected.value.headers
+        assert limiter.stats()["waiting"] == 0
+        assert limiter.stats()["timed_out"] == 1
+    run(scenario())
+
+
+def test_cost_budget_holds_back_until_release():
+    async def scenario():
+        limiter = AdmissionLimiter("render", 5, 5, 1, cost_budget=100)
+        await limiter.acquire(80)
+        waiter = asyncio.create_task(limiter.acquire(30))
+        await asyncio.sleep(0.01)
+        assert (limiter.running, limiter.stats()["waiting"]) == (1, 1)
+        limiter.release(80)
+        await waiter
+        assert (limiter.running, limiter.running_cost) == (1, 30)
+    run(scenario())
+
+
+def test_single_request_over_budget_runs_alone():
+    async def scenario():
+        limiter = AdmissionLimiter("render", 2, 2, 1, cost_budget=100)
+        await limiter.acquire(150)
+        assert limiter.running_cost == 150
+    run(scenario())
+
+
+def test_queue_is_first_in_first_out():
+    async def scenario():
+        limiter = AdmissionLimiter("render", 1, 4, 1)
+        order = []
+
+        async def worker(name):
+            async with limiter.slot():
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(worker(name) for name in "abcd"))
+        assert order == list("abcd")
+        assert limiter.running == 0
+    run(scenario())
+
+
+def test_blocking_acquire_ignores_queue_limit():
+    async def scenario():
+        limiter = AdmissionLimiter("render", 1, 0, 0.01)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire(block=True))
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+        limiter.release()
+        await waiter
+    run(scenario())
+
+
+def test_cancelled_waiter_frees_its_place():
+    async def scenario():
+        limiter = AdmissionLimiter("render", 1, 4, 1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        assert (limiter.running, limiter.stats()["waiting"]) == (0, 0)
+    run(scenario())
@@ -0,0 +1,46 @@
+"""덱 출력 버퍼와 산출물 파일"""
+import os
+
+import pytest
+
+from backend import artifacts
+from backend.artifacts import DeckOutput, own_output, spool_output
+
+
+@pytest.fixture(autouse=True)
+def artifact_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "ARTIFACT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_spool_output_rolls_over_to_file(monkeypatch):
+    monkeypatch.setattr(artifacts, "DECK_SPOOL_BYTES", 10)
+    small = spool_output(lambda stream: stream.write(b"tiny"))
+    assert (small.data, small.path) == (b"tiny", None)
+
+    large = spool_output(lambda stream: stream.write(b"x" * 100))
+    assert large.data is None and large.temporary
+    with open(large.path, "rb") as f:
+        assert f.read() == b"x" * 100
+
+
+def test_own_output_writes_bytes_to_file():
+    owned = own_output(DeckOutput(b"deck", None, 4))
+    assert owned.data is None and owned.temporary
+    with open(owned.path, "rb") as f:
+        assert f.read() == b"deck"
+
+
+def test_own_output_survives_removal_of_shared_file(tmp_path):
+    shared = tmp_path / "cached.pptx"
+    shared.write_bytes(b"cached deck")
+    owned = own_output(DeckOutput(None, str(shared), 11))
+    assert owned.path != str(shared)
+    shared.unlink()
+    with open(owned.path, "rb") as f:
+        assert f.read() == b"cached deck"
+
+
+def test_own_output_keeps_private_file(tmp_path):
+    output = DeckOutput(None, str(tmp_path / "job.pptx"), 0, temporary=True)
+    assert own_output(output) is output
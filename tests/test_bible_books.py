@@ -0,0 +1,61 @@
+"""책 이름 해석 (resolve_book / fuzzy_resolve_book)"""
+import pytest
+
+from backend.bible_books import ENGLISH, GERMAN, KOREAN, fuzzy_resolve_book, resolve_book
+
+
+@pytest.mark.parametrize("name, number, language", [
+    ("요", 43, KOREAN),
+    ("요한복음", 43, KOREAN),
+    ("John", 43, ENGLISH),
+    ("1. Mose", 1, GERMAN),
+    ("1Mo", 1, GERMAN),
+    ("Offenbarung", 66, GERMAN),
+])
+def test_resolve_book(name, number, language):
+    match = resolve_book(name)
+    assert (match.number, match.language) == (number, language)
+
+
+def test_resolve_book_language_hint():
+    assert resolve_book("Joh").language == ENGLISH
+    assert resolve_book("Joh", "german") == (43, GERMAN)
+    assert resolve_book("Joh", "de") == (43, GERMAN)
+
+
+def test_resolve_book_unknown():
+    assert resolve_book("xyz") is None
+
+
+@pytest.mark.parametrize("name, number", [
+    ("요한북음", 43),
+    ("요한게시록", 66),
+    ("시펀", 19),
+    ("Genisis", 1),
+    ("Mathew", 40),
+    ("Johanes", 43),
+])
+def test_fuzzy_resolve_book_typos(name, number):
+    match = fuzzy_resolve_book(name)
+    assert match.number == number
+    assert 0.6 <= match.confidence < 1.0
+
+
+def test_fuzzy_resolve_book_unique_prefix():
+    match = fuzzy_resolve_book("고린도전")
+    assert match.number == 46
+    assert match.alias == "고린도전서"
+
+
+def test_fuzzy_resolve_book_exact_match():
+    assert fuzzy_resolve_book("로마서").confidence == 1.0
+
+
+@pytest.mark.parametrize("name", ["열왕기", "고린도", "사무엘"])
+def test_fuzzy_resolve_book_ambiguous_prefix(name):
+    assert fuzzy_resolve_book(name) is None
+
+
+@pytest.mark.parametrize("name", ["곡", "Mars", "Römr"])
+def test_fuzzy_resolve_book_short_names_are_not_guessed(name):
+    assert fuzzy_resolve_book(name) is None
@@ -0,0 +1,57 @@
+"""성경 본문 로더 (BibleLoader)"""
+import time
+import threading
+
+import pytest
+
+from backend import bible_loader
+from backend.bible_loader import BibleLoader
+from backend.verse_index import VerseIndex
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    monkeypatch.setattr(bible_loader, "get_reference_pack", lambda: None)
+    book = tmp_path / "43_요한복음"
+    book.mkdir()
+    (book / "요 3.md").write_text(
+        "###### 16\n하나님이 세상을 이처럼 사랑하사\n###### 17\n하나님이 그 아들을 세상에 보내신 것은\n",
+        encoding="utf-8")
+    return BibleLoader(str(tmp_path))
+
+
+def test_load_passages(loader):
+    passages = loader.load_passages("요3:16-17")
+    assert passages[0]["text"] == "16 하나님이 세상을 이처럼 사랑하사 17 하나님이 그 아들을 세상에 보내신 것은"
+    assert loader.load_passages("요3:99")[0]["text"] is None
+
+
+def test_concurrent_load_passages_read_once(loader, monkeypatch):
+    read_span = VerseIndex.read_span
+    reads = []
+    release = threading.Event()
+
+    def counting_read_span(index, *args):
+        reads.append(args)
+        release.wait(5)
+        return read_span(index, *args)
+
+    monkeypatch.setattr(VerseIndex, "read_span", counting_read_span)
+    flight = bible_loader._chapter_flight
+    shared_before = flight.shared
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(loader.load_passages("요3:16")))
+               for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while flight.shared - shared_before < 3 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(reads) == 1
+    assert [passages[0]["text"] for passages in results] == [results[0][0]["text"]] * 4
+    assert results[0][0]["text"] == "16 하나님이 세상을 이처럼 사랑하사"
@@ -0,0 +1,85 @@
+"""성경 참조 파서 (parse_bible_references / parse_bible_reference)"""
+import pytest
+
+from backend.bible_parser import parse_bible_reference, parse_bible_references
+
+
+def spans(reference, language=None):
+    return [
+        (s["book_id"], s["chapter"], s["verse_start"], s["chapter_end"], s["verse_end"])
+        for s in parse_bible_references(reference, language)
+    ]
+
+
+def test_single_verse():
+    assert spans("요3:16") == [(43, 3, 16, 3, 16)]
+
+
+def test_comma_and_semicolon():
+    assert spans("요3:16,18; 롬8:28-30") == [
+        (43, 3, 16, 3, 16),
+        (43, 3, 18, 3, 18),
+        (45, 8, 28, 8, 30),
+    ]
+
+
+def test_semicolon_reuses_previous_book():
+    assert spans("롬8:28, 9:1-3; 12") == [
+        (45, 8, 28, 8, 28),
+        (45, 9, 1, 9, 3),
+        (45, 12, None, 12, None),
+    ]
+
+
+def test_cross_chapter_range():
+    assert spans("창1:26-2:3") == [(1, 1, 26, 2, 3)]
+
+
+def test_chapter_range_and_whole_book():
+    assert spans("시1-3") == [(19, 1, None, 3, None)]
+    assert spans("창") == [(1, 1, None, None, None)]
+
+
+def test_english_and_german_books():
+    assert spans("John 3:16; 1 Cor 13:4-7") == [(43, 3, 16, 3, 16), (46, 13, 4, 13, 7)]
+    assert spans("1. Mose 1:1") == [(1, 1, 1, 1, 1)]
+
+
+def test_formatted_uses_resolved_language():
+    assert parse_bible_references("Joh 3:16")[0]["formatted"] == "John 3:16"
+    assert parse_bible_references("Joh 3:16", "german")[0]["formatted"] == "Johannes 3:16"
+
+
+@pytest.mark.parametrize("reference", ["", "요3:16-3:2"])
+def test_invalid_references_raise(reference):
+    with pytest.raises(ValueError):
+        parse_bible_references(reference)
+
+
+def test_results_are_fresh_dicts():
+    first = parse_bible_references("요3:16")
+    first[0]["chapter"] = 99
+    assert parse_bible_references("요3:16")[0]["chapter"] == 3
+
+
+def test_parse_bible_reference():
+    parsed = parse_bible_reference("마5:13")
+    assert parsed["book_id"] == 40
+    assert parsed["book_abbrev"] == "마"
+    assert parsed["chapter"] == 5
+    assert parsed["verses"] == "13"
+    assert parsed["confidence"] == 1.0
+
+
+def test_parse_bible_reference_corrects_typo():
+    parsed = parse_bible_reference("요한북음 3:16")
+    assert parsed["book_id"] == 43
+    assert parsed["book"] == "요한복음"
+    assert 0.6 <= parsed["confidence"] < 1.0
+
+
+@pytest.mark.parametrize("reference", ["열왕기 3:1", "곡 3", "Mars 3:1"])
+def test_parse_bible_reference_does_not_guess_book(reference):
+    parsed = parse_bible_reference(reference)
+    assert parsed["book_id"] is None
+    assert parsed["confidence"] == 0.0
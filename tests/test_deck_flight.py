@@ -0,0 +1,96 @@
+"""같은 덱의 동시 생성 합치기 (cached_presentation_output)"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from backend import main
+from backend.admission import AdmissionLimiter, AdmissionRejected
+from backend.artifacts import DeckOutput
+
+
+class _Usage:
+    def record(self, hymn_number):
+        pass
+
+
+class _DeckCache:
+    def get(self, key):
+        return None
+
+    def put(self, key, output):
+        return output
+
+
+@pytest.fixture
+def deck(monkeypatch):
+    """구역 두 개짜리 덱을 그리는 가짜 생성기 (진행 상황 보고 포함)"""
+    state = SimpleNamespace(limiter=AdmissionLimiter("render", 1, 4, 0.1), sessions={}, builds=[], listeners=0)
+
+    async def build_sectioned_output(request, section_keys, session_id=None, progress=None):
+        state.builds.append(session_id)
+        # 진행 상황을 받을 요청이 모두 합류할 때까지 (state.listeners개)
+        while len(main._deck_progress.get("deck", ())) < state.listeners:
+            await asyncio.sleep(0.001)
+        if progress is not None:
+            progress("render", slides_done=1, slides_total=2)
+        await asyncio.sleep(0.01)
+        return DeckOutput(b"deck", None, 4), {key: [("slide", "rels")] for key in section_keys}
+
+    monkeypatch.setattr(main, "build_sectioned_output", build_sectioned_output)
+    monkeypatch.setattr(main, "layout_presentation", lambda request: {"slide_count": 2, "slides": []})
+    monkeypatch.setattr(main, "get_deck_cache", lambda: _DeckCache())
+    monkeypatch.setattr(main, "get_hymn_usage", lambda: _Usage())
+    monkeypatch.setattr(main, "get_render_limiter", lambda: state.limiter)
+    monkeypatch.setattr(main.get_edit_sessions(), "put", lambda key, value: state.sessions.__setitem__(key, value))
+    return state
+
+
+async def start_leader(coroutine) -> asyncio.Task:
+    """덱 생성을 시작한 요청이 될 태스크 (생성이 진행 중이 될 때까지 기다림)"""
+    task = asyncio.create_task(coroutine)
+    while not main._deck_flight.running("deck"):
+        await asyncio.sleep(0.001)
+    return task
+
+
+def test_waiter_shares_progress_and_keeps_own_session(deck):
+    deck.listeners = 2
+    leader_events, waiter_events = [], []
+
+    async def scenario():
+        request = main.PresentationRequest()
+        leader = await start_leader(main.cached_presentation_output(
+            request, "deck", ["a", "b"], "leader", progress=lambda stage, **details: leader_events.append(stage)))
+        waiter = main.cached_presentation_output(
+            request, "deck", ["a", "b"], "waiter", progress=lambda stage, **details: waiter_events.append(stage))
+        return await asyncio.gather(leader, waiter)
+
+    results = asyncio.run(scenario())
+    assert [output.data for output in results] == [b"deck", b"deck"]
+    assert deck.builds == ["leader"]
+    assert leader_events == ["render"]
+    assert waiter_events == ["render", "assemble"]
+    assert set(deck.sessions) == {"leader", "waiter"}
+    assert not main._deck_progress
+
+
+def test_blocking_waiter_retries_after_leader_rejected(deck):
+    limiter = deck.limiter
+
+    async def scenario():
+        request = main.PresentationRequest()
+        await limiter.acquire()
+        leader = await start_leader(main.cached_presentation_output(request, "deck", ["a"]))
+        waiter = asyncio.create_task(main.cached_presentation_output(request, "deck", ["a"], "job", block=True))
+        with pytest.raises(AdmissionRejected) as rejected:
+            await leader
+        assert rejected.value.status_code == 503
+        assert not waiter.done()
+        limiter.release()
+        return await waiter
+
+    output = asyncio.run(scenario())
+    assert output.data == b"deck"
+    assert deck.builds == ["job"]
+    assert "job" in deck.sessions
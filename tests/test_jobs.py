@@ -0,0 +1,96 @@
+"""덱 생성 작업 큐 (JobQueue)"""
+import asyncio
+
+from backend.artifacts import DeckOutput
+from backend.jobs import CANCELLED, DONE, FAILED, QUEUED, JobQueue
+
+
+async def build_deck(payload, report):
+    report("render", slides_done=1)
+    if payload == "fail":
+        raise RuntimeError("broken")
+    if payload == "slow":
+        await asyncio.sleep(10)
+    return DeckOutput(payload.encode(), None, len(payload))
+
+
+async def wait_finished(job):
+    while not job.finished:
+        await job.wait_changed(1)
+
+
+def test_job_runs_to_completion():
+    async def scenario():
+        queue = JobQueue(build_deck, workers=1)
+        queue.start()
+        job = queue.submit("deck", "deck.pptx")
+        await wait_finished(job)
+        assert job.status == DONE
+        assert queue.describe(job)["size"] == 4
+        failed = queue.submit("fail", "fail.pptx")
+        await wait_finished(failed)
+        assert failed.status == FAILED
+        assert "broken" in failed.error
+        queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_finished_jobs_expire_after_ttl():
+    async def scenario():
+        queue = JobQueue(build_deck, workers=1, ttl_seconds=60)
+        queue.start()
+        job = queue.submit("deck", "deck.pptx")
+        await wait_finished(job)
+        queue._expire(now=job.finished_at + 30)
+        assert queue.get(job.job_id) is job
+        queue._expire(now=job.finished_at + 61)
+        assert job.job_id not in queue._jobs
+        assert job.output is None
+        queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_submit_rejected_when_queue_full():
+    async def scenario():
+        # 작업자를 시작하지 않아 모든 작업이 대기 상태로 남음
+        queue = JobQueue(build_deck, workers=1, max_queued=2)
+        assert queue.submit("a", "a.pptx") is not None
+        assert queue.submit("b", "b.pptx") is not None
+        assert queue.submit("c", "c.pptx") is None
+        assert queue.stats()["rejected"] == 1
+
+    asyncio.run(scenario())
+
+
+def test_oldest_finished_job_makes_room():
+    async def scenario():
+        queue = JobQueue(build_deck, workers=1, max_jobs=1)
+        queue.start()
+        first = queue.submit("a", "a.pptx")
+        await wait_finished(first)
+        second = queue.submit("b", "b.pptx")
+        assert second is not None
+        assert queue.get(first.job_id) is None
+        queue.stop()
+
+    asyncio.run(scenario())
+
+
+def test_cancel_queued_and_running_jobs():
+    async def scenario():
+        queue = JobQueue(build_deck, workers=1)
+        queue.start()
+        running = queue.submit("slow", "slow.pptx")
+        queued = queue.submit("deck", "deck.pptx")
+        while running.status == QUEUED:
+            await running.wait_changed(1)
+        queue.cancel(queued.job_id)
+        assert queued.status == CANCELLED
+        queue.cancel(running.job_id)
+        await wait_finished(running)
+        assert running.status == CANCELLED
+        queue.stop()
+
+    asyncio.run(scenario())
@@ -0,0 +1,54 @@
+"""프로세스 전체 캐시 메모리 예산 (MemoryBudget)"""
+import time
+
+import pytest
+
+from backend.cache import LRUCache
+from backend.memory_budget import get_memory_budget
+
+
+@pytest.fixture
+def budget(monkeypatch):
+    budget = get_memory_budget()
+    monkeypatch.setattr(budget, "max_bytes", 1000)
+    return budget
+
+
+def test_caches_register_on_creation(budget):
+    cache = LRUCache("registered", 800, sizeof=len)
+    assert "registered" in [entry["name"] for entry in budget.stats()["caches"]]
+    del cache
+
+
+def test_enforce_evicts_across_caches(budget):
+    cheap = LRUCache("cheap", 800, sizeof=len)
+    costly = LRUCache("costly", 800, sizeof=len, weight=4.0)
+    cheap.put(1, b"x" * 300)
+    costly.put(1, b"x" * 300)
+    costly.put(2, b"x" * 300)
+
+    # 전체 1200 > 1000: 크기와 사용 시각이 비슷하면 가중치가 낮은 캐시의 항목부터
+    cheap.put(2, b"x" * 300)
+    assert len(cheap) + len(costly) == 3
+    assert cheap.current_bytes + costly.current_bytes <= budget.max_bytes
+    assert cheap.get(1) is None
+    assert costly.get(1) is not None
+
+
+def test_idle_entries_are_evicted_first(budget):
+    first = LRUCache("first", 800, sizeof=len)
+    second = LRUCache("second", 800, sizeof=len)
+    first.put("old", b"x" * 400)
+    second.put("recent", b"x" * 400)
+    time.sleep(0.05)
+    second.get("recent")
+    first.put("new", b"x" * 400)
+    assert first.get("old") is None
+    assert second.get("recent") is not None
+
+
+def test_zero_ceiling_disables_budget(budget, monkeypatch):
+    monkeypatch.setattr(budget, "max_bytes", 0)
+    cache = LRUCache("unbounded", 5000, sizeof=len)
+    cache.put(1, b"x" * 3000)
+    assert len(cache) == 1
@@ -0,0 +1,57 @@
+"""원고 구절 추출 (ReferenceExtractor.extract)"""
+import pytest
+
+from backend.reference_extractor import get_reference_extractor
+
+
+@pytest.fixture(scope="module")
+def extract():
+    return get_reference_extractor().extract
+
+
+def formatted(matches):
+    return [m["formatted"] for m in matches]
+
+
+def test_extracts_korean_notations(extract):
+    matches = extract("오늘 본문은 요 3:16 입니다.\n로마서 8장 28절과 시편 23편을 봅니다.")
+    assert formatted(matches) == ["요한복음 3:16", "로마서 8:28", "시편 23"]
+    assert [m["line"] for m in matches] == [1, 2, 2]
+    assert matches[1]["text"] == "로마서 8장 28절"
+
+
+def test_positions_point_into_text(extract):
+    text = "본문: John 3:16, 1 Cor 13:4-7"
+    matches = extract(text)
+    assert formatted(matches) == ["John 3:16", "1 Corinthians 13:4-7"]
+    for match in matches:
+        assert text[match["start"]:match["end"]] == match["text"]
+
+
+@pytest.mark.parametrize("text", [
+    "이사 3:1 은 구절이 아님",   # 단어 중간의 "사"
+    "am 3:00 에 모임",          # 소문자로 시작하는 영어 단어
+    "사 3 도 아님",             # 장만 있는 한 글자 약어
+    "요한 2명이 왔다",          # 장 뒤에 글자가 붙음
+])
+def test_rejects_false_positives(extract, text):
+    assert extract(text) == []
+
+
+def test_language_hint(extract):
+    assert extract("Joh 3:16", "german")[0]["language"] == "german"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Joh 3,16", "John 3:16"),
+    ("Röm 8,28", "Römer 8:28"),
+    ("Joh 3,16-18", "John 3:16-18"),
+])
+def test_comma_verse_notation(extract, text, expected):
+    assert formatted(extract(text)) == [expected]
+
+
+def test_short_alias_with_psalm_suffix(extract):
+    matches = extract("오늘은 시 23편을 읽습니다")
+    assert formatted(matches) == ["시편 23"]
+    assert matches[0]["text"] == "시 23편"
@@ -0,0 +1,91 @@
+"""동시 요청 합치기 (SingleFlight / AsyncSingleFlight)"""
+import asyncio
+import threading
+
+import pytest
+
+from backend.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight("test")
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def work(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value * 2
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do_shared("key", work, 21)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(flight.do_shared("key", work, 21)))
+                 for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    while flight.shared < 3:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == [21]
+    assert sorted(results) == [(42, True)] * 4
+    assert flight.stats() == {"name": "test", "executed": 1, "shared": 3, "in_flight": 0}
+
+
+def test_sequential_calls_run_again():
+    flight = SingleFlight("test")
+    assert flight.do_shared("key", lambda: 1) == (1, False)
+    assert flight.do_shared("key", lambda: 2) == (2, False)
+
+
+def test_exception_reaches_every_caller():
+    flight = SingleFlight("test")
+
+    def fail():
+        raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        flight.do("key", fail)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_async_flight_shares_task():
+    async def scenario():
+        flight = AsyncSingleFlight("test")
+        calls = []
+
+        async def build():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "deck"
+
+        results = await asyncio.gather(*(flight.run("key", build) for _ in range(3)))
+        assert calls == [1]
+        assert results == [("deck", True)] * 3
+        assert await flight.run("key", build) == ("deck", False)
+
+    asyncio.run(scenario())
+
+
+def test_async_flight_survives_leader_cancellation():
+    async def scenario():
+        flight = AsyncSingleFlight("test")
+
+        async def build():
+            await asyncio.sleep(0.02)
+            return "deck"
+
+        leader = asyncio.create_task(flight.run("key", build))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.run("key", build))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == ("deck", True)
+
+    asyncio.run(scenario())